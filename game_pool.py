@@ -0,0 +1,175 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+from registry import discover, load_game_class
+
+# Modules a warm worker imports before it is handed a game
+WARM_MODULES = ["tkinter", "tkinter.messagebox", "tkinter.ttk", "PIL.Image", "PIL.ImageTk"]
+
+class WorkerPool:
+    def __init__(self, command, size=2, min_free_mb=512, check_interval=5.0):
+        # command starts a worker process, see run_worker for the protocol
+        self.command = command
+        self.size = size
+        self.min_free_mb = min_free_mb
+        self.check_interval = check_interval
+
+        self.idle = []
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.closed = False
+
+        # Background thread that keeps the pool topped up
+        self.thread = threading.Thread(target=self.maintain, daemon=True)
+        self.thread.start()
+
+    def maintain(self):
+        while not self.closed:
+            if memory_is_tight(self.min_free_mb):
+                # Give the memory back rather than holding warm interpreters
+                self.release_idle()
+            else:
+                while not self.closed and self.idle_count() < self.size:
+                    worker = self.spawn_worker()
+                    if worker is None:
+                        break
+                    with self.lock:
+                        if self.closed:
+                            worker.kill()
+                            break
+                        self.idle.append(worker)
+            self.wakeup.wait(self.check_interval)
+            self.wakeup.clear()
+
+    def spawn_worker(self):
+        try:
+            worker = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True
+            )
+        except OSError:
+            return None
+
+        # The worker prints a single line once its imports are done
+        if worker.stdout.readline().strip() != "ready":
+            worker.kill()
+            worker.wait()
+            return None
+        return worker
+
+    def idle_count(self):
+        with self.lock:
+            return len(self.idle)
+
+    def take(self):
+        # Hand out a warm worker, skipping any that died while waiting
+        with self.lock:
+            while self.idle:
+                worker = self.idle.pop()
+                if worker.poll() is None:
+                    return worker
+        return None
+
+    def launch(self, game_name, probe=False):
+        # Start a game on a warm worker, None if none is ready yet
+        worker = self.take()
+        if worker is None:
+            self.wakeup.set()
+            return None
+
+        command = "probe" if probe else "run"
+        try:
+            worker.stdin.write(f"{command} {game_name}\n")
+            worker.stdin.flush()
+        except OSError:
+            # The worker exited after take(), the caller starts a cold one
+            self.discard(worker)
+            self.wakeup.set()
+            return None
+        worker.stdin.close()
+        if not probe:
+            worker.stdout.close()
+
+        # Refill in the background
+        self.wakeup.set()
+        return worker
+
+    def discard(self, worker):
+        worker.kill()
+        worker.wait()
+        for pipe in (worker.stdin, worker.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def release_idle(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for worker in idle:
+            worker.stdin.close()
+            worker.stdout.close()
+            worker.wait()
+
+    def shutdown(self):
+        self.closed = True
+        self.wakeup.set()
+        self.release_idle()
+
+def available_memory_mb():
+    # MemAvailable from the kernel, None where it is not exposed
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+def memory_is_tight(min_free_mb):
+    available = available_memory_mb()
+    return available is not None and available < min_free_mb
+
+def run_worker(report_memory):
+    # Import everything a game could need, then wait to be told which one
+    for module_name in WARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+    games = discover()
+    for game_info in games.values():
+        try:
+            load_game_class(game_info)
+        except Exception:
+            # A broken game only affects its own launch, not the pool
+            pass
+
+    print("ready", flush=True)
+    request = sys.stdin.readline().split(maxsplit=1)
+    if len(request) != 2:
+        # The launcher released this worker without using it
+        return
+    command, game_name = request[0], request[1].strip()
+    if command == "run":
+        # The launcher has closed its end of stdout, so a print from the
+        # game would fail with EPIPE. Send output to the null device instead
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+
+    import tkinter as tk
+    root = tk.Tk()
+    game = load_game_class(games[game_name])(root)
+    if command == "probe":
+        root.update()
+        print(json.dumps({"rss_kb": report_memory()}), flush=True)
+        root.destroy()
+        return
+    root.mainloop()
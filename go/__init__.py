@@ -0,0 +1,5 @@
+# Launcher metadata, read by registry.py without importing the package
+GAME_TITLE = "Go Game"
+GAME_MODULE = "go"
+GAME_CLASS = "GomokuGame"
+GAME_THUMBNAIL = "thumbnail.png"
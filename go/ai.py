@@ -0,0 +1,238 @@
+import threading
+import time
+
+try:
+    from .engine import FIVE, FOUR, OPEN_FOUR, bits, unpack
+    from .threats import find_win
+except ImportError:
+    from engine import FIVE, FOUR, OPEN_FOUR, bits, unpack
+    from threats import find_win
+
+# Computer opponent: a threat-space search for a forced win first, then
+# iterative-deepening negamax with alpha-beta, a Zobrist-keyed
+# transposition table and threat-ordered candidate moves near the
+# existing stones.
+
+WIN = 1000000
+
+# Pattern weights for evaluation and move ordering, indexed like unpack()
+WEIGHTS = (100000, 1500, 20000, 400, 300, 30)
+
+# Candidate moves kept per node after ordering
+MAX_MOVES = 12
+
+# Nodes between two looks at the clock
+TIME_CHECK_NODES = 256
+
+# Share of the budget the forced-win search may use
+THREAT_SHARE = 0.25
+
+# Transposition table bounds
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+class SearchTimeout(Exception):
+    pass
+
+class TranspositionTable:
+    # hash -> (depth, score, bound, move), at most max_entries of them. A
+    # dict keeps insertion order, so the oldest entries go first
+    def __init__(self, max_entries=200000):
+        self.max_entries = max_entries
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, entry):
+        entries = self.entries
+        if key in entries:
+            del entries[key]
+        elif len(entries) >= self.max_entries:
+            del entries[next(iter(entries))]
+        entries[key] = entry
+
+    def clear(self):
+        self.entries.clear()
+
+class SearchResult:
+    def __init__(self, move, score, depth, nodes, elapsed, line=None):
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.elapsed = elapsed
+        # Forced winning line when the threat search found one
+        self.line = line
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+def value(fields, weights=WEIGHTS):
+    return sum(weight * count for weight, count in zip(weights, fields))
+
+def evaluate(board, weights=WEIGHTS):
+    # Score for the side to move
+    me = board.to_move
+    return score_counts(unpack(board.counts[me]), unpack(board.counts[me ^ 1]), weights)
+
+def score_counts(mine, theirs, weights=WEIGHTS):
+    # Pattern counts of the side to move and of the opponent -> score
+    if mine[FOUR]:
+        # Five on the next move
+        return WIN // 2
+    if theirs[OPEN_FOUR] or theirs[FOUR] > 1:
+        # More fives threatened than one move can stop
+        return -WIN // 2
+    return value(mine, weights) - value(theirs, weights)
+
+def ordered_moves(board, limit=MAX_MOVES, first=None, weights=WEIGHTS):
+    # Empty cells near stones, best threats first: what a stone there does
+    # for us plus what it takes away from the opponent
+    me = board.to_move
+    occupied = board.occupied()
+    if not occupied:
+        center = board.cell(board.size // 2, board.size // 2)
+        return [center]
+
+    # Ties go to the cell nearer the center
+    middle = board.size // 2
+    scored = []
+    for cell in bits(board.neighborhood(2)):
+        mine = unpack(board.move_gain(cell, me))
+        theirs = unpack(board.move_gain(cell, me ^ 1))
+        if mine[FIVE]:
+            return [cell]
+        row, col = board.coords(cell)
+        scored.append((value(mine, weights) + value(theirs, weights), -max(abs(row - middle), abs(col - middle)), cell, theirs[FIVE]))
+    scored.sort(reverse=True)
+
+    # An opponent four has to be blocked, nothing else matters
+    blocks = [cell for score, centrality, cell, five in scored if five]
+    if blocks:
+        return blocks
+    moves = [cell for score, centrality, cell, five in scored[:limit]]
+    if first is not None and first in moves:
+        moves.remove(first)
+        moves.insert(0, first)
+    return moves
+
+class Searcher:
+    def __init__(self, board, budget_ms=500, table=None, max_depth=20, max_moves=MAX_MOVES, threats=True,
+                 weights=WEIGHTS):
+        self.board = board
+        self.budget = budget_ms / 1000
+        self.table = table if table is not None else TranspositionTable()
+        self.max_depth = max_depth
+        self.max_moves = max_moves
+        self.threats = threats
+        self.weights = weights
+        self.nodes = 0
+        self.deadline = None
+        # Set from another thread to abandon the search early
+        self.stopped = threading.Event()
+
+    def stop(self):
+        self.stopped.set()
+
+    def evaluate(self, board):
+        return evaluate(board, self.weights)
+
+    def search(self):
+        # A forced win ends the search at once. Otherwise deepen until the
+        # budget runs out; the answer is the best move of the last depth
+        # that finished
+        start = time.perf_counter()
+        self.nodes = 0
+        if self.threats and self.board.occupied():
+            line, nodes = find_win(self.board, deadline=start + self.budget * THREAT_SHARE, stopped=self.stopped)
+            self.nodes += nodes
+            if line:
+                return SearchResult(line[0], WIN, len(line), self.nodes, time.perf_counter() - start, line)
+
+        self.deadline = start + self.budget
+        moves = ordered_moves(self.board, self.max_moves, weights=self.weights)
+        best_move, best_score, depth_done = moves[0], 0, 0
+        if len(moves) > 1 and not self.stopped.is_set():
+            for depth in range(1, self.max_depth + 1):
+                try:
+                    best_move, best_score = self.search_root(moves, depth, best_move)
+                except SearchTimeout:
+                    break
+                depth_done = depth
+                if abs(best_score) >= WIN // 2:
+                    break
+        return SearchResult(best_move, best_score, depth_done, self.nodes, time.perf_counter() - start)
+
+    def search_root(self, moves, depth, first):
+        board = self.board
+        moves = [first] + [move for move in moves if move != first]
+        alpha, beta = -WIN - 1, WIN + 1
+        best_move = first
+        for move in moves:
+            board.play(move)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha, 1)
+            finally:
+                board.undo()
+            if score > alpha:
+                alpha, best_move = score, move
+        self.table.put(board.hash, (depth, alpha, EXACT, best_move))
+        return best_move, alpha
+
+    def negamax(self, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.nodes % TIME_CHECK_NODES == 0 and (time.perf_counter() > self.deadline
+                                                   or self.stopped.is_set()):
+            raise SearchTimeout()
+
+        board = self.board
+        if board.winner is not None:
+            # The previous move made five
+            return -WIN + ply
+        if board.full():
+            return 0
+        if depth == 0:
+            return self.evaluate(board)
+
+        entry = self.table.get(board.hash)
+        tt_move = None
+        if entry is not None:
+            entry_depth, score, bound, tt_move = entry
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return score
+                if bound == LOWER and score >= beta:
+                    return score
+                if bound == UPPER and score <= alpha:
+                    return score
+
+        original_alpha = alpha
+        best_score, best_move = -WIN - 1, None
+        for move in ordered_moves(board, self.max_moves, tt_move, self.weights):
+            board.play(move)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                board.undo()
+            if score > best_score:
+                best_score, best_move = score, move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table.put(board.hash, (depth, best_score, bound, best_move))
+        return best_score
+
+def best_move(board, budget_ms=500, table=None):
+    # Search a copy so the caller's board is never touched
+    return Searcher(board.copy(), budget_ms, table).search()
@@ -0,0 +1,258 @@
+import argparse
+import random
+import time
+import tkinter as tk
+
+try:
+    from .ai import WIN, Searcher, TranspositionTable, ordered_moves, score_counts
+    from .engine import DIRECTIONS, Board, PATTERN_NAMES, random_position, unpack, window_counts
+    from .go import GomokuGame
+    from .record import GameRecord
+    from .threats import find_win
+except ImportError:
+    from ai import WIN, Searcher, TranspositionTable, ordered_moves, score_counts
+    from engine import DIRECTIONS, Board, PATTERN_NAMES, random_position, unpack, window_counts
+    from go import GomokuGame
+    from record import GameRecord
+    from threats import find_win
+
+def bench_updates(size=15, games=400, moves=100, seed=1):
+    # play/undo pairs per second over random move sequences, no display
+    rng = random.Random(seed)
+    board = Board(size)
+    sequences = []
+    for _ in range(games):
+        cells = list(board.geometry.cells)
+        rng.shuffle(cells)
+        sequences.append(cells[:moves])
+
+    pairs = games * moves
+    print(f"{size}x{size} board, {pairs:,} moves played and taken back")
+    # The second pass runs with the interpreter warmed up
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        for cells in sequences:
+            for cell in cells:
+                board.play(cell)
+            for _ in cells:
+                board.undo()
+        elapsed = time.perf_counter() - start
+        print(f"  {label}  {pairs / elapsed:12,.0f} play+undo pairs/s   {2 * pairs / elapsed:12,.0f} position updates/s")
+
+    # Pattern counts of a sample position, to see the tables at work
+    position = random_position(size, moves // 2, rng)
+    for player, name in enumerate(("black", "white")):
+        counts = ", ".join(f"{pattern} {count}" for pattern, count in zip(PATTERN_NAMES, position.pattern_counts(player)))
+        print(f"  {name}: {counts}")
+
+def search_positions(size, count, stones, seed):
+    # Fixed random middle-game positions nobody has won yet
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = random_position(size, stones, rng)
+        if board.winner is None:
+            positions.append(board)
+    return positions
+
+def bench_search(size=15, positions=10, budget_ms=500, stones=12, seed=2):
+    # Depth reached and nodes/s of the computer opponent per position
+    print(f"{size}x{size} board, {positions} positions of {stones} stones, {budget_ms} ms each")
+    total_nodes = total_time = 0
+    depths = []
+    for i, board in enumerate(search_positions(size, positions, stones, seed)):
+        result = Searcher(board, budget_ms, TranspositionTable()).search()
+        total_nodes += result.nodes
+        total_time += result.elapsed
+        depths.append(result.depth)
+        row, col = board.coords(result.move)
+        print(f"  #{i:<3} depth {result.depth:2}  {result.nodes:8,} nodes  {result.nodes_per_second:10,.0f} nodes/s"
+              f"   move ({row}, {col})  score {result.score}")
+    print(f"  overall  {total_nodes / total_time:,.0f} nodes/s, mean depth {sum(depths) / len(depths):.1f}")
+
+def board_lines(board):
+    # Cells of every line in the four directions
+    geometry = board.geometry
+    lines = []
+    for dr, dc in DIRECTIONS:
+        for row, col in geometry.line_starts(dr, dc):
+            cells = []
+            while 0 <= row < board.size and 0 <= col < board.size:
+                cells.append(board.cell(row, col))
+                row += dr
+                col += dc
+            lines.append(cells)
+    return lines
+
+def scan_counts(board, player, lines):
+    # Pattern counts the slow way: every 5 and 6 cell window of every line,
+    # with a blocked cell past each end like the engine's walls
+    counts = 0
+    for cells in lines:
+        digits = [2]
+        for cell in cells:
+            stone = board.stone_at(cell)
+            digits.append(0 if stone is None else 1 if stone == player else 2)
+        digits.append(2)
+        for length in (5, 6):
+            for start in range(len(digits) - length + 1):
+                counts += window_counts(digits[start:start + length])
+    return counts
+
+class LoopSearcher(Searcher):
+    # The same search with a loop-based evaluator in place of the tables
+    def __init__(self, *args, **kwargs):
+        Searcher.__init__(self, *args, **kwargs)
+        self.lines = board_lines(self.board)
+
+    def evaluate(self, board):
+        me = board.to_move
+        return score_counts(unpack(scan_counts(board, me, self.lines)), unpack(scan_counts(board, me ^ 1, self.lines)),
+                            self.weights)
+
+def threat_positions(size=15, games=30, seed=3, back=(5, 7, 9)):
+    # Positions a few moves before the end of seeded self-play games, with
+    # the eventual winner to move. The players take one of their three best
+    # ordered moves, so the set is the same on every run
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(games):
+        board = Board(size)
+        while board.winner is None and not board.full():
+            board.play(rng.choice(ordered_moves(board, 3)))
+        moves = [cell for cell, black_counts, white_counts in board.history]
+        for plies in back:
+            if len(moves) > plies:
+                position = Board(size)
+                for cell in moves[:-plies]:
+                    position.play(cell)
+                positions.append(position)
+    return positions
+
+def bench_threats(size=15, depth=3, budget_ms=2000):
+    positions = threat_positions(size)
+    print(f"{size}x{size} board, {len(positions)} positions from seeded self-play")
+
+    # Evaluation: table counts kept up to date by play() against a full scan
+    lines = board_lines(positions[0])
+    start = time.perf_counter()
+    for board in positions:
+        for player in (0, 1):
+            assert scan_counts(board, player, lines) == board.counts[player]
+    scan = (time.perf_counter() - start) / (2 * len(positions))
+    start = time.perf_counter()
+    for board in positions:
+        for cell in board.empty_cells():
+            board.play(cell)
+            board.undo()
+    plays = sum(len(board.empty_cells()) for board in positions)
+    table = (time.perf_counter() - start) / plays
+    print(f"  evaluation   scan {scan * 1e6:9.1f} us   table (play+undo) {table * 1e6:7.1f} us   {scan / table:6.0f}x")
+
+    # Fixed-depth alpha-beta with either evaluator
+    timings = []
+    for searcher in (LoopSearcher, Searcher):
+        start = time.perf_counter()
+        for board in positions[:10]:
+            searcher(board.copy(), 10 ** 6, TranspositionTable(), max_depth=depth, threats=False).search()
+        timings.append(time.perf_counter() - start)
+    print(f"  depth {depth} search on 10 positions   loop evaluator {timings[0]:6.2f} s   "
+          f"tables {timings[1]:6.2f} s   {timings[0] / timings[1]:5.1f}x")
+
+    # Forced wins: threat-space search against plain alpha-beta
+    solved = {True: 0, False: 0}
+    spent = {True: 0.0, False: 0.0}
+    wins = 0
+    for board in positions:
+        line, nodes = find_win(board.copy(), max_nodes=10 ** 6, deadline=time.perf_counter() + budget_ms / 1000)
+        if not line:
+            continue
+        wins += 1
+        for threats in (True, False):
+            start = time.perf_counter()
+            result = Searcher(board.copy(), budget_ms, TranspositionTable(), threats=threats).search()
+            spent[threats] += time.perf_counter() - start
+            solved[threats] += result.score >= WIN // 2
+    print(f"  forced wins  {wins} of {len(positions)} positions, {budget_ms} ms budget")
+    for threats, label in ((True, "threat search"), (False, "alpha-beta only")):
+        print(f"    {label:16} {solved[threats]:3} proven   {spent[threats]:7.2f} s")
+    print(f"    think time cut {spent[False] / max(spent[True], 1e-9):.1f}x")
+
+def drawn_record(size, moves, seed=4):
+    # Random moves that never make five, so the record plays out in full
+    rng = random.Random(seed)
+    board = Board(size)
+    record = GameRecord(size)
+    cells = list(board.geometry.cells)
+    rng.shuffle(cells)
+    for cell in cells:
+        if len(record.moves) == moves:
+            break
+        board.play(cell)
+        if board.winner is not None:
+            board.undo()
+            continue
+        record.play(*board.coords(cell))
+    return record
+
+def bench_replay(size=15, moves=200, rounds=20):
+    # Canvas work of replaying, undoing and resetting a long game (needs a display)
+    root = tk.Tk()
+    game = GomokuGame(root)
+    game.size_var.set(str(size))
+    game.reset_game()
+    record = drawn_record(size, moves)
+    root.update()
+    print(f"{size}x{size} board, {len(record.moves)} move record, {rounds} rounds")
+
+    timings = {'replay': 0.0, 'undo all': 0.0, 'redo all': 0.0, 'reset': 0.0}
+    for _ in range(rounds):
+        start = time.perf_counter()
+        game.record = GameRecord(size, record.moves)
+        game.show_record()
+        root.update()
+        timings['replay'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        while game.record.can_undo():
+            game.undo_move()
+        root.update()
+        timings['undo all'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        while game.record.can_redo():
+            game.redo_move()
+        root.update()
+        timings['redo all'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        game.reset_game()
+        root.update()
+        timings['reset'] += time.perf_counter() - start
+    for label, total in timings.items():
+        print(f"  {label:9} {1000 * total / rounds:8.2f} ms")
+    print(f"  canvas items after reset: {len(game.canvas.find_all())} (grid lines only)")
+    root.destroy()
+
+def main():
+    parser = argparse.ArgumentParser(description="Gomoku engine benchmarks")
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--search', action='store_true',
+                        help="time the computer opponent on fixed positions")
+    parser.add_argument('--threats', action='store_true',
+                        help="compare table and loop evaluation, threat search and alpha-beta")
+    parser.add_argument('--replay', action='store_true',
+                        help="time replay, undo and reset of a long game (needs a display)")
+    parser.add_argument('--budget', type=int, default=500, help="think time per position in ms")
+    args = parser.parse_args()
+    if args.search:
+        bench_search(args.size, budget_ms=args.budget)
+    elif args.threats:
+        bench_threats(args.size)
+    elif args.replay:
+        bench_replay(args.size)
+    else:
+        bench_updates(args.size)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+import random
+
+# Gomoku board core without any Tk. Stones are kept twice:
+#
+# - one bitboard (Python int) per player, bit row * stride + col with one
+#   spare column per row so shifts never wrap into the next row
+# - one int per player for every line in the four directions, a stone at
+#   position i of a line being bit i + LINE_PAD
+#
+# Each line window of 11 cells around a changed stone is encoded in base 3
+# (empty / own / blocked) and looked up in a table of pattern counts, so
+# the five, four, open four, open three, broken three and open two counts
+# of both players are updated with a few lookups per move.
+
+BLACK = 0
+WHITE = 1
+
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# Cells on each side of a stone that a pattern through it can reach
+LINE_PAD = 5
+SEGMENT = 2 * LINE_PAD + 1
+SEGMENT_MASK = (1 << SEGMENT) - 1
+CENTER_BIT = 1 << LINE_PAD
+CENTER_BLOCKED = 2 * 3 ** LINE_PAD
+
+# Hashed in on every move so positions differ by side to move
+SIDE_KEY = 0x9E3779B97F4A7C15
+
+# Pattern counts are packed into one int per player, 16 bits per field
+FIVE = 0
+FOUR = 1
+OPEN_FOUR = 2
+OPEN_THREE = 3
+BROKEN_THREE = 4
+OPEN_TWO = 5
+PATTERN_NAMES = ("five", "four", "open four", "open three", "broken three", "open two")
+FIELD_BITS = 16
+FIELD_MASK = (1 << FIELD_BITS) - 1
+
+# Mask of bits -> the same positions as base-3 digits set to 1
+TERNARY = [sum(3 ** i for i in range(SEGMENT) if mask >> i & 1) for mask in range(1 << SEGMENT)]
+
+def window_counts(digits):
+    # Packed pattern counts of one window given as base-3 digits
+    # (0 empty, 1 own, 2 blocked)
+    own = digits.count(1)
+    empty = digits.count(0)
+    if len(digits) == 5:
+        if own == 5:
+            return 1 << FIELD_BITS * FIVE
+        if own == 4 and empty == 1:
+            return 1 << FIELD_BITS * FOUR
+        return 0
+    # Six cells: open shapes need both ends empty
+    if digits[0] or digits[5]:
+        return 0
+    inner = digits[1:5]
+    if inner.count(1) == 4:
+        return 1 << FIELD_BITS * OPEN_FOUR
+    if inner.count(1) == 3 and inner.count(0) == 1:
+        # _XXX__ and __XXX_ against _X_XX_ and _XX_X_
+        if inner[0] == 0 or inner[3] == 0:
+            return 1 << FIELD_BITS * OPEN_THREE
+        return 1 << FIELD_BITS * BROKEN_THREE
+    if inner.count(1) == 2 and inner.count(0) == 2:
+        return 1 << FIELD_BITS * OPEN_TWO
+    return 0
+
+def segment_counts(code):
+    # Packed counts of every 5 and 6 cell window of a segment that covers
+    # its center cell
+    digits = []
+    for _ in range(SEGMENT):
+        code, digit = divmod(code, 3)
+        digits.append(digit)
+    total = 0
+    for length in (5, 6):
+        for start in range(LINE_PAD - length + 1, LINE_PAD + 1):
+            total += window_counts(digits[start:start + length])
+    return total
+
+def build_segment_table():
+    # segment code -> packed counts for all 3 ** 11 codes, the same as
+    # segment_counts() but summed from tables of the 3 ** 5 and 3 ** 6
+    # windows, which takes a fraction of a second
+    windows = []
+    for length in (5, 6):
+        table = [window_counts([code // 3 ** i % 3 for i in range(length)]) for code in range(3 ** length)]
+        for start in range(LINE_PAD - length + 1, LINE_PAD + 1):
+            windows.append((3 ** start, 3 ** length, table))
+    segments = [0] * 3 ** SEGMENT
+    for code in range(3 ** SEGMENT):
+        total = 0
+        for scale, size, table in windows:
+            total += table[code // scale % size]
+        segments[code] = total
+    return segments
+
+SEGMENTS = build_segment_table()
+
+class Geometry:
+    # Everything about a board size that does not depend on the stones
+    def __init__(self, size):
+        self.size = size
+        self.stride = size + 1
+        self.cells = [row * self.stride + col for row in range(size) for col in range(size)]
+        self.mask = sum(1 << cell for cell in self.cells)
+
+        # cell -> ((line, position, stone bit, edge segment) per direction)
+        self.cell_lines = {cell: [] for cell in self.cells}
+        self.walls = []
+        positions = []
+        for dr, dc in DIRECTIONS:
+            for row, col in self.line_starts(dr, dc):
+                line = len(self.walls)
+                length = 0
+                while 0 <= row < size and 0 <= col < size:
+                    positions.append((row * self.stride + col, line, length))
+                    row += dr
+                    col += dc
+                    length += 1
+                # Outside the board counts as blocked for both players
+                self.walls.append((1 << LINE_PAD) - 1 | ((1 << LINE_PAD + 1) - 1) << (length + LINE_PAD))
+        for cell, line, position in positions:
+            edge = self.walls[line] >> position & SEGMENT_MASK
+            self.cell_lines[cell].append((line, position, 1 << (position + LINE_PAD), edge))
+        self.cell_lines = {cell: tuple(lines) for cell, lines in self.cell_lines.items()}
+
+        # Zobrist keys per player and cell, the same for every board of
+        # this size so hashes can be compared across boards
+        rng = random.Random(size)
+        self.zobrist = [{cell: rng.getrandbits(64) for cell in self.cells} for _ in (BLACK, WHITE)]
+
+    def line_starts(self, dr, dc):
+        size = self.size
+        if (dr, dc) == (0, 1):
+            return [(row, 0) for row in range(size)]
+        if (dr, dc) == (1, 0):
+            return [(0, col) for col in range(size)]
+        if (dr, dc) == (1, 1):
+            return [(0, col) for col in range(size)] + [(row, 0) for row in range(1, size)]
+        return [(0, col) for col in range(size)] + [(row, size - 1) for row in range(1, size)]
+
+GEOMETRIES = {}
+
+def geometry(size):
+    if size not in GEOMETRIES:
+        GEOMETRIES[size] = Geometry(size)
+    return GEOMETRIES[size]
+
+class Board:
+    def __init__(self, size=15):
+        self.geometry = geometry(size)
+        self.size = size
+        self.stride = self.geometry.stride
+        self.stones = [0, 0]
+        self.lines = [[0] * len(self.geometry.walls), [0] * len(self.geometry.walls)]
+        self.counts = [0, 0]
+        self.to_move = BLACK
+        self.winner = None
+        self.hash = 0
+        # (cell, black counts, white counts) per move, for undo
+        self.history = []
+
+    def cell(self, row, col):
+        return row * self.stride + col
+
+    def coords(self, cell):
+        return divmod(cell, self.stride)
+
+    def occupied(self):
+        return self.stones[BLACK] | self.stones[WHITE]
+
+    def is_empty(self, cell):
+        return not (self.stones[BLACK] | self.stones[WHITE]) >> cell & 1
+
+    def stone_at(self, cell):
+        if self.stones[BLACK] >> cell & 1:
+            return BLACK
+        if self.stones[WHITE] >> cell & 1:
+            return WHITE
+        return None
+
+    def play(self, cell):
+        # Put a stone of the side to move on an empty cell
+        player = self.to_move
+        opponent = player ^ 1
+        own_lines = self.lines[player]
+        opp_lines = self.lines[opponent]
+        segments = SEGMENTS
+        own_counts = self.counts[player]
+        opp_counts = self.counts[opponent]
+        self.history.append((cell, self.counts[BLACK], self.counts[WHITE]))
+
+        for line, position, bit, edge in self.geometry.cell_lines[cell]:
+            own = own_lines[line]
+            mine = own >> position & SEGMENT_MASK
+            theirs = opp_lines[line] >> position & SEGMENT_MASK
+            # Our patterns gain the stone, theirs gain a blocker
+            own_blocked = TERNARY[theirs | edge] * 2
+            opp_blocked = TERNARY[mine | edge] * 2
+            own_counts += (segments[TERNARY[mine | CENTER_BIT] + own_blocked]
+                           - segments[TERNARY[mine] + own_blocked])
+            opp_counts += (segments[TERNARY[theirs] + opp_blocked + CENTER_BLOCKED]
+                           - segments[TERNARY[theirs] + opp_blocked])
+            own_lines[line] = own | bit
+
+        self.stones[player] |= 1 << cell
+        self.hash ^= self.geometry.zobrist[player][cell] ^ SIDE_KEY
+        self.counts[player] = own_counts
+        self.counts[opponent] = opp_counts
+        if own_counts & FIELD_MASK and self.winner is None:
+            self.winner = player
+        self.to_move = opponent
+
+    def undo(self):
+        # Take back the last move
+        cell, black_counts, white_counts = self.history.pop()
+        player = self.to_move ^ 1
+        own_lines = self.lines[player]
+        for line, position, bit, edge in self.geometry.cell_lines[cell]:
+            own_lines[line] ^= bit
+        self.stones[player] &= ~(1 << cell)
+        self.hash ^= self.geometry.zobrist[player][cell] ^ SIDE_KEY
+        self.counts[BLACK] = black_counts
+        self.counts[WHITE] = white_counts
+        if self.winner is not None and not self.counts[self.winner] & FIELD_MASK:
+            self.winner = None
+        self.to_move = player
+
+    def move_gain(self, cell, player):
+        # Packed change in the player's pattern counts if they played the
+        # empty cell, without touching the board
+        own_lines = self.lines[player]
+        opp_lines = self.lines[player ^ 1]
+        segments = SEGMENTS
+        gain = 0
+        for line, position, bit, edge in self.geometry.cell_lines[cell]:
+            mine = own_lines[line] >> position & SEGMENT_MASK
+            blocked = TERNARY[(opp_lines[line] >> position & SEGMENT_MASK) | edge] * 2
+            gain += segments[TERNARY[mine | CENTER_BIT] + blocked] - segments[TERNARY[mine] + blocked]
+        return gain
+
+    def move_patterns(self, cell, player):
+        # Packed counts of the player's windows through the empty cell if
+        # they played it. Every one of them would be new, so unlike
+        # move_gain() the fields are never negative
+        own_lines = self.lines[player]
+        opp_lines = self.lines[player ^ 1]
+        segments = SEGMENTS
+        total = 0
+        for line, position, bit, edge in self.geometry.cell_lines[cell]:
+            mine = own_lines[line] >> position & SEGMENT_MASK
+            total += segments[TERNARY[mine | CENTER_BIT] + TERNARY[(opp_lines[line] >> position & SEGMENT_MASK) | edge] * 2]
+        return total
+
+    def copy(self):
+        board = Board(self.size)
+        for cell, black_counts, white_counts in self.history:
+            board.play(cell)
+        return board
+
+    def pattern_count(self, player, pattern):
+        # Number of windows of the player matching one of FIVE .. OPEN_TWO
+        return field(self.counts[player], pattern)
+
+    def pattern_counts(self, player):
+        return tuple(self.pattern_count(player, pattern) for pattern in range(len(PATTERN_NAMES)))
+
+    def neighborhood(self, distance=2, stones=None):
+        # Bitboard of empty cells within distance of any stone, or of the
+        # given stones only
+        stride = self.stride
+        mask = self.geometry.mask
+        occupied = self.occupied()
+        area = occupied if stones is None else stones
+        for _ in range(distance):
+            # Masking after the sideways step keeps the spare column empty
+            area = (area | area << 1 | area >> 1) & mask
+            area |= area << stride | area >> stride
+        return area & mask & ~occupied
+
+    def empty_cells(self):
+        occupied = self.occupied()
+        return [cell for cell in self.geometry.cells if not occupied >> cell & 1]
+
+    def full(self):
+        return self.occupied() == self.geometry.mask
+
+def field(packed, pattern):
+    # One field of packed counts that are known not to be negative
+    return packed >> FIELD_BITS * pattern & FIELD_MASK
+
+def unpack(packed):
+    # Packed counts (or a difference of them, fields may be negative) ->
+    # one int per pattern
+    fields = []
+    for _ in PATTERN_NAMES:
+        field = packed & FIELD_MASK
+        if field > FIELD_MASK >> 1:
+            field -= FIELD_MASK + 1
+        fields.append(field)
+        packed = (packed - field) >> FIELD_BITS
+    return tuple(fields)
+
+def bits(board):
+    # Indices of the set bits of a bitboard, lowest first
+    while board:
+        low = board & -board
+        yield low.bit_length() - 1
+        board ^= low
+
+def random_position(size, stones, rng=random):
+    # Board with stones played alternately at random, stopping early on a win
+    board = Board(size)
+    cells = list(board.geometry.cells)
+    rng.shuffle(cells)
+    for cell in cells[:stones]:
+        board.play(cell)
+        if board.winner is not None:
+            break
+    return board
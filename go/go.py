@@ -1,5 +1,24 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
+import threading
+
+try:
+    from .ai import Searcher, TranspositionTable
+    from .engine import BLACK, WHITE, Board
+    from .record import MAX_SIZE, MIN_SIZE, GameRecord, read_record, write_record
+except ImportError:
+    from ai import Searcher, TranspositionTable
+    from engine import BLACK, WHITE, Board
+    from record import MAX_SIZE, MIN_SIZE, GameRecord, read_record, write_record
+
+# How often the Tk thread checks for the computer's move, in milliseconds
+AI_POLL_MS = 20
+
+# Largest canvas side in pixels; big boards get smaller cells
+CANVAS_LIMIT = 600
+
+def cell_size_for(board_size):
+    return min(40, CANVAS_LIMIT // board_size)
 
 class GomokuGame:
     def __init__(self, root):
@@ -8,9 +27,16 @@ class GomokuGame:
         
         # Game settings
         self.board_size = 15
-        self.cell_size = 40
+        self.cell_size = cell_size_for(self.board_size)
         self.current_player = "Black"
-        self.board = [['' for _ in range(self.board_size)] for _ in range(self.board_size)]
+        self.board = Board(self.board_size)
+        self.record = GameRecord(self.board_size)
+        self.game_over = False
+
+        # Canvas item of every stone by engine cell; stones carry the
+        # "stone" tag and grid lines the "grid" tag, so neither has to be
+        # redrawn when only the other changes
+        self.stones = {}
         
         # Create canvas
         canvas_size = self.board_size * self.cell_size
@@ -44,6 +70,52 @@ class GomokuGame:
         )
         self.reset_button.pack(pady=5)
 
+        # History and game records
+        history_frame = tk.Frame(root)
+        history_frame.pack(pady=5)
+        self.undo_button = tk.Button(history_frame, text="Undo", command=self.undo_move)
+        self.undo_button.pack(side=tk.LEFT, padx=2)
+        self.redo_button = tk.Button(history_frame, text="Redo", command=self.redo_move)
+        self.redo_button.pack(side=tk.LEFT, padx=2)
+        tk.Button(history_frame, text="Save", command=self.save_game).pack(side=tk.LEFT, padx=2)
+        tk.Button(history_frame, text="Load", command=self.load_game).pack(side=tk.LEFT, padx=2)
+        # A new board size takes effect on the next reset
+        tk.Label(history_frame, text="Board size:").pack(side=tk.LEFT, padx=(10, 0))
+        self.size_var = tk.StringVar(value=str(self.board_size))
+        tk.Spinbox(
+            history_frame,
+            from_=MIN_SIZE,
+            to=MAX_SIZE,
+            textvariable=self.size_var,
+            width=4
+        ).pack(side=tk.LEFT, padx=2)
+        root.bind('<Control-z>', lambda event: self.undo_move())
+        root.bind('<Control-y>', lambda event: self.redo_move())
+
+        # Computer opponent, searching on a worker thread
+        ai_frame = tk.Frame(root)
+        ai_frame.pack(pady=5)
+        self.vs_computer = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            ai_frame,
+            text="Computer plays White",
+            variable=self.vs_computer,
+            command=self.maybe_start_ai
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Label(ai_frame, text="Think time (ms):").pack(side=tk.LEFT)
+        self.think_ms = tk.StringVar(value="500")
+        tk.Spinbox(
+            ai_frame,
+            values=(100, 250, 500, 1000, 2000, 5000),
+            textvariable=self.think_ms,
+            width=6
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.table = TranspositionTable()
+        self.search = None
+        self.search_result = None
+        self.update_history_buttons()
+
     def draw_board(self):
         # Draw lines
         for i in range(self.board_size):
@@ -53,7 +125,8 @@ class GomokuGame:
                 self.cell_size/2,
                 i * self.cell_size + self.cell_size/2, 
                 self.board_size * self.cell_size - self.cell_size/2,
-                fill='black'
+                fill='black',
+                tags='grid'
             )
             # Horizontal lines
             self.canvas.create_line(
@@ -61,28 +134,158 @@ class GomokuGame:
                 i * self.cell_size + self.cell_size/2,
                 self.board_size * self.cell_size - self.cell_size/2, 
                 i * self.cell_size + self.cell_size/2,
-                fill='black'
+                fill='black',
+                tags='grid'
             )
 
+    def set_board_size(self, size):
+        # Only a new size needs the grid redrawn
+        self.board_size = size
+        self.cell_size = cell_size_for(size)
+        canvas_size = size * self.cell_size
+        self.canvas.config(width=canvas_size, height=canvas_size)
+        self.canvas.delete('grid')
+        self.draw_board()
+        self.size_var.set(str(size))
+
     def handle_click(self, event):
+        # Clicks wait while the computer is thinking
+        if self.search is not None or self.game_over:
+            return
+
         # Convert click coordinates to board position
         col = int((event.x - self.cell_size/2) // self.cell_size)
         row = int((event.y - self.cell_size/2) // self.cell_size)
         
         # Check if position is valid and empty
         if 0 <= row < self.board_size and 0 <= col < self.board_size:
-            if self.board[row][col] == '':
-                # Place stone
-                self.place_stone(row, col)
-                
-                # Check for win
-                if self.check_win(row, col):
-                    messagebox.showinfo("Game Over", f"{self.current_player} wins!")
-                    self.reset_game()
-                else:
-                    # Switch player
-                    self.current_player = "White" if self.current_player == "Black" else "Black"
-                    self.status_label.config(text=f"Current Player: {self.current_player}")
+            if self.board.is_empty(self.board.cell(row, col)):
+                self.make_move(row, col)
+
+    def make_move(self, row, col):
+        # Place stone
+        self.record.play(row, col)
+        self.place_stone(row, col)
+
+        # Check for win, the final position stays up for undo and saving
+        if self.check_win(row, col):
+            winner = self.current_player
+            self.game_over = True
+            self.update_status()
+            messagebox.showinfo("Game Over", f"{winner} wins!")
+        else:
+            # Switch player
+            self.update_status()
+            self.maybe_start_ai()
+
+    def update_status(self):
+        self.current_player = "Black" if self.board.to_move == BLACK else "White"
+        if self.game_over:
+            winner = "Black" if self.board.winner == BLACK else "White"
+            self.status_label.config(text=f"{winner} wins!")
+        else:
+            self.status_label.config(text=f"Current Player: {self.current_player}")
+        self.update_history_buttons()
+
+    def update_history_buttons(self):
+        self.undo_button.config(state=tk.NORMAL if self.record.can_undo() else tk.DISABLED)
+        self.redo_button.config(state=tk.NORMAL if self.record.can_redo() else tk.DISABLED)
+
+    def undo_move(self):
+        # Against the computer, take back its reply too so it is the
+        # player's turn again
+        self.cancel_search()
+        if not self.record.can_undo():
+            return
+        self.record.undo()
+        self.remove_stone()
+        if self.vs_computer.get() and self.board.to_move == WHITE and self.record.can_undo():
+            self.record.undo()
+            self.remove_stone()
+        self.game_over = False
+        self.update_status()
+
+    def redo_move(self):
+        if self.search is not None or not self.record.can_redo():
+            return
+        self.place_stone(*self.record.redo())
+        if self.vs_computer.get() and self.board.to_move == WHITE and self.record.can_redo():
+            self.place_stone(*self.record.redo())
+        self.game_over = self.board.winner is not None
+        self.update_status()
+        if not self.record.can_redo():
+            self.maybe_start_ai()
+
+    def maybe_start_ai(self):
+        if not self.vs_computer.get() and self.search is not None:
+            # Unticked while the computer was thinking
+            self.cancel_search()
+            self.update_status()
+            return
+        if (self.vs_computer.get() and self.current_player == "White" and self.search is None
+                and not self.game_over and not self.record.can_redo() and not self.board.full()):
+            self.start_ai()
+
+    def start_ai(self):
+        try:
+            budget = max(int(self.think_ms.get()), 10)
+        except ValueError:
+            budget = 500
+
+        # The worker searches its own copy; the Tk thread polls for the answer
+        self.search = Searcher(self.board.copy(), budget, self.table)
+        self.search_result = None
+        threading.Thread(target=self.run_search, args=(self.search,), daemon=True).start()
+        self.status_label.config(text="Computer is thinking...")
+        self.root.after(AI_POLL_MS, self.poll_ai)
+
+    def cancel_search(self):
+        # Stop a running search. Its thread may still be unwinding, so the
+        # next search gets a table of its own instead of sharing this one
+        if self.search is not None:
+            self.search.stop()
+            self.table = TranspositionTable()
+        self.search = None
+        self.search_result = None
+
+    def run_search(self, search):
+        # Runs on the worker thread, must not touch any widget
+        try:
+            result = search.search()
+        except Exception as error:
+            # Handed to poll_ai, which reports it and gives the turn back
+            result = error
+        # A reset may have abandoned this search while it ran
+        if search is self.search:
+            self.search_result = result
+
+    def poll_ai(self):
+        if self.search is None:
+            return
+        if not self.canvas.winfo_exists():
+            self.cancel_search()
+            return
+        result = self.search_result
+        if result is None:
+            self.root.after(AI_POLL_MS, self.poll_ai)
+            return
+        self.search = None
+        self.search_result = None
+        if isinstance(result, Exception):
+            self.update_status()
+            messagebox.showerror("Computer player failed", str(result) or type(result).__name__)
+            return
+        row, col = self.board.coords(result.move)
+        self.make_move(row, col)
+        if not self.game_over:
+            if result.line:
+                found = f"forced win in {(len(result.line) + 1) // 2}"
+            else:
+                found = f"depth {result.depth}"
+            self.status_label.config(
+                text=f"Current Player: {self.current_player}   (computer: {found}, "
+                     f"{result.nodes:,} nodes, {result.nodes_per_second:,.0f} nodes/s)"
+            )
 
     def place_stone(self, row, col):
         # Calculate position
@@ -90,62 +293,93 @@ class GomokuGame:
         y = row * self.cell_size + self.cell_size/2
         
         # Draw stone
-        color = 'black' if self.current_player == "Black" else 'white'
-        self.canvas.create_oval(
+        cell = self.board.cell(row, col)
+        color = 'black' if self.board.to_move == BLACK else 'white'
+        self.stones[cell] = self.canvas.create_oval(
             x - self.cell_size/3,
             y - self.cell_size/3,
             x + self.cell_size/3,
             y + self.cell_size/3,
             fill=color,
-            outline='black'
+            outline='black',
+            tags='stone'
         )
         
-        # Update board state
-        self.board[row][col] = self.current_player
+        # Update board state, the engine tracks lines as stones go down
+        self.board.play(cell)
+
+    def remove_stone(self):
+        # Take the last stone off the board and the canvas
+        cell = self.board.history[-1][0]
+        self.board.undo()
+        self.canvas.delete(self.stones.pop(cell))
+
+    def show_record(self):
+        # Put the played moves of the record on a cleared board, the grid stays
+        self.canvas.delete('stone')
+        self.stones.clear()
+        self.board = Board(self.board_size)
+        for row, col in self.record.played():
+            self.place_stone(row, col)
+        self.game_over = self.board.winner is not None
+        self.update_status()
+
+    def save_game(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension='.gomoku',
+            filetypes=[("Gomoku records", "*.gomoku"), ("All files", "*")]
+        )
+        if not path:
+            return
+        try:
+            write_record(self.record, path)
+        except OSError as error:
+            messagebox.showerror("Save failed", str(error))
+
+    def load_game(self):
+        path = filedialog.askopenfilename(filetypes=[("Gomoku records", "*.gomoku"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            record = read_record(path)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Load failed", str(error))
+            return
+        self.cancel_search()
+        self.table = TranspositionTable()
+        if record.size != self.board_size:
+            self.set_board_size(record.size)
+        self.record = record
+        self.show_record()
+        self.maybe_start_ai()
 
     def check_win(self, row, col):
-        # Directions to check (horizontal, vertical, diagonal)
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-        
-        for dr, dc in directions:
-            count = 1  # Count the current stone
-            
-            # Check in positive direction
-            r, c = row + dr, col + dc
-            while (0 <= r < self.board_size and 
-                   0 <= c < self.board_size and 
-                   self.board[r][c] == self.current_player):
-                count += 1
-                r += dr
-                c += dc
-            
-            # Check in negative direction
-            r, c = row - dr, col - dc
-            while (0 <= r < self.board_size and 
-                   0 <= c < self.board_size and 
-                   self.board[r][c] == self.current_player):
-                count += 1
-                r -= dr
-                c -= dc
-            
-            if count >= 5:
-                return True
-        
-        return False
+        # The engine keeps five-in-a-row counts up to date on every move
+        player = BLACK if self.current_player == "Black" else WHITE
+        return self.board.winner == player
 
     def reset_game(self):
-        # Clear board state
-        self.board = [['' for _ in range(self.board_size)] for _ in range(self.board_size)]
-        
-        # Clear canvas
-        self.canvas.delete("all")
+        # Clear board state, dropping any search still running
+        self.cancel_search()
+        self.table = TranspositionTable()
+
+        # The grid is only redrawn when the size changed
+        try:
+            size = min(max(int(self.size_var.get()), MIN_SIZE), MAX_SIZE)
+        except ValueError:
+            size = self.board_size
+        if size != self.board_size:
+            self.set_board_size(size)
+        self.board = Board(self.board_size)
+        self.record = GameRecord(self.board_size)
+        self.game_over = False
         
-        # Redraw board
-        self.draw_board()
+        # Clear the stones only
+        self.canvas.delete('stone')
+        self.stones.clear()
         
         # Reset player
-        self.current_player = "Black"
-        self.status_label.config(text=f"Current Player: {self.current_player}")
+        self.update_status()
 
 if __name__ == "__main__":
     root = tk.Tk()
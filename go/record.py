@@ -0,0 +1,110 @@
+try:
+    from .engine import Board
+except ImportError:
+    from engine import Board
+
+# Move history of one game with undo and redo, and its text record:
+#
+#   # Gomoku game record
+#   size 15
+#   moves h8 i9 h9 h10
+#
+# A move is the column as a letter (a for the leftmost) followed by the
+# row as a number (1 for the top), so boards up to 25 x 25 fit the letters
+# a .. y. Lines starting with # are comments.
+
+MIN_SIZE = 9
+MAX_SIZE = 25
+
+COLUMNS = "abcdefghijklmnopqrstuvwxy"
+
+def format_move(row, col):
+    return f"{COLUMNS[col]}{row + 1}"
+
+def parse_move(text, size):
+    col = COLUMNS.find(text[:1].lower())
+    try:
+        row = int(text[1:]) - 1
+    except ValueError:
+        row = -1
+    if not (0 <= col < size and 0 <= row < size):
+        raise ValueError(f"bad move {text!r} for a {size} x {size} board")
+    return row, col
+
+class GameRecord:
+    # (row, col) of every move and how many of them are on the board; the
+    # ones past the cursor can be redone until a different move is played
+    def __init__(self, size=15, moves=()):
+        if not MIN_SIZE <= size <= MAX_SIZE:
+            raise ValueError(f"board size must be {MIN_SIZE} to {MAX_SIZE}")
+        self.size = size
+        self.moves = list(moves)
+        self.cursor = len(self.moves)
+
+    def play(self, row, col):
+        del self.moves[self.cursor:]
+        self.moves.append((row, col))
+        self.cursor += 1
+
+    def can_undo(self):
+        return self.cursor > 0
+
+    def can_redo(self):
+        return self.cursor < len(self.moves)
+
+    def undo(self):
+        # The move taken back
+        self.cursor -= 1
+        return self.moves[self.cursor]
+
+    def redo(self):
+        # The move played again
+        move = self.moves[self.cursor]
+        self.cursor += 1
+        return move
+
+    def played(self):
+        return self.moves[:self.cursor]
+
+    def board(self):
+        # Engine board with the played moves on it
+        board = Board(self.size)
+        for row, col in self.played():
+            board.play(board.cell(row, col))
+        return board
+
+def write_record(record, path):
+    # Saves the moves on the board, not the ones that could be redone
+    with open(path, 'w') as out:
+        out.write("# Gomoku game record\n")
+        out.write(f"size {record.size}\n")
+        out.write("moves " + " ".join(format_move(row, col) for row, col in record.played()) + "\n")
+
+def read_record(path):
+    size = 15
+    moves = []
+    with open(path) as lines:
+        for line in lines:
+            words = line.split()
+            if not words or words[0].startswith('#'):
+                continue
+            if words[0] == 'size':
+                size = int(words[1])
+            elif words[0] == 'moves':
+                moves.extend(words[1:])
+            else:
+                raise ValueError(f"unknown record line {line.strip()!r}")
+
+    # Check the moves against a board so a bad file fails here, not mid-replay
+    record = GameRecord(size)
+    board = Board(size)
+    for text in moves:
+        row, col = parse_move(text, size)
+        cell = board.cell(row, col)
+        if not board.is_empty(cell):
+            raise ValueError(f"move {text} is on an occupied point")
+        if board.winner is not None:
+            raise ValueError(f"move {text} comes after the game was won")
+        board.play(cell)
+        record.play(row, col)
+    return record
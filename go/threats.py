@@ -0,0 +1,212 @@
+import time
+
+try:
+    from .engine import BROKEN_THREE, DIRECTIONS, FIVE, FOUR, OPEN_FOUR, OPEN_THREE, bits, field
+except ImportError:
+    from engine import BROKEN_THREE, DIRECTIONS, FIVE, FOUR, OPEN_FOUR, OPEN_THREE, bits, field
+
+# Threat-space search: forced wins made only of moves the opponent has to
+# answer. VCF (victory by continuous fours) plays fours, each of which
+# leaves the defender a single cell to block. VCT (victory by continuous
+# threats) also plays threes, which are tried against every reply that
+# stops the three becoming an open four, and against every counter four.
+
+# Attacker moves in a VCF line, and threes allowed in a VCT line
+VCF_DEPTH = 12
+VCT_DEPTH = 3
+
+# Threat moves tried per attacker node, best first
+MAX_THREATS = 10
+
+# Nodes between two looks at the clock
+TIME_CHECK_NODES = 128
+
+class ThreatTimeout(Exception):
+    pass
+
+class ThreatSearch:
+    # Searches the board in place with play()/undo(); the board is back
+    # as it was when find() returns
+    def __init__(self, board, max_nodes=50000, deadline=None, stopped=None):
+        self.board = board
+        self.max_nodes = max_nodes
+        self.deadline = deadline
+        self.stopped = stopped  # optional threading.Event to give up early
+        self.nodes = 0
+        # (hash, kind, depth) of positions already shown not to win
+        self.failed = set()
+
+    def find(self, vcf_depth=VCF_DEPTH, vct_depth=VCT_DEPTH):
+        # Winning line of the side to move (its moves and the forced
+        # replies, alternating), or None when none was found in time
+        played = len(self.board.history)
+        try:
+            line = self.vcf(vcf_depth)
+            if line is None and vct_depth:
+                line = self.vct(vct_depth, vcf_depth)
+        except ThreatTimeout:
+            # Take back the moves of the line that was being tried
+            while len(self.board.history) > played:
+                self.board.undo()
+            return None
+        return line
+
+    def tick(self):
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise ThreatTimeout()
+        if self.nodes % TIME_CHECK_NODES == 0:
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise ThreatTimeout()
+            if self.stopped is not None and self.stopped.is_set():
+                raise ThreatTimeout()
+
+    def five_cells(self, player):
+        # Empty cells that would give the player five
+        board = self.board
+        if not (board.pattern_count(player, FOUR) or board.pattern_count(player, OPEN_FOUR)):
+            return []
+        area = board.neighborhood(1, board.stones[player])
+        return [cell for cell in bits(area) if field(board.move_patterns(cell, player), FIVE)]
+
+    def threat_moves(self, player, threes):
+        # Cells that make a four, or an open or broken three when threes is
+        # set, strongest first
+        board = self.board
+        scored = []
+        for cell in bits(board.neighborhood(2, board.stones[player])):
+            made = board.move_patterns(cell, player)
+            fours = field(made, FOUR) + field(made, OPEN_FOUR)
+            three_count = field(made, OPEN_THREE) + field(made, BROKEN_THREE)
+            if fours:
+                scored.append((2, fours, three_count, cell))
+            elif threes and three_count:
+                scored.append((1, 0, three_count, cell))
+        scored.sort(reverse=True)
+        return [entry[3] for entry in scored[:MAX_THREATS]]
+
+    def vcf(self, depth):
+        # Attacker (side to move) wins with fours only
+        self.tick()
+        board = self.board
+        attacker = board.to_move
+        defender = attacker ^ 1
+        fives = self.five_cells(attacker)
+        if fives:
+            return [fives[0]]
+        if depth == 0:
+            return None
+        key = (board.hash, 0, depth)
+        if key in self.failed:
+            return None
+
+        threats = self.five_cells(defender)
+        if len(threats) > 1:
+            moves = []
+        elif threats:
+            # Their four has to be blocked, which only helps if it is a four too
+            made = board.move_patterns(threats[0], attacker)
+            moves = threats if field(made, FOUR) + field(made, OPEN_FOUR) else []
+        else:
+            moves = self.threat_moves(attacker, False)
+
+        for move in moves:
+            board.play(move)
+            blocks = self.five_cells(attacker)
+            if len(blocks) > 1:
+                # Open four or double four: no single block stops it
+                board.undo()
+                return [move, blocks[0], blocks[1]]
+            line = None
+            if blocks:
+                board.play(blocks[0])
+                if board.winner is None:
+                    line = self.vcf(depth - 1)
+                board.undo()
+            board.undo()
+            if line is not None:
+                return [move, blocks[0]] + line
+        self.failed.add(key)
+        return None
+
+    def vct(self, depth, vcf_depth):
+        # Attacker (side to move) wins with fours and threes
+        line = self.vcf(vcf_depth)
+        if line is not None or depth == 0:
+            return line
+        board = self.board
+        attacker = board.to_move
+        defender = attacker ^ 1
+        key = (board.hash, 1, depth)
+        if key in self.failed:
+            return None
+        if self.five_cells(defender):
+            # Any answer to their four was a VCF move, already tried
+            self.failed.add(key)
+            return None
+
+        for move in self.threat_moves(attacker, True):
+            board.play(move)
+            blocks = self.five_cells(attacker)
+            if len(blocks) > 1:
+                board.undo()
+                return [move, blocks[0], blocks[1]]
+            # A four has one answer, a three every move that stops it
+            replies = blocks or self.defenses(move, attacker)
+            line = None
+            for reply in replies:
+                board.play(reply)
+                sub = self.vct(depth - 1, vcf_depth) if board.winner is None else None
+                board.undo()
+                if sub is None:
+                    line = None
+                    break
+                if line is None:
+                    # Shown for the first reply, every other one loses too
+                    line = [reply] + sub
+            board.undo()
+            if line is not None:
+                return [move] + line
+        self.failed.add(key)
+        return None
+
+    def defenses(self, move, attacker):
+        # Defender replies to the three made at move: cells on its lines
+        # after which the attacker has no open four, and every defender four
+        board = self.board
+        defender = attacker ^ 1
+        area = self.line_cells(move)
+        replies = []
+        for cell in area:
+            board.play(cell)
+            stopped = not any(field(board.move_patterns(other, attacker), OPEN_FOUR)
+                              for other in area if board.is_empty(other))
+            board.undo()
+            if stopped:
+                replies.append(cell)
+        for cell in bits(board.neighborhood(2, board.stones[defender])):
+            made = board.move_patterns(cell, defender)
+            if (field(made, FOUR) or field(made, OPEN_FOUR)) and cell not in replies:
+                replies.append(cell)
+        return replies
+
+    def line_cells(self, cell):
+        # Empty cells up to four away from cell along its four lines
+        board = self.board
+        size = board.size
+        row, col = board.coords(cell)
+        cells = []
+        for dr, dc in DIRECTIONS:
+            for step in (-4, -3, -2, -1, 1, 2, 3, 4):
+                r, c = row + dr * step, col + dc * step
+                if 0 <= r < size and 0 <= c < size:
+                    other = board.cell(r, c)
+                    if board.is_empty(other):
+                        cells.append(other)
+        return cells
+
+def find_win(board, max_nodes=50000, deadline=None, vcf_depth=VCF_DEPTH, vct_depth=VCT_DEPTH, stopped=None):
+    # (winning line or None, nodes searched) for the side to move
+    search = ThreatSearch(board, max_nodes, deadline, stopped)
+    line = search.find(vcf_depth, vct_depth)
+    return line, search.nodes
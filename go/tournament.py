@@ -0,0 +1,258 @@
+import argparse
+import math
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .ai import MAX_MOVES, WEIGHTS, Searcher, TranspositionTable
+    from .engine import BLACK, WHITE, Board
+except ImportError:
+    from ai import MAX_MOVES, WEIGHTS, Searcher, TranspositionTable
+    from engine import BLACK, WHITE, Board
+
+# Headless self-play between engine settings on a process pool. Nothing
+# here imports Tk, so workers start with the engine modules only.
+#
+#   python -m go.tournament --player base: --player deep:depth=4 --games 1000
+#
+# Every opening is played twice with the colors swapped. Finished games
+# are appended to the results file as they come in, one tab-separated
+# line each, and the Elo estimates follow as comment lines at the end.
+
+# Default engine settings; --player name:key=value,... overrides them
+DEFAULTS = {'ms': 100, 'depth': 20, 'moves': MAX_MOVES, 'threats': 1, 'weights': WEIGHTS}
+
+# Games one pool task plays before reporting back
+GAMES_PER_TASK = 4
+
+# Stones of a random opening lie this close to the center
+OPENING_RADIUS = 3
+
+RESULTS_HEADER = "game\tblack\twhite\tresult\tmoves\tseconds\n"
+
+def parse_player(text):
+    # "name:ms=200,depth=4,weights=100000/1500/20000/400/300/30" -> (name, settings)
+    name, _, options = text.partition(':')
+    settings = dict(DEFAULTS)
+    for option in filter(None, options.split(',')):
+        key, _, raw = option.partition('=')
+        if key not in DEFAULTS:
+            raise ValueError(f"unknown engine setting {key!r}")
+        if key == 'weights':
+            settings[key] = tuple(int(weight) for weight in raw.split('/'))
+            if len(settings[key]) != len(WEIGHTS):
+                raise ValueError(f"weights needs {len(WEIGHTS)} values")
+        else:
+            settings[key] = int(raw)
+    if not name:
+        raise ValueError(f"player {text!r} needs a name")
+    return name, settings
+
+def random_opening(rng, size, stones):
+    # Cells of a random opening near the center, played alternately
+    middle = size // 2
+    low, high = max(middle - OPENING_RADIUS, 0), min(middle + OPENING_RADIUS, size - 1)
+    board = Board(size)
+    cells = []
+    while len(cells) < stones:
+        cell = board.cell(rng.randint(low, high), rng.randint(low, high))
+        if board.is_empty(cell):
+            board.play(cell)
+            cells.append(cell)
+    return cells
+
+def play_game(size, opening, black, white):
+    # (result for Black: 1, 0.5 or 0, moves played)
+    board = Board(size)
+    for cell in opening:
+        board.play(cell)
+    players = {BLACK: black, WHITE: white}
+    tables = {BLACK: TranspositionTable(), WHITE: TranspositionTable()}
+    while board.winner is None and not board.full():
+        settings = players[board.to_move]
+        searcher = Searcher(board.copy(), settings['ms'], tables[board.to_move], max_depth=settings['depth'],
+                            max_moves=settings['moves'], threats=bool(settings['threats']),
+                            weights=settings['weights'])
+        board.play(searcher.search().move)
+    if board.winner is None:
+        return 0.5, len(board.history)
+    return (1.0 if board.winner == BLACK else 0.0), len(board.history)
+
+def play_games(size, games):
+    # Process pool task: games given as (game number, black settings,
+    # white settings, opening) -> (game number, result, moves, seconds)
+    results = []
+    for number, black, white, opening in games:
+        start = time.perf_counter()
+        result, moves = play_game(size, opening, black, white)
+        results.append((number, result, moves, time.perf_counter() - start))
+    return results
+
+def schedule(players, games, size, opening, seed):
+    # (game number, black, white, opening cells): round robin over every
+    # pair, each opening played once with each side as Black
+    rng = random.Random(seed)
+    pairs = [(a, b) for a in range(len(players)) for b in range(a + 1, len(players))]
+    number = 0
+    while number < games:
+        for a, b in pairs:
+            cells = random_opening(rng, size, opening)
+            for black, white in ((a, b), (b, a)):
+                if number < games:
+                    yield number, black, white, cells
+                    number += 1
+
+def elo_ratings(count, games):
+    # Elo per player from (black, white, black's result) by Bradley-Terry
+    # maximum likelihood; every pair also gets one virtual draw so players
+    # that never won or never lost keep a finite rating
+    points = [[0.0] * count for _ in range(count)]
+    played = [[0] * count for _ in range(count)]
+    for black, white, result in games:
+        points[black][white] += result
+        points[white][black] += 1 - result
+        played[black][white] += 1
+        played[white][black] += 1
+    for a in range(count):
+        for b in range(count):
+            if a != b:
+                points[a][b] += 0.5
+                played[a][b] += 1
+
+    strength = [1.0] * count
+    for _ in range(500):
+        updated = []
+        for a in range(count):
+            wins = sum(points[a])
+            weight = sum(played[a][b] / (strength[a] + strength[b]) for b in range(count) if b != a)
+            updated.append(wins / weight if weight else strength[a])
+        scale = math.exp(sum(math.log(s) for s in updated) / count)
+        updated = [s / scale for s in updated]
+        done = max(abs(new - old) for new, old in zip(updated, strength)) < 1e-9
+        strength = updated
+        if done:
+            break
+    return [400 * math.log10(s) for s in strength]
+
+def error_margin(score, games):
+    # Rough 95% margin of an Elo difference measured from a score fraction
+    if not games or score <= 0 or score >= 1:
+        return float('inf')
+    deviation = math.sqrt(score * (1 - score) / games)
+    return 1.96 * deviation * 400 / (math.log(10) * score * (1 - score))
+
+def summary(names, games):
+    # Lines of the Elo table, strongest first
+    ratings = elo_ratings(len(names), games)
+    scores = [0.0] * len(names)
+    counts = [0] * len(names)
+    for black, white, result in games:
+        scores[black] += result
+        scores[white] += 1 - result
+        counts[black] += 1
+        counts[white] += 1
+    lines = [f"{'player':16} {'games':>7} {'score':>7} {'elo':>7}"]
+    for i in sorted(range(len(names)), key=lambda i: -ratings[i]):
+        fraction = scores[i] / counts[i] if counts[i] else 0.0
+        lines.append(f"{names[i]:16} {counts[i]:7} {100 * fraction:6.1f}% {ratings[i]:+7.0f} "
+                     f"± {error_margin(fraction, counts[i]):.0f}")
+    return lines
+
+def run_tournament(players, games, out, size=15, opening=2, workers=None, seed=None):
+    # Play the games on every core and stream them into the results file
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    names = [name for name, settings in players]
+    workers = workers or os.cpu_count() or 1
+    tasks = []
+    colors = {}
+    for number, black, white, cells in schedule(players, games, size, opening, seed):
+        if number % GAMES_PER_TASK == 0:
+            tasks.append([])
+        tasks[-1].append((number, players[black][1], players[white][1], cells))
+        colors[number] = (black, white)
+
+    finished = []
+    moves_total = 0
+    start = time.perf_counter()
+    with open(out, 'w') as results, ProcessPoolExecutor(max_workers=workers) as pool:
+        results.write(f"# size {size}, opening {opening}, seed {seed}\n")
+        for name, settings in players:
+            options = ",".join(f"{key}={'/'.join(map(str, value)) if key == 'weights' else value}"
+                               for key, value in settings.items())
+            results.write(f"# player {name}:{options}\n")
+        results.write(RESULTS_HEADER)
+
+        # A couple of tasks per worker in flight, the rest waits
+        pending = deque(pool.submit(play_games, size, task) for task in tasks[:2 * workers])
+        queued = iter(tasks[2 * workers:])
+        while pending:
+            for number, result, moves, seconds in pending.popleft().result():
+                black, white = colors[number]
+                finished.append((black, white, result))
+                moves_total += moves
+                results.write(f"{number}\t{names[black]}\t{names[white]}\t{result:g}\t{moves}\t{seconds:.2f}\n")
+            results.flush()
+            task = next(queued, None)
+            if task is not None:
+                pending.append(pool.submit(play_games, size, task))
+            elapsed = time.perf_counter() - start
+            print(f"\r{len(finished):,} / {games:,} games, {len(finished) / elapsed:.2f} games/s", end='', flush=True)
+
+        table = summary(names, finished)
+        results.writelines(f"# {line}\n" for line in table)
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(finished):,} games ({moves_total:,} moves) in {elapsed:.1f} s on {workers} workers")
+    for line in table:
+        print(line)
+    return finished
+
+def read_results(path):
+    # Player names and (black, white, black's result) from a results file
+    names = []
+    games = []
+    with open(path) as results:
+        for line in results:
+            if line.startswith('#') or line == RESULTS_HEADER:
+                continue
+            number, black, white, result, moves, seconds = line.rstrip('\n').split('\t')
+            for name in (black, white):
+                if name not in names:
+                    names.append(name)
+            games.append((names.index(black), names.index(white), float(result)))
+    return names, games
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Gomoku self-play tournament")
+    parser.add_argument('--player', action='append', default=[], metavar='NAME:KEY=VALUE,...',
+                        help="engine settings ms, depth, moves, threats, weights (a/b/c/d/e/f); "
+                             "give at least two")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--opening', type=int, default=2, help="random stones placed near the center first")
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--out', default='tournament.tsv')
+    parser.add_argument('--elo', metavar='RESULTS', help="only print the Elo table of a results file")
+    args = parser.parse_args()
+
+    if args.elo:
+        names, games = read_results(args.elo)
+        for line in summary(names, games):
+            print(line)
+        return
+    try:
+        players = [parse_player(text) for text in args.player]
+    except ValueError as error:
+        parser.error(str(error))
+    if len(players) < 2:
+        parser.error("give at least two --player options")
+    if len({name for name, settings in players}) < len(players):
+        parser.error("player names must differ")
+    run_tournament(players, args.games, args.out, args.size, args.opening, args.workers, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,71 @@
+import time
+
+# Reference point for --profile-startup, taken before any other import
+MODULE_START = time.perf_counter()
+
 import tkinter as tk
-from tkinter import ttk
+from tkinter import messagebox
+import argparse
 import os
-import subprocess
-from PIL import Image, ImageTk
+import sys
+from registry import discover, load_game_class
+from thumbnails import ThumbnailLoader, THUMBNAIL_SIZE
+
+# Cold-start budget enforced by --profile-startup --startup-budget
+STARTUP_BUDGET_MS = 1000
 
 class GameLauncher:
-    def __init__(self, root):
+    def __init__(self, root, isolated=False, pool_size=2, pool_min_free_mb=512):
         self.root = root
         self.root.title("Game Launcher")
         self.root.geometry("800x600")
         self.root.configure(bg='#2C3E50')
 
-        # Game directories and their corresponding main files
-        self.games = {
-            "Go Game": {"dir": "go", "main": "go.py"},
-            "Minesweeper": {"dir": "mine", "main": "mine.py"},
-            "Ping Pong": {"dir": "pingpong", "main": "pingpong.py"},
-            "SnakeGame": {"dir": "snakegame", "main": "snake.py"},
-            "Sudoku": {"dir": "sudoku", "main": "sudoku.py"}
-        }
+        # Games found on disk and in installed packages, imported on launch
+        self.games = discover()
+
+        # Games hosted in this process, keyed by their Toplevel window
+        self.open_games = {}
+
+        # Run games in a separate Python process instead of a Toplevel
+        self.isolated = tk.BooleanVar(value=isolated)
+
+        # Pre-warmed worker processes for isolated launches
+        self.pool = None
+        self.pool_size = pool_size
+        self.pool_min_free_mb = pool_min_free_mb
+        self.isolated.trace_add('write', lambda *args: self.update_pool())
+        self.update_pool()
+
+        # Preview images are decoded off the Tk thread and filled in later
+        self.thumbnails = ThumbnailLoader(self.root)
+        self.placeholder = tk.PhotoImage(
+            master=self.root,
+            width=THUMBNAIL_SIZE[0],
+            height=THUMBNAIL_SIZE[1]
+        )
 
         self.create_widgets()
 
+    def update_pool(self):
+        # Only keep warm workers around while isolated launching is on
+        if self.isolated.get() and self.pool is None and self.pool_size > 0:
+            from game_pool import WorkerPool
+            self.pool = WorkerPool(
+                worker_command(),
+                size=self.pool_size,
+                min_free_mb=self.pool_min_free_mb
+            )
+        elif not self.isolated.get() and self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def shutdown(self):
+        self.thumbnails.shutdown()
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
     def create_widgets(self):
         # Create main frame
         main_frame = tk.Frame(self.root, bg='#2C3E50')
@@ -37,9 +81,61 @@ class GameLauncher:
         )
         title_label.pack(pady=20)
 
+        # Exit button
+        exit_button = tk.Button(
+            main_frame,
+            text="Exit",
+            command=self.root.quit,
+            font=('Helvetica', 12),
+            bg='#E74C3C',
+            fg='white',
+            width=20,
+            height=2
+        )
+        exit_button.pack(side=tk.BOTTOM, pady=20)
+
+        # Launch mode toggle
+        isolate_check = tk.Checkbutton(
+            main_frame,
+            text="Run each game in its own process",
+            variable=self.isolated,
+            font=('Helvetica', 10),
+            bg='#2C3E50',
+            fg='white',
+            selectcolor='#34495E',
+            activebackground='#2C3E50',
+            activeforeground='white'
+        )
+        isolate_check.pack(side=tk.BOTTOM, pady=(10, 0))
+
+        # Scrollable area for the game grid, the catalog can be large
+        grid_canvas = tk.Canvas(main_frame, bg='#2C3E50', highlightthickness=0)
+        scrollbar = tk.Scrollbar(main_frame, orient=tk.VERTICAL, command=grid_canvas.yview)
+        grid_canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill='y')
+        grid_canvas.pack(expand=True, fill='both')
+
         # Create frame for game buttons
-        games_frame = tk.Frame(main_frame, bg='#2C3E50')
-        games_frame.pack(expand=True, fill='both')
+        games_frame = tk.Frame(grid_canvas, bg='#2C3E50')
+        frame_id = grid_canvas.create_window((0, 0), window=games_frame, anchor='nw')
+        games_frame.bind(
+            '<Configure>',
+            lambda e: grid_canvas.configure(scrollregion=grid_canvas.bbox('all'))
+        )
+        grid_canvas.bind(
+            '<Configure>',
+            lambda e: grid_canvas.itemconfigure(frame_id, width=e.width)
+        )
+
+        # Scroll with the wheel only while the pointer is over the grid
+        def on_wheel(event):
+            if event.num == 4 or event.delta > 0:
+                grid_canvas.yview_scroll(-1, 'units')
+            else:
+                grid_canvas.yview_scroll(1, 'units')
+        wheel_events = ('<MouseWheel>', '<Button-4>', '<Button-5>')
+        grid_canvas.bind('<Enter>', lambda e: [grid_canvas.bind_all(w, on_wheel) for w in wheel_events])
+        grid_canvas.bind('<Leave>', lambda e: [grid_canvas.unbind_all(w) for w in wheel_events])
 
         # Configure grid
         for i in range(2):
@@ -55,19 +151,6 @@ class GameLauncher:
                 col = 0
                 row += 1
 
-        # Exit button
-        exit_button = tk.Button(
-            main_frame,
-            text="Exit",
-            command=self.root.quit,
-            font=('Helvetica', 12),
-            bg='#E74C3C',
-            fg='white',
-            width=20,
-            height=2
-        )
-        exit_button.pack(pady=20)
-
     def create_game_button(self, parent, game_name, row, col):
         # Create frame for each game
         game_frame = tk.Frame(
@@ -90,6 +173,20 @@ class GameLauncher:
         )
         name_label.pack(pady=5)
 
+        # Preview image, a blank placeholder until the thumbnail arrives
+        preview_label = tk.Label(
+            game_frame,
+            image=self.placeholder,
+            bg='#2C3E50'
+        )
+        preview_label.pack()
+        game_info = self.games[game_name]
+        if game_info.get("thumbnail") and game_info.get("dir"):
+            self.thumbnails.request(
+                os.path.join(game_info["dir"], game_info["thumbnail"]),
+                lambda photo, label=preview_label: self.show_thumbnail(label, photo)
+            )
+
         # Launch button
         launch_button = tk.Button(
             game_frame,
@@ -103,28 +200,281 @@ class GameLauncher:
         )
         launch_button.pack(pady=10)
 
-    def launch_game(self, game_name):
-        game_info = self.games[game_name]
-        game_dir = game_info["dir"]
-        main_file = game_info["main"]
-
-        # Get the current directory
-        current_dir = os.getcwd()
-        
-        # Construct the full path to the game
-        game_path = os.path.join(current_dir, game_dir, main_file)
+    def show_thumbnail(self, label, photo):
+        # The tile may have gone away while the image was decoding
+        if label.winfo_exists():
+            label.configure(image=photo)
+            label.image = photo
 
+    def launch_game(self, game_name):
         try:
-            # Launch the game using Python
-            subprocess.Popen(['python', game_path])
+            if self.isolated.get():
+                self.launch_game_process(game_name)
+            else:
+                self.launch_game_inprocess(game_name)
         except Exception as e:
             error_message = f"Error launching {game_name}:\n{str(e)}"
-            tk.messagebox.showerror("Error", error_message)
+            messagebox.showerror("Error", error_message)
 
-def main():
+    def launch_game_process(self, game_name):
+        # Prefer a warm worker, fall back to a cold interpreter
+        if self.pool is not None:
+            worker = self.pool.launch(game_name)
+            if worker is not None:
+                return worker
+
+        # Launch the game using the launcher's own interpreter
+        import subprocess
+        return subprocess.Popen(launcher_command('--run-game', game_name))
+
+    def launch_game_inprocess(self, game_name):
+        # Open the game in a Toplevel sharing the launcher's Tk interpreter
+        game_class = load_game_class(self.games[game_name])
+        window = tk.Toplevel(self.root)
+        try:
+            self.open_games[window] = game_class(window)
+        except Exception:
+            window.destroy()
+            raise
+        # add='+' keeps any <Destroy> cleanup the game bound on its window
+        window.bind('<Destroy>', lambda e, w=window: self.on_game_closed(e, w), add='+')
+        return window
+
+    def on_game_closed(self, event, window):
+        # <Destroy> fires for every child widget too, only react to the window
+        if event.widget is window:
+            self.open_games.pop(window, None)
+
+def is_frozen():
+    # True when running from the PyInstaller bundle built by main.spec
+    return getattr(sys, 'frozen', False)
+
+def launcher_command(*args):
+    # Command line that re-runs this launcher with the given arguments
+    if is_frozen():
+        # Games are inside the bundle, the executable itself is the launcher
+        return [sys.executable] + list(args)
+    return [sys.executable, os.path.abspath(__file__)] + list(args)
+
+def worker_command():
+    return launcher_command('--pool-worker')
+
+def run_game(game_name):
+    # Run a single game as the only window of this process
+    root = tk.Tk()
+    game = load_game_class(discover()[game_name])(root)
+    root.mainloop()
+
+def resident_memory_kb():
+    # Current resident set size of this process, None if unavailable
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is the peak, which is the closest portable figure
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def probe_game(game_name):
+    # Child side of --measure-launch: open one game, draw a frame, report
+    import json
+    root = tk.Tk()
+    game = load_game_class(discover()[game_name])(root)
+    root.update()
+    print(json.dumps({"rss_kb": resident_memory_kb()}), flush=True)
+    root.destroy()
+
+def measure_launch():
+    # Time-to-first-frame and resident memory for each game and launch mode
+    import json
+    import subprocess
+    from game_pool import WorkerPool
+    games = discover()
+    root = tk.Tk()
+    root.withdraw()
+
+    print(f"{'Game':<14}{'Mode':<12}{'First frame':>14}{'RSS':>12}")
+    for game_name in games:
+        # Separate process: a cold interpreter that opens just this game
+        start = time.perf_counter()
+        child = subprocess.Popen(
+            launcher_command('--probe-game', game_name),
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        line = child.stdout.readline()
+        elapsed = (time.perf_counter() - start) * 1000
+        child.wait()
+        rss = json.loads(line)["rss_kb"] if line else None
+        print(f"{game_name:<14}{'subprocess':<12}{elapsed:>11.1f} ms{format_kb(rss):>12}")
+
+        # In-process: a Toplevel on the already running interpreter
+        before = resident_memory_kb()
+        start = time.perf_counter()
+        window = tk.Toplevel(root)
+        game = load_game_class(games[game_name])(window)
+        window.update()
+        elapsed = (time.perf_counter() - start) * 1000
+        after = resident_memory_kb()
+        added = after - before if before is not None and after is not None else None
+        print(f"{game_name:<14}{'in-process':<12}{elapsed:>11.1f} ms{format_kb(added, '+'):>12}")
+        window.destroy()
+
+    # Warm worker from the pool, measured once the pool is full
+    pool = WorkerPool(worker_command(), size=1)
+    for game_name in games:
+        while pool.idle_count() == 0:
+            time.sleep(0.05)
+        start = time.perf_counter()
+        worker = pool.launch(game_name, probe=True)
+        line = worker.stdout.readline()
+        elapsed = (time.perf_counter() - start) * 1000
+        worker.wait()
+        rss = json.loads(line)["rss_kb"] if line else None
+        print(f"{game_name:<14}{'warm pool':<12}{elapsed:>11.1f} ms{format_kb(rss):>12}")
+    pool.shutdown()
+
+    root.destroy()
+
+def format_kb(kb, sign=''):
+    if kb is None:
+        return "n/a"
+    return f"{sign}{kb / 1024:.1f} MB"
+
+def probe_startup():
+    # Child side of --profile-startup: build the launcher, report, exit
     root = tk.Tk()
     app = GameLauncher(root)
+    ready = (time.perf_counter() - MODULE_START) * 1000
+    print(f"mainloop {ready:.3f}", flush=True)
+
+    def report_idle():
+        # Wall clock, so the parent can measure from before it spawned us
+        print(f"idle {time.time():.6f}", flush=True)
+        root.destroy()
+    root.after_idle(report_idle)
+    root.mainloop()
+
+def parse_importtime(stderr):
+    # Parse -X importtime output into (self_us, cumulative_us, depth, name)
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((int(fields[0]), int(fields[1]), depth, name.strip()))
+    return entries
+
+def profile_startup(budget_ms=None, top=15):
+    # Cold-start the launcher in a child interpreter and break the time down
+    import subprocess
+    command = launcher_command('--startup-probe')
+
+    # Plain run for the wall-clock figure, importtime adds its own overhead.
+    # The child stamps its first idle moment itself, so Tk teardown and
+    # interpreter exit are not counted against the budget
+    start = time.time()
+    plain = subprocess.run(command, capture_output=True, text=True)
+    total = (time.time() - start) * 1000
+    in_module = cold_start = None
+    for line in plain.stdout.splitlines():
+        if line.startswith('mainloop '):
+            in_module = float(line.split()[1])
+        elif line.startswith('idle '):
+            cold_start = (float(line.split()[1]) - start) * 1000
+    if plain.returncode != 0 or in_module is None or cold_start is None:
+        print(plain.stderr, file=sys.stderr)
+        return 2
+
+    # The frozen bootloader takes no interpreter options, so no breakdown
+    if not is_frozen():
+        traced = subprocess.run(
+            [command[0], '-X', 'importtime'] + command[1:],
+            capture_output=True,
+            text=True
+        )
+        entries = parse_importtime(traced.stderr)
+        top_level = [e for e in entries if e[2] == 0]
+        top_level.sort(key=lambda e: e[1], reverse=True)
+
+        print(f"{'cumulative':>12}{'self':>10}  module")
+        for self_us, cumulative_us, depth, name in top_level[:top]:
+            print(f"{cumulative_us / 1000:>9.1f} ms{self_us / 1000:>7.1f} ms  {name}")
+        total_imports = sum(e[0] for e in entries) / 1000
+        print(f"\n{len(entries)} modules imported, {total_imports:.1f} ms in imports")
+    print(f"main.py start -> root.mainloop(): {in_module:.1f} ms")
+    print(f"process start -> first idle in mainloop: {cold_start:.1f} ms")
+    print(f"process start -> exit: {total:.1f} ms")
+
+    if budget_ms is not None and cold_start > budget_ms:
+        print(f"Cold start {cold_start:.1f} ms is over the {budget_ms} ms budget", file=sys.stderr)
+        return 1
+    return 0
+
+def main():
+    if is_frozen():
+        # Process pools inside games start workers by re-running the bundle
+        import multiprocessing
+        multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(description="Tkinter game launcher")
+    parser.add_argument('--isolated', action='store_true',
+                        help="launch each game in its own Python process")
+    parser.add_argument('--pool-size', type=int, default=2, metavar='N',
+                        help="warm worker processes kept for isolated launches (0 disables)")
+    parser.add_argument('--pool-min-free-mb', type=int, default=512, metavar='MB',
+                        help="release idle workers when available memory drops below this")
+    parser.add_argument('--measure-launch', action='store_true',
+                        help="print time-to-first-frame and memory per game and mode")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="print an import-time breakdown and the time until root.mainloop()")
+    parser.add_argument('--startup-budget', type=float, nargs='?', const=STARTUP_BUDGET_MS,
+                        metavar='MS', help="with --profile-startup, exit non-zero if cold start "
+                        f"takes longer than MS (default {STARTUP_BUDGET_MS})")
+    parser.add_argument('--run-game', metavar='NAME', help=argparse.SUPPRESS)
+    parser.add_argument('--probe-game', metavar='NAME', help=argparse.SUPPRESS)
+    parser.add_argument('--startup-probe', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--pool-worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.startup_probe:
+        probe_startup()
+        return
+    if args.profile_startup:
+        sys.exit(profile_startup(args.startup_budget))
+    if args.run_game:
+        run_game(args.run_game)
+        return
+    if args.pool_worker:
+        from game_pool import run_worker
+        run_worker(resident_memory_kb)
+        return
+    if args.probe_game:
+        probe_game(args.probe_game)
+        return
+    if args.measure_launch:
+        measure_launch()
+        return
+
+    root = tk.Tk()
+    app = GameLauncher(
+        root,
+        isolated=args.isolated,
+        pool_size=args.pool_size,
+        pool_min_free_mb=args.pool_min_free_mb
+    )
     root.mainloop()
+    app.shutdown()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
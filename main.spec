@@ -1,38 +1,111 @@
 # -*- mode: python ; coding: utf-8 -*-
+import glob
+import os
+from PyInstaller.utils.hooks import collect_submodules
 
+# Build a one-directory bundle instead, which skips the per-start
+# extraction step of the single-file executable: GAMES_ONEDIR=1 pyinstaller main.spec
+ONEDIR = os.environ.get('GAMES_ONEDIR') == '1'
+
+# Game packages shipped inside the bundle
+GAME_PACKAGES = ['go', 'mine', 'pingpong', 'snakegame', 'sudoku']
+
+# Every game module is imported on launch, so the analysis cannot see them
+hiddenimports = ['registry', 'thumbnails', 'game_pool']
+for package in GAME_PACKAGES:
+    hiddenimports += collect_submodules(package)
+
+# Files read from disk at runtime: package metadata for the registry,
+# thumbnails and the Sudoku puzzle bank
+DATA_PATTERNS = ['__init__.py', '*.png', 'puzzles.*']
+datas = []
+for package in GAME_PACKAGES:
+    for pattern in DATA_PATTERNS:
+        for path in glob.glob(os.path.join(package, pattern)):
+            datas.append((path, package))
+
+# Standard library modules nothing in the launcher or the games uses
+excludes = [
+    'asyncio', 'doctest', 'email', 'ftplib', 'http', 'lib2to3', 'pdb',
+    'pydoc', 'sqlite3', 'test', 'tkinter.test', 'unittest', 'xmlrpc',
+]
+
+# Pillow only needs PNG for thumbnails, Image.init() skips missing plugins
+excludes += ['PIL.' + name for name in [
+    'AvifImagePlugin', 'BlpImagePlugin', 'BufrStubImagePlugin', 'CurImagePlugin',
+    'DcxImagePlugin', 'DdsImagePlugin', 'EpsImagePlugin', 'FitsImagePlugin',
+    'FliImagePlugin', 'FpxImagePlugin', 'FtexImagePlugin', 'GbrImagePlugin',
+    'GribStubImagePlugin', 'Hdf5StubImagePlugin', 'IcnsImagePlugin', 'IcoImagePlugin',
+    'ImImagePlugin', 'ImtImagePlugin', 'IptcImagePlugin', 'Jpeg2KImagePlugin',
+    'McIdasImagePlugin', 'MicImagePlugin', 'MpegImagePlugin', 'MspImagePlugin',
+    'PalmImagePlugin', 'PcdImagePlugin', 'PcxImagePlugin', 'PdfImagePlugin',
+    'PixarImagePlugin', 'PsdImagePlugin', 'QoiImagePlugin', 'SgiImagePlugin',
+    'SpiderImagePlugin', 'SunImagePlugin', 'TgaImagePlugin', 'WebPImagePlugin',
+    'WmfImagePlugin', 'XbmImagePlugin', 'XpmImagePlugin', 'XVThumbImagePlugin',
+    'ImageCms', 'ImageGrab', 'ImageQt', 'ImageShow', 'ImageWin',
+]]
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
-    hiddenimports=[],
+    datas=datas,
+    hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='main',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+if ONEDIR:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='main',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='main',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='main',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        # UPX-compressed libraries have to be unpacked on every start
+        upx=False,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
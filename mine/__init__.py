@@ -0,0 +1,5 @@
+# Launcher metadata, read by registry.py without importing the package
+GAME_TITLE = "Minesweeper"
+GAME_MODULE = "mine"
+GAME_CLASS = "Minesweeper"
+GAME_THUMBNAIL = "thumbnail.png"
@@ -0,0 +1,242 @@
+import argparse
+import os
+import random
+import time
+import tkinter as tk
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+try:
+    from .board import ChunkedBoard, MineBoard
+    from .generator import find_board
+    from .marathon import MarathonGame
+    from .mine import Minesweeper
+    from .solver import analyze, best_move
+except ImportError:
+    from board import ChunkedBoard, MineBoard
+    from generator import find_board
+    from marathon import MarathonGame
+    from mine import Minesweeper
+    from solver import analyze, best_move
+
+# Standard difficulty levels: rows, cols, mines
+LEVELS = {
+    "beginner": (9, 9, 10),
+    "intermediate": (16, 16, 40),
+    "expert": (16, 30, 99),
+}
+
+def bench_build(size=100, restarts=5):
+    # Board build and restart time for both render modes (needs a display)
+    root = tk.Tk()
+    game = Minesweeper(root)
+    game.rows_var.set(str(size))
+    game.cols_var.set(str(size))
+    game.mine_var.set(str(size * size // 6))
+
+    print(f"{size}x{size} board")
+    for use_canvas in (True, False):
+        game.use_canvas.set(use_canvas)
+        start = time.perf_counter()
+        game.restart_game()
+        root.update()
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(restarts):
+            game.restart_game()
+            root.update()
+        restart = (time.perf_counter() - start) / restarts
+
+        mode = "canvas" if use_canvas else "buttons"
+        print(f"  {mode:<8} build {build * 1000:8.1f} ms   restart {restart * 1000:8.1f} ms")
+    root.destroy()
+
+def bench_flags(size=100, rounds=3):
+    # Flag toggles per second through the game, both render modes (needs
+    # a display). Every cell is flagged and unflagged once per round
+    root = tk.Tk()
+    game = Minesweeper(root)
+    game.rows_var.set(str(size))
+    game.cols_var.set(str(size))
+    game.mine_var.set(str(size * size // 6))
+
+    print(f"{size}x{size} board")
+    for use_canvas in (True, False):
+        game.use_canvas.set(use_canvas)
+        game.restart_game()
+        root.update()
+
+        start = time.perf_counter()
+        for _ in range(rounds * 2):
+            for row in range(size):
+                for col in range(size):
+                    game.toggle_flag(row, col)
+            root.update()
+        elapsed = time.perf_counter() - start
+
+        mode = "canvas" if use_canvas else "buttons"
+        toggles = rounds * 2 * size * size
+        print(f"  {mode:<8} {toggles / elapsed:12,.0f} toggles/s")
+    root.destroy()
+
+def bench_flood(size=1000, density=0.05):
+    # Mine placement and the largest single cascade, no display needed
+    board = MineBoard(size, size)
+    start = time.perf_counter()
+    board.place_mines(int(size * size * density))
+    place = time.perf_counter() - start
+
+    # Find the biggest zero region on a scratch board, then time a fresh
+    # reveal of it
+    mines = list(board.mine_indices())
+    best, best_size = None, 0
+    index = board.zero.find(1)
+    while index != -1:
+        if not board.revealed[index]:
+            opened = board.reveal(*divmod(index, size))
+            if len(opened) > best_size:
+                best, best_size = index, len(opened)
+        index = board.zero.find(1, index + 1)
+    if best is None:
+        print("no empty region to reveal")
+        return
+
+    board = MineBoard(size, size)
+    board.set_mines(mines)
+    start = time.perf_counter()
+    opened = board.reveal(*divmod(best, size))
+    reveal = time.perf_counter() - start
+
+    print(f"{size}x{size} board, {len(mines):,} mines")
+    print(f"  place mines {place * 1000:8.1f} ms")
+    print(f"  reveal      {reveal * 1000:8.1f} ms   {len(opened):,} cells")
+
+def bench_marathon(size=10000, density=0.16, clicks=2000, seed=1):
+    # Chunked board logic: open the start and then click safe cells all
+    # over the board, touching most chunks. No display needed
+    rng = random.Random(seed)
+    board = ChunkedBoard(size, size, density, seed=seed)
+    start = time.perf_counter()
+    board.start(size // 2, size // 2)
+    board.reveal(size // 2, size // 2)
+    for _ in range(clicks):
+        row, col = rng.randrange(size), rng.randrange(size)
+        if not board.is_mine(row, col):
+            board.reveal(row, col)
+    elapsed = time.perf_counter() - start
+
+    print(f"{size:,}x{size:,} board, {board.mine_count:,} mines")
+    print(f"  {clicks:,} clicks     {elapsed:8.2f} s   {board.revealed_count:,} cells open")
+    print(f"  chunks with mines {len(board.mines):,}, board buffers {board.memory_bytes() / 1e6:.1f} MB")
+
+def bench_scroll(size=10000, frames=300):
+    # Viewport redraw rate while scrolling diagonally (needs a display)
+    root = tk.Tk()
+    game = MarathonGame(root)
+    game.size_var.set(str(size))
+    game.setup_new_game()
+    root.update()
+
+    # Open a few cells so the viewport has items to recycle
+    for offset in range(0, 400, 40):
+        row, col = size // 2 + offset, size // 2 + offset
+        if not game.board.started:
+            game.board.start(row, col)
+        if not game.board.is_mine(row, col):
+            game.board.reveal(row, col)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.canvas.xview_scroll(1, 'units')
+        game.canvas.yview_scroll(1, 'units')
+        root.update()
+    elapsed = time.perf_counter() - start
+    print(f"  scrolling {frames / elapsed:8.1f} frames/s")
+    root.destroy()
+
+def play_solver(rows, cols, mines, rng):
+    # One game played by the solver with a safe first click. Returns
+    # (won, positions analyzed)
+    board = MineBoard(rows, cols)
+    first = best_move(board)[0]
+    board.place_mines(mines, rng, safe=first)
+    board.reveal(*divmod(first, cols))
+    positions = 0
+    while not board.won():
+        analysis = analyze(board, rng)
+        positions += 1
+        if analysis.safe:
+            for index in analysis.safe:
+                board.reveal(*divmod(index, cols))
+            continue
+        for index in analysis.mines:
+            if not board.flags[index]:
+                board.toggle_flag(*divmod(index, cols))
+        index = best_move(board, analysis)[0]
+        if board.mines[index]:
+            return False, positions
+        board.reveal(*divmod(index, cols))
+    return True, positions
+
+def bench_solver(games=200, seed=1):
+    # Solver speed and win rate at each standard level, no display needed
+    rng = random.Random(seed)
+    for name, (rows, cols, mines) in LEVELS.items():
+        wins = positions = 0
+        start = time.perf_counter()
+        for _ in range(games):
+            won, analyzed = play_solver(rows, cols, mines, rng)
+            wins += won
+            positions += analyzed
+        elapsed = time.perf_counter() - start
+        print(f"{name:<13} {rows}x{cols}/{mines:<3} win rate {wins / games:6.1%}   "
+              f"{positions / elapsed:8,.0f} positions/s")
+
+def bench_no_guess(boards=50, workers=None, seed=1):
+    # No-guess boards per second at each level across a process pool
+    workers = workers or os.cpu_count() or 1
+    rng = random.Random(seed)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for name, (rows, cols, mines) in LEVELS.items():
+            found = 0
+            start = time.perf_counter()
+            pending = set()
+            while found < boards:
+                while len(pending) < 2 * workers:
+                    pending.add(pool.submit(find_board, rows, cols, mines, None, rng.getrandbits(64)))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                found += sum(future.result() is not None for future in done)
+            elapsed = time.perf_counter() - start
+            for future in pending:
+                future.cancel()
+            print(f"{name:<13} {rows}x{cols}/{mines:<3} {found / elapsed:8.1f} boards/s with {workers} workers")
+
+def main():
+    parser = argparse.ArgumentParser(description="Minesweeper benchmarks")
+    parser.add_argument('--size', type=int, default=100)
+    parser.add_argument('--flood', action='store_true', help="time mine placement and flood fill only")
+    parser.add_argument('--flags', action='store_true', help="time flag toggles")
+    parser.add_argument('--marathon', action='store_true', help="marathon board logic and memory")
+    parser.add_argument('--scroll', action='store_true', help="marathon viewport scrolling")
+    parser.add_argument('--solver', action='store_true', help="solver speed and win rates")
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--no-guess', action='store_true', help="no-guess board generation rate")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    if args.no_guess:
+        bench_no_guess(workers=args.workers)
+    elif args.solver:
+        bench_solver(args.games)
+    elif args.marathon:
+        bench_marathon()
+    elif args.scroll:
+        bench_scroll()
+    elif args.flood:
+        bench_flood(args.size)
+    elif args.flags:
+        bench_flags(args.size)
+    else:
+        bench_build(args.size)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+import random
+from collections import OrderedDict, deque
+
+# counts[] value stored for a mine cell
+MINE = 9
+
+class MineBoard:
+    # Minesweeper state without any Tk: flat byte arrays indexed by
+    # row * cols + col
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.mine_count = 0
+
+        self.mines = bytearray(self.size)
+        self.counts = bytearray(self.size)
+        self.zero = bytearray(self.size)
+        self.revealed = bytearray(self.size)
+        self.flags = bytearray(self.size)
+
+        # Zero cells whose neighbors have already been opened
+        self.flooded = bytearray(self.size)
+
+        self.revealed_count = 0
+        self.flag_count = 0
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def neighbors(self, index):
+        row, col = divmod(index, self.cols)
+        for r in range(max(row - 1, 0), min(row + 2, self.rows)):
+            base = r * self.cols
+            for c in range(max(col - 1, 0), min(col + 2, self.cols)):
+                if r != row or c != col:
+                    yield base + c
+
+    def place_mines(self, count, rng=random, safe=None):
+        # Randomly place mines, never on the safe index if one is given
+        candidates = range(self.size)
+        if safe is not None:
+            candidates = [i for i in candidates if i != safe]
+        self.set_mines(rng.sample(candidates, count))
+
+    def set_mines(self, indices):
+        # Lay the given mines and precompute every cell's neighbor count once
+        rows, cols = self.rows, self.cols
+        mines = bytearray(self.size)
+        counts = bytearray(self.size)
+        for index in indices:
+            mines[index] = 1
+            row, col = divmod(index, cols)
+            for r in range(max(row - 1, 0), min(row + 2, rows)):
+                base = r * cols
+                for c in range(max(col - 1, 0), min(col + 2, cols)):
+                    counts[base + c] += 1
+        for index in indices:
+            counts[index] = MINE
+
+        self.mines = mines
+        self.counts = counts
+        self.zero = counts.translate(ZERO_TABLE)
+        self.mine_count = len(indices)
+
+    def reveal(self, row, col):
+        # Open a cell, flood-filling through zero cells, and return the
+        # newly revealed indices. Iterative scanline fill: each step opens
+        # a whole run of zero cells plus the rows around it using slice
+        # operations, so neither the stack nor Python loops grow per cell
+        start = self.index(row, col)
+        if self.revealed[start] or self.flags[start]:
+            return []
+        if not self.zero[start]:
+            self.revealed[start] = 1
+            self.revealed_count += 1
+            return [start]
+
+        cols, rows = self.cols, self.rows
+        zero, flooded, revealed, flags = self.zero, self.flooded, self.revealed, self.flags
+        opened = []
+        stack = [start]
+        while stack:
+            index = stack.pop()
+            if flooded[index]:
+                continue
+            row = index // cols
+            row_start = row * cols
+            row_end = row_start + cols
+
+            # Extend the run of zero cells left and right, flags block it
+            left = max(zero.rfind(0, row_start, index), flags.rfind(1, row_start, index)) + 1
+            left = max(left, row_start)
+            right = run_end(zero, flags, index, row_end)
+            flooded[left:right] = b'\x01' * (right - left)
+
+            # Open the run and its neighbors in the rows above and below
+            first_col = max(left - row_start - 1, 0)
+            last_col = min(right - row_start + 1, cols)
+            for r in (row - 1, row, row + 1):
+                if r < 0 or r >= rows:
+                    continue
+                s = r * cols + first_col
+                e = r * cols + last_col
+                fresh = revealed.count(0, s, e)
+                if fresh == e - s and flags.find(1, s, e) == -1:
+                    opened.extend(range(s, e))
+                    revealed[s:e] = b'\x01' * (e - s)
+                elif fresh:
+                    for i in range(s, e):
+                        if not revealed[i] and not flags[i]:
+                            revealed[i] = 1
+                            opened.append(i)
+
+                # One seed per run of zero cells touching this span
+                if r == row:
+                    continue
+                i = s
+                while i < e:
+                    i = zero.find(1, i, e)
+                    if i == -1:
+                        break
+                    if flags[i]:
+                        i += 1
+                        continue
+                    if not flooded[i]:
+                        stack.append(i)
+                    i = run_end(zero, flags, i, e)
+
+        self.revealed_count += len(opened)
+        return opened
+
+    def chord_cells(self, row, col):
+        # Hidden, unflagged neighbors of an open number whose flag count
+        # matches it; empty when the number is not satisfied yet
+        index = self.index(row, col)
+        count = self.counts[index]
+        if not self.revealed[index] or not 0 < count < MINE:
+            return []
+        around = list(self.neighbors(index))
+        if sum(self.flags[i] for i in around) != count:
+            return []
+        return [i for i in around if not self.revealed[i] and not self.flags[i]]
+
+    def toggle_flag(self, row, col):
+        # New flag state, or None when the cell is already open
+        index = self.index(row, col)
+        if self.revealed[index]:
+            return None
+        flagged = self.flags[index] ^ 1
+        self.flags[index] = flagged
+        self.flag_count += 1 if flagged else -1
+        return bool(flagged)
+
+    def won(self):
+        return self.revealed_count + self.mine_count == self.size
+
+    def mine_indices(self):
+        index = self.mines.find(1)
+        while index != -1:
+            yield index
+            index = self.mines.find(1, index + 1)
+
+def run_end(zero, flags, start, end):
+    # End of the run of unflagged zero cells beginning at start
+    stop = zero.find(0, start, end)
+    if stop == -1:
+        stop = end
+    flag = flags.find(1, start, stop)
+    return stop if flag == -1 else flag
+
+# bytes.translate table: 1 for a zero count, 0 for anything else
+ZERO_TABLE = bytes([1] + [0] * 255)
+
+# Marathon boards are split into CHUNK x CHUNK squares. Mines for a chunk
+# are drawn from the board seed the first time the chunk is needed, and
+# per-cell state is kept as bitsets only for chunks that have any
+CHUNK = 64
+CHUNK_CELLS = CHUNK * CHUNK
+CHUNK_BYTES = CHUNK_CELLS // 8
+CHUNK_ROW_BYTES = CHUNK // 8
+
+# Tables for chunk_counts: a byte of mine bits spread to one nibble per
+# bit, and hex digit characters back to their values
+SPREAD_NIBBLES = [sum(1 << 4 * i for i in range(8) if byte >> i & 1) for byte in range(256)]
+CHUNK_NIBBLE_MASK = (1 << 4 * CHUNK) - 1
+CHUNK_HEX_FORMAT = f'0{CHUNK}x'
+HEX_DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+# Neighbor counts are rebuilt on demand, only this many chunks are kept
+COUNT_CACHE_CHUNKS = 512
+
+def get_bit(bits, i):
+    return bits[i >> 3] >> (i & 7) & 1
+
+def set_bit(bits, i):
+    bits[i >> 3] |= 1 << (i & 7)
+
+def clear_bit(bits, i):
+    bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+class ChunkedBoard:
+    # Minesweeper state for boards far too large for flat arrays. Cells
+    # are addressed by (row, col); nothing is stored for untouched chunks
+    def __init__(self, rows, cols, density, seed=None):
+        self.rows = rows
+        self.cols = cols
+        self.density = density
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.chunk_rows = -(-rows // CHUNK)
+        self.chunk_cols = -(-cols // CHUNK)
+
+        self.mines = {}
+        self.revealed = {}
+        self.flags = {}
+        self.counts = OrderedDict()
+
+        self.mine_count = sum(self.chunk_quota(key) for key in range(self.chunk_rows * self.chunk_cols))
+        self.revealed_count = 0
+        self.flag_count = 0
+        self.started = False
+
+    def chunk_shape(self, key):
+        # Height and width of a chunk, smaller along the bottom and right edges
+        chunk_row, chunk_col = divmod(key, self.chunk_cols)
+        return (min(CHUNK, self.rows - chunk_row * CHUNK),
+                min(CHUNK, self.cols - chunk_col * CHUNK))
+
+    def chunk_quota(self, key):
+        height, width = self.chunk_shape(key)
+        return round(height * width * self.density)
+
+    def locate(self, row, col):
+        # (chunk key, cell index inside the chunk)
+        return ((row // CHUNK) * self.chunk_cols + col // CHUNK,
+                (row % CHUNK) * CHUNK + col % CHUNK)
+
+    def chunk_mines(self, key):
+        bits = self.mines.get(key)
+        if bits is None:
+            height, width = self.chunk_shape(key)
+            if height == CHUNK and width == CHUNK:
+                cells = range(CHUNK_CELLS)
+            else:
+                cells = [r * CHUNK + c for r in range(height) for c in range(width)]
+            # The same seed always lays the same mines in a chunk
+            rng = random.Random((self.seed << 32) | key)
+            bits = bytearray(CHUNK_BYTES)
+            for i in rng.sample(cells, self.chunk_quota(key)):
+                set_bit(bits, i)
+            self.mines[key] = bits
+        return bits
+
+    def is_mine(self, row, col):
+        key, i = self.locate(row, col)
+        return get_bit(self.chunk_mines(key), i)
+
+    def neighbors(self, row, col):
+        for r in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for c in range(max(col - 1, 0), min(col + 2, self.cols)):
+                if r != row or c != col:
+                    yield r, c
+
+    def start(self, row, col):
+        # First click: clear the mines around it so it opens an area
+        self.started = True
+        for r in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for c in range(max(col - 1, 0), min(col + 2, self.cols)):
+                key, i = self.locate(r, c)
+                bits = self.chunk_mines(key)
+                if get_bit(bits, i):
+                    clear_bit(bits, i)
+                    self.mine_count -= 1
+        self.counts.clear()
+
+    def mine_row(self, chunk_row, chunk_col, row):
+        # Mine bits of one row of a chunk (row may be -1 or CHUNK to reach
+        # into the chunk above or below), padded with the nearest column of
+        # the chunks on either side: bit 0 is column -1
+        chunk_row += row // CHUNK
+        row %= CHUNK
+        if not 0 <= chunk_row < self.chunk_rows:
+            return 0
+        start = row * CHUNK_ROW_BYTES
+        base = chunk_row * self.chunk_cols
+        mask = int.from_bytes(self.chunk_mines(base + chunk_col)[start:start + CHUNK_ROW_BYTES], 'little') << 1
+        if chunk_col > 0:
+            mask |= get_bit(self.chunk_mines(base + chunk_col - 1), row * CHUNK + CHUNK - 1)
+        if chunk_col + 1 < self.chunk_cols:
+            mask |= get_bit(self.chunk_mines(base + chunk_col + 1), row * CHUNK) << (CHUNK + 1)
+        return mask
+
+    def chunk_counts(self, key):
+        # Neighbor counts of one chunk. Each padded mine row is spread to
+        # one 4-bit field per cell, so three shifted adds sum a row's
+        # neighbors for all cells at once and three rows give the counts
+        counts = self.counts.get(key)
+        if counts is not None:
+            self.counts.move_to_end(key)
+            return counts
+
+        chunk_row, chunk_col = divmod(key, self.chunk_cols)
+        sums = []
+        for row in range(-1, CHUNK + 1):
+            mask = self.mine_row(chunk_row, chunk_col, row)
+            spread = 0
+            shift = 0
+            while mask:
+                spread |= SPREAD_NIBBLES[mask & 0xFF] << shift
+                mask >>= 8
+                shift += 32
+            sums.append(spread + (spread << 4) + (spread >> 4))
+
+        counts = bytearray(CHUNK_CELLS)
+        for row in range(CHUNK):
+            total = (sums[row] + sums[row + 1] + sums[row + 2]) >> 4 & CHUNK_NIBBLE_MASK
+            # One hex digit per cell, lowest column first
+            digits = format(total, CHUNK_HEX_FORMAT)[::-1].encode()
+            counts[row * CHUNK:(row + 1) * CHUNK] = digits.translate(HEX_DIGIT_VALUES)
+
+        self.counts[key] = counts
+        if len(self.counts) > COUNT_CACHE_CHUNKS:
+            self.counts.popitem(last=False)
+        return counts
+
+    def count(self, row, col):
+        key, i = self.locate(row, col)
+        return self.chunk_counts(key)[i]
+
+    def is_revealed(self, row, col):
+        key, i = self.locate(row, col)
+        bits = self.revealed.get(key)
+        return bits is not None and get_bit(bits, i)
+
+    def is_flagged(self, row, col):
+        key, i = self.locate(row, col)
+        bits = self.flags.get(key)
+        return bits is not None and get_bit(bits, i)
+
+    def reveal(self, row, col):
+        # Open a safe cell and flood through zero cells with a queue;
+        # returns the newly opened (row, col) pairs
+        if self.is_revealed(row, col) or self.is_flagged(row, col):
+            return []
+        opened = []
+        queue = deque([(row, col)])
+        while queue:
+            row, col = queue.popleft()
+            key, i = self.locate(row, col)
+            bits = self.revealed.get(key)
+            if bits is None:
+                bits = self.revealed[key] = bytearray(CHUNK_BYTES)
+            elif get_bit(bits, i):
+                continue
+            flags = self.flags.get(key)
+            if flags is not None and get_bit(flags, i):
+                continue
+            set_bit(bits, i)
+            opened.append((row, col))
+            if not self.chunk_counts(key)[i]:
+                for cell in self.neighbors(row, col):
+                    if not self.is_revealed(*cell):
+                        queue.append(cell)
+        self.revealed_count += len(opened)
+        return opened
+
+    def chord_cells(self, row, col):
+        # Same rule as MineBoard.chord_cells
+        count = self.count(row, col)
+        if not self.is_revealed(row, col) or not count:
+            return []
+        around = list(self.neighbors(row, col))
+        if sum(self.is_flagged(*cell) for cell in around) != count:
+            return []
+        return [cell for cell in around if not self.is_revealed(*cell) and not self.is_flagged(*cell)]
+
+    def toggle_flag(self, row, col):
+        if self.is_revealed(row, col):
+            return None
+        key, i = self.locate(row, col)
+        bits = self.flags.get(key)
+        if bits is None:
+            bits = self.flags[key] = bytearray(CHUNK_BYTES)
+        flagged = not get_bit(bits, i)
+        if flagged:
+            set_bit(bits, i)
+            self.flag_count += 1
+        else:
+            clear_bit(bits, i)
+            self.flag_count -= 1
+        return flagged
+
+    def won(self):
+        return self.revealed_count + self.mine_count == self.rows * self.cols
+
+    def memory_bytes(self):
+        # Bytes held in board buffers, for the status line and benchmarks
+        return CHUNK_BYTES * (len(self.mines) + len(self.revealed) + len(self.flags)) + CHUNK_CELLS * len(self.counts)
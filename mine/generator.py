@@ -0,0 +1,99 @@
+import os
+import queue
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+try:
+    from .board import MineBoard
+    from .solver import analyze, propagate, visible_constraints
+except ImportError:
+    from board import MineBoard
+    from solver import analyze, propagate, visible_constraints
+
+# Candidate boards one pool task tries before reporting back
+ATTEMPTS_PER_TASK = 20
+
+def candidate_mines(rng, rows, cols, mines, start):
+    # Random mines that leave the start cell, and its neighbors when there
+    # is room, free so the first click opens an area
+    row, col = divmod(start, cols)
+    opening = {r * cols + c
+               for r in range(max(row - 1, 0), min(row + 2, rows))
+               for c in range(max(col - 1, 0), min(col + 2, cols))}
+    if rows * cols - len(opening) < mines:
+        opening = {start}
+    cells = [i for i in range(rows * cols) if i not in opening]
+    return rng.sample(cells, mines)
+
+def solvable_without_guessing(rows, cols, mines, start):
+    # Play the board from start with the deterministic part of the solver:
+    # propagation first, exact enumeration and the mine count when that
+    # is stuck. True if every safe cell gets opened without a guess
+    board = MineBoard(rows, cols)
+    board.set_mines(mines)
+    board.reveal(*divmod(start, cols))
+    while not board.won():
+        known = {}
+        propagate(visible_constraints(board), known)
+        safe = [cell for cell, value in known.items() if not value]
+        if not safe:
+            analysis = analyze(board)
+            safe = analysis.safe if analysis.exact else []
+        if not safe:
+            return False
+        for cell in safe:
+            board.reveal(*divmod(cell, cols))
+    return True
+
+def find_board(rows, cols, mines, start=None, seed=None, attempts=ATTEMPTS_PER_TASK):
+    # Process pool task: (mine indices, start cell) of a no-guess board, or
+    # None if none of the attempts worked out. A random start is picked
+    # for every attempt unless one is given
+    rng = random.Random(seed)
+    for _ in range(attempts):
+        first = rng.randrange(rows * cols) if start is None else start
+        candidate = candidate_mines(rng, rows, cols, mines, first)
+        if solvable_without_guessing(rows, cols, candidate, first):
+            return candidate, first
+    return None
+
+class BoardSource:
+    # No-guess boards of one size for the GUI. A background thread keeps
+    # every pool worker busy testing candidates until reserve boards are
+    # waiting, so drawing one after a restart is instant
+    def __init__(self, rows, cols, mines, reserve=3, workers=None):
+        self.settings = (rows, cols, mines)
+        self.ready = queue.Queue(maxsize=reserve)
+        self.stopped = threading.Event()
+        self.workers = workers or min(os.cpu_count() or 1, 4)
+        threading.Thread(target=self.fill, daemon=True).start()
+
+    def fill(self):
+        rng = random.Random()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = set()
+            while not self.stopped.is_set():
+                while len(pending) < self.workers and not self.ready.full():
+                    pending.add(pool.submit(find_board, *self.settings, None, rng.getrandbits(64)))
+                if not pending:
+                    # Reserve is full, wait for a draw
+                    self.stopped.wait(0.1)
+                    continue
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    board = future.result()
+                    if board is not None and not self.ready.full():
+                        self.ready.put(board)
+            for future in pending:
+                future.cancel()
+
+    def draw(self):
+        # (mine indices, start cell), or None while nothing is ready yet
+        try:
+            return self.ready.get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.stopped.set()
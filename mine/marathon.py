@@ -0,0 +1,298 @@
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+try:
+    from .board import CHUNK, ChunkedBoard
+    from .mine import NUMBER_COLORS
+except ImportError:
+    from board import CHUNK, ChunkedBoard
+    from mine import NUMBER_COLORS
+
+# Visible part of the board; the rest is never drawn
+VIEW_WIDTH = 900
+VIEW_HEIGHT = 600
+CELL_SIZE = 20
+
+# Arrow keys scroll this many cells
+KEY_SCROLL_CELLS = 5
+
+HIDDEN_COLOR = '#BDBDBD'
+REVEALED_COLOR = 'lightgray'
+LINE_COLOR = '#7B7B7B'
+
+class MarathonGame:
+    # Minesweeper on boards of 10,000 x 10,000 cells and more. The canvas
+    # scroll region covers the whole board, but items only exist for open,
+    # flagged or exploded cells inside the viewport
+    def __init__(self, master):
+        self.master = master
+        self.master.title("Minesweeper Marathon")
+
+        settings_frame = tk.Frame(self.master)
+        settings_frame.pack(pady=5)
+
+        tk.Label(settings_frame, text="Size:", font=('Arial', 12)).pack(side=tk.LEFT, padx=5)
+        self.size_var = tk.StringVar(value="10000")
+        ttk.Spinbox(
+            settings_frame,
+            from_=100,
+            to=100000,
+            increment=1000,
+            width=7,
+            textvariable=self.size_var
+        ).pack(side=tk.LEFT)
+
+        # Below about 12% the empty regions start joining into one huge
+        # cascade, so lower densities are not offered
+        tk.Label(settings_frame, text="Mines %:", font=('Arial', 12)).pack(side=tk.LEFT, padx=5)
+        self.density_var = tk.StringVar(value="16")
+        ttk.Spinbox(
+            settings_frame,
+            from_=12,
+            to=40,
+            width=4,
+            textvariable=self.density_var
+        ).pack(side=tk.LEFT)
+
+        tk.Button(
+            settings_frame,
+            text="Restart Game",
+            command=self.setup_new_game
+        ).pack(side=tk.LEFT, padx=10)
+
+        view_frame = tk.Frame(self.master, bd=3, relief=tk.SUNKEN)
+        view_frame.pack(padx=10, pady=10)
+        self.canvas = tk.Canvas(
+            view_frame,
+            width=VIEW_WIDTH,
+            height=VIEW_HEIGHT,
+            bg=HIDDEN_COLOR,
+            highlightthickness=0
+        )
+        self.x_scroll = tk.Scrollbar(view_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.y_scroll = tk.Scrollbar(view_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        # Every view change goes through these, which is where redraws start
+        self.canvas.configure(xscrollcommand=self.on_x_scroll, yscrollcommand=self.on_y_scroll)
+        self.canvas.grid(row=0, column=0)
+        self.x_scroll.grid(row=1, column=0, sticky='ew')
+        self.y_scroll.grid(row=0, column=1, sticky='ns')
+
+        self.status_label = tk.Label(self.master, text="", font=('Arial', 12))
+        self.status_label.pack(pady=5)
+
+        # Left click opens, right click flags, middle drag pans
+        self.canvas.bind('<Button-1>', self.on_left_click)
+        self.canvas.bind('<Button-3>', self.on_right_click)
+        self.canvas.bind('<ButtonPress-2>', lambda e: self.canvas.scan_mark(e.x, e.y))
+        self.canvas.bind('<B2-Motion>', lambda e: self.canvas.scan_dragto(e.x, e.y, gain=1))
+        self.canvas.bind('<MouseWheel>', self.on_wheel)
+        self.canvas.bind('<Shift-MouseWheel>', self.on_shift_wheel)
+        self.canvas.bind('<Button-4>', lambda e: self.canvas.yview_scroll(-KEY_SCROLL_CELLS, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.canvas.yview_scroll(KEY_SCROLL_CELLS, 'units'))
+        self.master.bind('<Left>', lambda e: self.canvas.xview_scroll(-KEY_SCROLL_CELLS, 'units'))
+        self.master.bind('<Right>', lambda e: self.canvas.xview_scroll(KEY_SCROLL_CELLS, 'units'))
+        self.master.bind('<Up>', lambda e: self.canvas.yview_scroll(-KEY_SCROLL_CELLS, 'units'))
+        self.master.bind('<Down>', lambda e: self.canvas.yview_scroll(KEY_SCROLL_CELLS, 'units'))
+
+        # Drawn cells: (row, col) -> (rect, text), and the grid line span
+        self.items = {}
+        self.grid_span = None
+        self.redraw_id = None
+
+        self.setup_new_game()
+
+    def setup_new_game(self):
+        try:
+            size = min(max(int(self.size_var.get()), 100), 100000)
+        except ValueError:
+            size = 10000
+        try:
+            density = min(max(int(self.density_var.get()), 12), 40)
+        except ValueError:
+            density = 16
+        self.size_var.set(str(size))
+        self.density_var.set(str(density))
+
+        self.board = ChunkedBoard(size, size, density / 100)
+        self.game_over = False
+
+        self.canvas.delete('all')
+        self.items = {}
+        self.grid_span = None
+        extent = size * CELL_SIZE
+        self.canvas.configure(
+            scrollregion=(0, 0, extent, extent),
+            xscrollincrement=CELL_SIZE,
+            yscrollincrement=CELL_SIZE
+        )
+
+        # Start in the middle of the board
+        self.canvas.xview_moveto(0.5 - VIEW_WIDTH / extent / 2)
+        self.canvas.yview_moveto(0.5 - VIEW_HEIGHT / extent / 2)
+        self.schedule_redraw()
+        self.update_status()
+
+    def on_x_scroll(self, first, last):
+        self.x_scroll.set(first, last)
+        self.schedule_redraw()
+
+    def on_y_scroll(self, first, last):
+        self.y_scroll.set(first, last)
+        self.schedule_redraw()
+
+    def on_wheel(self, event):
+        self.canvas.yview_scroll(-KEY_SCROLL_CELLS if event.delta > 0 else KEY_SCROLL_CELLS, 'units')
+
+    def on_shift_wheel(self, event):
+        self.canvas.xview_scroll(-KEY_SCROLL_CELLS if event.delta > 0 else KEY_SCROLL_CELLS, 'units')
+
+    def schedule_redraw(self):
+        # Many scroll events in a row only cost one redraw
+        if self.redraw_id is None:
+            self.redraw_id = self.master.after_idle(self.redraw)
+
+    def visible_cells(self):
+        # (first row, last row, first col, last col) of the viewport, inclusive
+        x = self.canvas.canvasx(0)
+        y = self.canvas.canvasy(0)
+        first_row = max(int(y // CELL_SIZE), 0)
+        first_col = max(int(x // CELL_SIZE), 0)
+        last_row = min(int((y + VIEW_HEIGHT) // CELL_SIZE), self.board.rows - 1)
+        last_col = min(int((x + VIEW_WIDTH) // CELL_SIZE), self.board.cols - 1)
+        return first_row, last_row, first_col, last_col
+
+    def redraw(self):
+        self.redraw_id = None
+        first_row, last_row, first_col, last_col = self.visible_cells()
+        self.draw_grid(first_row, last_row, first_col, last_col)
+
+        # Drop items that scrolled out of view
+        for cell in [cell for cell in self.items
+                     if not (first_row <= cell[0] <= last_row and first_col <= cell[1] <= last_col)]:
+            self.canvas.delete(*self.items.pop(cell))
+
+        # Only chunks that hold open or flagged cells need a look
+        board = self.board
+        for chunk_row in range(first_row // CHUNK, last_row // CHUNK + 1):
+            for chunk_col in range(first_col // CHUNK, last_col // CHUNK + 1):
+                key = chunk_row * board.chunk_cols + chunk_col
+                if key not in board.revealed and key not in board.flags and not self.game_over:
+                    continue
+                rows = range(max(first_row, chunk_row * CHUNK), min(last_row, chunk_row * CHUNK + CHUNK - 1) + 1)
+                cols = range(max(first_col, chunk_col * CHUNK), min(last_col, chunk_col * CHUNK + CHUNK - 1) + 1)
+                for row in rows:
+                    for col in cols:
+                        if (row, col) not in self.items:
+                            self.draw_cell(row, col)
+
+    def draw_grid(self, first_row, last_row, first_col, last_col):
+        # Grid lines are redrawn only when the visible cell range changes
+        span = (first_row, last_row, first_col, last_col)
+        if span == self.grid_span:
+            return
+        self.grid_span = span
+        self.canvas.delete('grid')
+        top, bottom = first_row * CELL_SIZE, (last_row + 1) * CELL_SIZE
+        left, right = first_col * CELL_SIZE, (last_col + 1) * CELL_SIZE
+        for row in range(first_row, last_row + 2):
+            self.canvas.create_line(left, row * CELL_SIZE, right, row * CELL_SIZE, fill=LINE_COLOR, tags='grid')
+        for col in range(first_col, last_col + 2):
+            self.canvas.create_line(col * CELL_SIZE, top, col * CELL_SIZE, bottom, fill=LINE_COLOR, tags='grid')
+        self.canvas.tag_lower('grid')
+
+    def draw_cell(self, row, col):
+        # Create the items of one cell if it is anything but plain hidden
+        board = self.board
+        if board.is_revealed(row, col):
+            fill, count = REVEALED_COLOR, board.count(row, col)
+            text, color = (str(count), NUMBER_COLORS[count - 1]) if count else ('', 'black')
+        elif board.is_flagged(row, col):
+            fill, text, color = 'yellow', '🚩', 'black'
+        elif self.game_over and board.is_mine(row, col):
+            fill, text, color = 'red', '💣', 'black'
+        else:
+            return
+        x, y = col * CELL_SIZE, row * CELL_SIZE
+        rect = self.canvas.create_rectangle(x, y, x + CELL_SIZE, y + CELL_SIZE, fill=fill, outline=LINE_COLOR)
+        label = self.canvas.create_text(
+            x + CELL_SIZE / 2, y + CELL_SIZE / 2,
+            text=text,
+            fill=color,
+            font=('Arial', CELL_SIZE // 2 - 1, 'bold')
+        )
+        self.items[(row, col)] = (rect, label)
+
+    def redraw_cells(self, cells):
+        # Refresh changed cells; those outside the viewport wait for a scroll
+        first_row, last_row, first_col, last_col = self.visible_cells()
+        for row, col in cells:
+            if first_row <= row <= last_row and first_col <= col <= last_col:
+                items = self.items.pop((row, col), None)
+                if items is not None:
+                    self.canvas.delete(*items)
+                self.draw_cell(row, col)
+
+    def event_cell(self, event):
+        row = int(self.canvas.canvasy(event.y) // CELL_SIZE)
+        col = int(self.canvas.canvasx(event.x) // CELL_SIZE)
+        if 0 <= row < self.board.rows and 0 <= col < self.board.cols:
+            return row, col
+        return None
+
+    def on_left_click(self, event):
+        cell = self.event_cell(event)
+        if cell is None or self.game_over:
+            return
+        board = self.board
+        if board.is_flagged(*cell):
+            return
+        if not board.started:
+            board.start(*cell)
+
+        if board.is_revealed(*cell):
+            cells = board.chord_cells(*cell)
+        else:
+            cells = [cell]
+        if any(board.is_mine(*c) for c in cells):
+            self.game_over = True
+            self.canvas.delete('all')
+            self.items = {}
+            self.grid_span = None
+            self.redraw()
+            self.update_status()
+            messagebox.showinfo("Game Over", "You hit a mine!")
+            return
+
+        opened = []
+        for row, col in cells:
+            opened += board.reveal(row, col)
+        self.redraw_cells(opened)
+        self.update_status()
+
+        if board.won():
+            self.game_over = True
+            messagebox.showinfo("Congratulations", "You won!")
+
+    def on_right_click(self, event):
+        cell = self.event_cell(event)
+        if cell is None or self.game_over:
+            return
+        if self.board.toggle_flag(*cell) is not None:
+            self.redraw_cells([cell])
+            self.update_status()
+
+    def update_status(self):
+        board = self.board
+        self.status_label.config(
+            text=f"Mines: {board.mine_count - board.flag_count:,}   "
+                 f"Open: {board.revealed_count:,} of {board.rows * board.cols - board.mine_count:,}"
+        )
+
+def new_game():
+    root = tk.Tk()
+    game = MarathonGame(root)
+    return root
+
+if __name__ == "__main__":
+    root = new_game()
+    root.mainloop()
@@ -1,23 +1,259 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-import random 
+
+try:
+    from .board import MineBoard
+    from .generator import BoardSource
+    from .solver import analyze, best_move
+except ImportError:
+    from board import MineBoard
+    from generator import BoardSource
+    from solver import analyze, best_move
+
+# Colors for the numbers 1-8
+NUMBER_COLORS = ['blue', 'green', 'red', 'purple', 'maroon', 'turquoise', 'black', 'gray']
+
+# Hint highlight colors
+HINT_SAFE_COLOR = 'lightgreen'
+HINT_MINE_COLOR = 'orange'
+HINT_GUESS_COLOR = 'khaki'
+
+# Delay between auto-play moves in milliseconds
+AUTOPLAY_MS = 150
+
+# How often to look for a no-guess board while one is being generated
+BOARD_POLL_MS = 50
+
+# Largest visible canvas area, bigger boards scroll
+MAX_VIEW_WIDTH = 900
+MAX_VIEW_HEIGHT = 600
+
+class ButtonBoard:
+    # One tk.Button per cell, the classic look
+    def __init__(self, game, parent):
+        self.game = game
+        self.parent = parent
+        self.game_frame = None
+        self.rows = self.cols = 0
+
+    def build(self, rows, cols):
+        if self.game_frame is not None and (rows, cols) == (self.rows, self.cols):
+            # Same size: reset the existing buttons instead of recreating them
+            for cell in self.game.cells.values():
+                cell.config(text='', relief=tk.RAISED, bg=self.default_bg, fg='black')
+            return
+
+        if self.game_frame is not None:
+            self.game_frame.destroy()
+        self.rows, self.cols = rows, cols
+        self.game.cells = {}
+
+        # Create game frame
+        self.game_frame = tk.Frame(
+            self.parent,
+            bd=3,
+            relief=tk.SUNKEN
+        )
+        self.game_frame.pack(padx=10, pady=10)
+
+        # Create cells
+        for i in range(rows):
+            for j in range(cols):
+                cell = tk.Button(
+                    self.game_frame,
+                    width=2,
+                    height=1,
+                    command=lambda row=i, col=j: self.game.on_click(row, col)
+                )
+                cell.grid(row=i, column=j)
+                # Each button knows its own cell, no lookup on right-click
+                cell.bind('<Button-3>', lambda e, row=i, col=j: self.game.toggle_flag(row, col))
+                self.game.cells[(i, j)] = cell
+        self.default_bg = self.game.cells[(0, 0)].cget('bg')
+
+    def show_revealed(self, cells, counts):
+        # Apply a whole cascade of newly revealed cells in one pass
+        for index in cells:
+            button = self.game.cells[divmod(index, self.cols)]
+            adjacent_mines = counts[index]
+            if adjacent_mines > 0:
+                # Show number of adjacent mines
+                button.config(relief=tk.SUNKEN, text=str(adjacent_mines), fg=NUMBER_COLORS[adjacent_mines-1])
+            else:
+                button.config(relief=tk.SUNKEN, bg='lightgray')
+
+    def show_flag(self, row, col, flagged):
+        if flagged:
+            self.game.cells[(row, col)].config(text='🚩', bg='yellow')
+        else:
+            self.game.cells[(row, col)].config(text='', bg=self.default_bg)
+
+    def show_mine(self, row, col):
+        self.game.cells[(row, col)].config(text='💣', bg='red')
+
+    def show_hint(self, row, col, color):
+        self.game.cells[(row, col)].config(bg=color)
+
+    def destroy(self):
+        if self.game_frame is not None:
+            self.game_frame.destroy()
+        self.game.cells = {}
+
+class CanvasBoard:
+    # Whole board on one Canvas. Hidden cells are just the background and
+    # grid lines; a cell gets its own rectangle and text item the first
+    # time it changes, and keeps them across restarts
+    HIDDEN_COLOR = '#BDBDBD'
+    REVEALED_COLOR = 'lightgray'
+    LINE_COLOR = '#7B7B7B'
+
+    def __init__(self, game, parent):
+        self.game = game
+        self.rows = self.cols = 0
+        self.items = {}
+
+        self.game_frame = tk.Frame(parent, bd=3, relief=tk.SUNKEN)
+        self.game_frame.pack(padx=10, pady=10)
+        self.canvas = tk.Canvas(
+            self.game_frame,
+            bg=self.HIDDEN_COLOR,
+            highlightthickness=0
+        )
+        self.x_scroll = tk.Scrollbar(self.game_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.y_scroll = tk.Scrollbar(self.game_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(xscrollcommand=self.x_scroll.set, yscrollcommand=self.y_scroll.set)
+        self.canvas.grid(row=0, column=0)
+
+        # Clicks are mapped to cells by arithmetic, not by widget lookup
+        self.canvas.bind('<Button-1>', self.on_left_click)
+        self.canvas.bind('<Button-3>', self.on_right_click)
+
+    def build(self, rows, cols):
+        if (rows, cols) == (self.rows, self.cols):
+            # Same size: hide the cell items, nothing new is created
+            self.canvas.itemconfigure('cell', state='hidden')
+            return
+
+        self.canvas.delete('all')
+        self.items = {}
+        self.rows, self.cols = rows, cols
+
+        size = self.game.cell_size
+        width, height = cols * size, rows * size
+        self.canvas.configure(
+            width=min(width, MAX_VIEW_WIDTH),
+            height=min(height, MAX_VIEW_HEIGHT),
+            scrollregion=(0, 0, width, height)
+        )
+
+        # Grid lines for the whole board
+        for i in range(rows + 1):
+            self.canvas.create_line(0, i * size, width, i * size, fill=self.LINE_COLOR, tags='grid')
+        for j in range(cols + 1):
+            self.canvas.create_line(j * size, 0, j * size, height, fill=self.LINE_COLOR, tags='grid')
+
+        # Only show scrollbars when the board does not fit
+        if width > MAX_VIEW_WIDTH:
+            self.x_scroll.grid(row=1, column=0, sticky='ew')
+        else:
+            self.x_scroll.grid_remove()
+        if height > MAX_VIEW_HEIGHT:
+            self.y_scroll.grid(row=0, column=1, sticky='ns')
+        else:
+            self.y_scroll.grid_remove()
+
+    def cell_items(self, row, col):
+        # The rectangle and text item of a cell, created on first use
+        key = row * self.cols + col
+        items = self.items.get(key)
+        if items is None:
+            size = self.game.cell_size
+            x, y = col * size, row * size
+            rect = self.canvas.create_rectangle(
+                x, y, x + size, y + size,
+                outline=self.LINE_COLOR,
+                tags='cell'
+            )
+            text = self.canvas.create_text(
+                x + size / 2, y + size / 2,
+                font=('Arial', max(size // 2 - 2, 6), 'bold'),
+                tags='cell'
+            )
+            items = self.items[key] = (rect, text)
+        return items
+
+    def show_revealed(self, cells, counts):
+        # Apply a whole cascade of newly revealed cells in one pass
+        itemconfigure = self.canvas.itemconfigure
+        for index in cells:
+            rect, text = self.cell_items(*divmod(index, self.cols))
+            itemconfigure(rect, fill=self.REVEALED_COLOR, state='normal')
+            adjacent_mines = counts[index]
+            if adjacent_mines > 0:
+                itemconfigure(
+                    text,
+                    text=str(adjacent_mines),
+                    fill=NUMBER_COLORS[adjacent_mines-1],
+                    state='normal'
+                )
+            else:
+                itemconfigure(text, state='hidden')
+
+    def show_flag(self, row, col, flagged):
+        rect, text = self.cell_items(row, col)
+        if flagged:
+            self.canvas.itemconfigure(rect, fill='yellow', state='normal')
+            self.canvas.itemconfigure(text, text='🚩', fill='black', state='normal')
+        else:
+            self.canvas.itemconfigure(rect, state='hidden')
+            self.canvas.itemconfigure(text, state='hidden')
+
+    def show_mine(self, row, col):
+        rect, text = self.cell_items(row, col)
+        self.canvas.itemconfigure(rect, fill='red', state='normal')
+        self.canvas.itemconfigure(text, text='💣', fill='black', state='normal')
+
+    def show_hint(self, row, col, color):
+        rect, text = self.cell_items(row, col)
+        self.canvas.itemconfigure(rect, fill=color, state='normal')
+
+    def event_cell(self, event):
+        size = self.game.cell_size
+        row = int(self.canvas.canvasy(event.y) // size)
+        col = int(self.canvas.canvasx(event.x) // size)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def on_left_click(self, event):
+        cell = self.event_cell(event)
+        if cell is not None:
+            self.game.on_click(*cell)
+
+    def on_right_click(self, event):
+        cell = self.event_cell(event)
+        if cell is not None:
+            self.game.toggle_flag(*cell)
+
+    def destroy(self):
+        self.game_frame.destroy()
 
 class Minesweeper:
     def __init__(self, master):
         self.master = master
         self.master.title("Minesweeper")
-        
+
         # Create settings frame
         self.settings_frame = tk.Frame(self.master)
         self.settings_frame.pack(pady=5)
-        
+
         # Create mine count selector
         tk.Label(
             self.settings_frame,
             text="Number of Mines:",
             font=('Arial', 12)
         ).pack(side=tk.LEFT, padx=5)
-        
+
         self.mine_var = tk.StringVar(value="15")
         self.mine_entry = ttk.Spinbox(
             self.settings_frame,
@@ -27,7 +263,46 @@ class Minesweeper:
             textvariable=self.mine_var
         )
         self.mine_entry.pack(side=tk.LEFT, padx=5)
-        
+
+        # Create board size selectors
+        tk.Label(
+            self.settings_frame,
+            text="Rows:",
+            font=('Arial', 12)
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.rows_var = tk.StringVar(value="10")
+        ttk.Spinbox(
+            self.settings_frame,
+            from_=5,
+            to=200,
+            width=4,
+            textvariable=self.rows_var
+        ).pack(side=tk.LEFT)
+
+        tk.Label(
+            self.settings_frame,
+            text="Cols:",
+            font=('Arial', 12)
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.cols_var = tk.StringVar(value="10")
+        ttk.Spinbox(
+            self.settings_frame,
+            from_=5,
+            to=200,
+            width=4,
+            textvariable=self.cols_var
+        ).pack(side=tk.LEFT)
+
+        # Canvas rendering scales to large boards, buttons are the classic look
+        self.use_canvas = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            self.settings_frame,
+            text="Canvas board",
+            variable=self.use_canvas
+        ).pack(side=tk.LEFT, padx=5)
+
         # Create restart button
         self.restart_button = tk.Button(
             self.settings_frame,
@@ -35,15 +310,82 @@ class Minesweeper:
             command=self.restart_game
         )
         self.restart_button.pack(side=tk.LEFT, padx=10)
-        
+
+        # Solver help: one hint at a time, or let it play
+        tk.Button(
+            self.settings_frame,
+            text="Hint",
+            command=self.show_hint
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.autoplay = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self.settings_frame,
+            text="Auto-play",
+            variable=self.autoplay,
+            command=self.toggle_autoplay
+        ).pack(side=tk.LEFT, padx=5)
+        self.autoplay_id = None
+
+        # Boards that never need a guess, generated in the background
+        self.no_guess = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self.settings_frame,
+            text="No guessing",
+            variable=self.no_guess,
+            command=self.restart_game
+        ).pack(side=tk.LEFT, padx=5)
+        self.board_source = None
+        self.board_poll_id = None
+        self.master.bind('<Destroy>', self.on_destroy, add='+')
+
+        # Huge boards get their own window with a scrolling viewport
+        tk.Button(
+            self.settings_frame,
+            text="Marathon",
+            command=self.open_marathon
+        ).pack(side=tk.LEFT)
+
+        # Holds whichever board view is in use, above the mine counter
+        self.board_holder = tk.Frame(self.master)
+        self.board_holder.pack()
+        self.board_view = None
+        self.cells = {}
+
+        # Create mine counter
+        self.mine_label = tk.Label(
+            self.master,
+            text="",
+            font=('Arial', 16)
+        )
+        self.mine_label.pack(pady=5)
+
+        self.hint_label = tk.Label(
+            self.master,
+            text="",
+            font=('Arial', 12)
+        )
+        self.hint_label.pack(pady=(0, 5))
+        self.hint = None
+
         # Game settings
         self.rows = 10
         self.cols = 10
         self.cell_size = 30
-        
+
         self.setup_new_game()
 
     def setup_new_game(self):
+        # Get board size from the entries
+        try:
+            self.rows = min(max(int(self.rows_var.get()), 5), 200)
+            self.cols = min(max(int(self.cols_var.get()), 5), 200)
+        except ValueError:
+            self.rows = self.cols = 10
+        self.rows_var.set(str(self.rows))
+        self.cols_var.set(str(self.cols))
+        self.mine_entry.configure(to=self.rows * self.cols - 1)
+
         # Get number of mines from entry
         try:
             self.mines = min(int(self.mine_var.get()), self.rows * self.cols - 1)
@@ -51,157 +393,235 @@ class Minesweeper:
         except ValueError:
             self.mines = 15
             self.mine_var.set("15")
-        
+
         # Game state
-        self.cells = {}
-        self.mine_locations = set()
-        self.revealed = set()
-        self.flags = set()
+        self.board = MineBoard(self.rows, self.cols)
         self.game_over = False
-        
-        # Create or clear the game board
-        if hasattr(self, 'game_frame'):
-            self.game_frame.destroy()
-        
-        # Create the game board
+        self.hint = None
+        self.hint_label.config(text="")
+
+        # Create or reuse the game board
         self.create_board()
-        self.place_mines()
-        
-        # Bind right-click
-        self.master.bind('<Button-3>', self.on_right_click)
+
+        # Mines are laid once the board is ready or on the first click,
+        # so the first click is never a mine
+        self.mines_placed = False
+        self.start_cell = None
+        if self.board_poll_id is not None:
+            self.master.after_cancel(self.board_poll_id)
+            self.board_poll_id = None
+        if self.no_guess.get():
+            settings = (self.rows, self.cols, self.mines)
+            if self.board_source is None or self.board_source.settings != settings:
+                if self.board_source is not None:
+                    self.board_source.close()
+                self.board_source = BoardSource(*settings)
+            self.take_board()
+        elif self.board_source is not None:
+            self.board_source.close()
+            self.board_source = None
 
     def create_board(self):
-        # Create game frame
-        self.game_frame = tk.Frame(
-            self.master,
-            bd=3,
-            relief=tk.SUNKEN
-        )
-        self.game_frame.pack(padx=10, pady=10)
-        
-        # Create cells
-        for i in range(self.rows):
-            for j in range(self.cols):
-                cell = tk.Button(
-                    self.game_frame,
-                    width=2,
-                    height=1,
-                    command=lambda row=i, col=j: self.on_click(row, col)
-                )
-                cell.grid(row=i, column=j)
-                self.cells[(i, j)] = cell
+        # Keep the current view when the render mode has not changed
+        view_class = CanvasBoard if self.use_canvas.get() else ButtonBoard
+        if not isinstance(self.board_view, view_class):
+            if self.board_view is not None:
+                self.board_view.destroy()
+            self.board_view = view_class(self, self.board_holder)
+        self.board_view.build(self.rows, self.cols)
 
-        # Create mine counter
-        if hasattr(self, 'mine_label'):
-            self.mine_label.destroy()
-            
-        self.mine_label = tk.Label(
-            self.master,
-            text=f"Mines: {self.mines}",
-            font=('Arial', 16)
-        )
-        self.mine_label.pack(pady=5)
+        # Update mine counter
+        self.mine_label.config(text=f"Mines: {self.mines}")
+
+    def place_mines(self, safe):
+        # Randomly place mines away from the first click; neighbor counts
+        # are computed once here
+        self.board.place_mines(self.mines, safe=safe)
+        self.mines_placed = True
 
-    def place_mines(self):
-        # Randomly place mines
-        positions = [(i, j) for i in range(self.rows) for j in range(self.cols)]
-        self.mine_locations = set(random.sample(positions, self.mines))
-
-    def get_neighbors(self, row, col):
-        neighbors = []
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if i == 0 and j == 0:
-                    continue
-                new_row, new_col = row + i, col + j
-                if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
-                    neighbors.append((new_row, new_col))
-        return neighbors
-
-    def count_adjacent_mines(self, row, col):
-        count = 0
-        for neighbor in self.get_neighbors(row, col):
-            if neighbor in self.mine_locations:
-                count += 1
-        return count
+    def take_board(self):
+        # Use a prepared no-guess board, polling until one is ready
+        self.board_poll_id = None
+        board = self.board_source.draw()
+        if board is None:
+            self.hint_label.config(text="Generating a no-guess board...")
+            self.board_poll_id = self.master.after(BOARD_POLL_MS, self.take_board)
+            return
+        mines, start = board
+        self.board.set_mines(mines)
+        self.mines_placed = True
+        self.start_cell = start
+        self.show_start()
+
+    def show_start(self):
+        # The board is only guaranteed guess-free from its start cell
+        row, col = divmod(self.start_cell, self.cols)
+        self.hint = (row, col)
+        self.board_view.show_hint(row, col, HINT_SAFE_COLOR)
+        self.hint_label.config(text="Start at the green cell")
+
+    def on_destroy(self, event):
+        # <Destroy> fires for every child widget too, only react to the window
+        if event.widget is not self.master:
+            return
+        # Pending callbacks would otherwise run against destroyed widgets
+        for after_id in (self.autoplay_id, self.board_poll_id):
+            if after_id is not None:
+                self.master.after_cancel(after_id)
+        self.autoplay_id = self.board_poll_id = None
+        if self.board_source is not None:
+            self.board_source.close()
 
     def on_click(self, row, col):
         if self.game_over:
             return
-        
-        if (row, col) in self.flags:
+        self.clear_hint()
+
+        index = self.board.index(row, col)
+        if self.board.flags[index]:
+            return
+        if not self.mines_placed:
+            if self.no_guess.get():
+                # Still waiting for the generator
+                return
+            self.place_mines(index)
+        elif (self.start_cell is not None and index != self.start_cell
+              and self.board.revealed.find(1) == -1):
+            # A no-guess board has to be opened at its start cell
+            self.show_start()
+            return
+
+        if self.board.revealed[index]:
+            # Clicking an open number chords: open its other neighbors
+            # once all of its mines are flagged
+            cells = self.board.chord_cells(row, col)
+        else:
+            cells = [index]
+        if not cells:
             return
-        
-        if (row, col) in self.mine_locations:
+
+        if any(self.board.mines[i] for i in cells):
             self.game_over = True
             self.reveal_all_mines()
             messagebox.showinfo("Game Over", "You hit a mine!")
             return
-        
-        self.reveal_cell(row, col)
-        
-        if len(self.revealed) + len(self.mine_locations) == self.rows * self.cols:
+
+        self.reveal_cells(cells)
+        self.check_won()
+
+    def check_won(self):
+        if self.board.won():
             self.game_over = True
             messagebox.showinfo("Congratulations", "You won!")
 
-    def reveal_cell(self, row, col):
-        if (row, col) in self.revealed:
+    def reveal_cells(self, cells):
+        # Iterative flood fill in the board, then one batch of view updates
+        opened = []
+        for index in cells:
+            opened += self.board.reveal(*divmod(index, self.cols))
+        if opened:
+            self.board_view.show_revealed(opened, self.board.counts)
+
+    def toggle_flag(self, row, col):
+        if self.game_over:
             return
-        
-        self.revealed.add((row, col))
-        
-        # Count adjacent mines
-        adjacent_mines = self.count_adjacent_mines(row, col)
-        
-        # Update button appearance
-        button = self.cells[(row, col)]
-        button.config(relief=tk.SUNKEN)
-        
-        if adjacent_mines > 0:
-            # Show number of adjacent mines
-            colors = ['blue', 'green', 'red', 'purple', 'maroon', 'turquoise', 'black', 'gray']
-            button.config(text=str(adjacent_mines), fg=colors[adjacent_mines-1])
-        else:
-            # If no adjacent mines, reveal neighbors
-            button.config(bg='lightgray')
-            for neighbor in self.get_neighbors(row, col):
-                if neighbor not in self.revealed:
-                    self.reveal_cell(*neighbor)
+        self.clear_hint()
 
-    def on_right_click(self, event):
+        flagged = self.board.toggle_flag(row, col)
+        if flagged is None:
+            return
+        self.board_view.show_flag(row, col, flagged)
+
+        # Update mine counter
+        self.mine_label.config(text=f"Mines: {self.mines - self.board.flag_count}")
+
+    def reveal_all_mines(self):
+        for index in self.board.mine_indices():
+            self.board_view.show_mine(*divmod(index, self.cols))
+
+    def show_hint(self):
         if self.game_over:
             return
-        
-        # Get the widget under cursor
-        widget = event.widget.winfo_containing(event.x_root, event.y_root)
-        
-        # Find the cell coordinates
-        for (row, col), cell in self.cells.items():
-            if cell == widget:
-                if (row, col) in self.revealed:
+        self.clear_hint()
+        move = best_move(self.board, start=self.start_cell)
+        if move is None:
+            return
+        index, action, probability = move
+        row, col = divmod(index, self.cols)
+        if action == 'flag':
+            text, color = f"({row + 1}, {col + 1}) is a mine", HINT_MINE_COLOR
+        elif probability == 0:
+            text, color = f"({row + 1}, {col + 1}) is safe", HINT_SAFE_COLOR
+        else:
+            text = f"No safe cell: ({row + 1}, {col + 1}) is the best guess, {probability:.0%} mine"
+            color = HINT_GUESS_COLOR
+        self.hint = (row, col)
+        self.board_view.show_hint(row, col, color)
+        self.hint_label.config(text=text)
+
+    def clear_hint(self):
+        if self.hint is None:
+            return
+        row, col = self.hint
+        self.hint = None
+        self.hint_label.config(text="")
+        index = self.board.index(row, col)
+        if not self.board.revealed[index] and not self.board.flags[index]:
+            # Back to the plain hidden look
+            self.board_view.show_flag(row, col, False)
+
+    def toggle_autoplay(self):
+        if self.autoplay.get():
+            if self.autoplay_id is None:
+                self.autoplay_id = self.master.after(AUTOPLAY_MS, self.autoplay_step)
+        elif self.autoplay_id is not None:
+            self.master.after_cancel(self.autoplay_id)
+            self.autoplay_id = None
+
+    def autoplay_step(self):
+        # Open every certain-safe cell at once, else flag certain mines,
+        # else take the solver's best guess
+        self.autoplay_id = None
+        if not self.autoplay.get() or self.game_over:
+            self.autoplay.set(False)
+            return
+        self.clear_hint()
+        board = self.board
+        analysis = analyze(board)
+        if analysis.safe:
+            for index in analysis.safe:
+                if board.flags[index]:
+                    # A wrong flag would block the reveal
+                    self.toggle_flag(*divmod(index, self.cols))
+            self.reveal_cells(analysis.safe)
+            self.check_won()
+        else:
+            unflagged = [index for index in analysis.mines if not board.flags[index]]
+            for index in unflagged:
+                self.toggle_flag(*divmod(index, self.cols))
+            if not unflagged:
+                move = best_move(board, analysis, self.start_cell)
+                if move is None:
+                    self.autoplay.set(False)
                     return
-                
-                if (row, col) in self.flags:
-                    # Remove flag
-                    self.flags.remove((row, col))
-                    cell.config(text='', bg='SystemButtonFace')
-                else:
-                    # Add flag
-                    self.flags.add((row, col))
-                    cell.config(text='🚩', bg='yellow')
-                
-                # Update mine counter
-                self.mine_label.config(text=f"Mines: {self.mines - len(self.flags)}")
-                break
+                self.on_click(*divmod(move[0], self.cols))
 
-    def reveal_all_mines(self):
-        for row, col in self.mine_locations:
-            button = self.cells[(row, col)]
-            button.config(text='💣', bg='red')
+        if self.game_over:
+            self.autoplay.set(False)
+        else:
+            self.autoplay_id = self.master.after(AUTOPLAY_MS, self.autoplay_step)
 
     def restart_game(self):
         self.setup_new_game()
 
+    def open_marathon(self):
+        # Imported here so the normal game does not pay for it
+        try:
+            from .marathon import MarathonGame
+        except ImportError:
+            from marathon import MarathonGame
+        MarathonGame(tk.Toplevel(self.master))
+
 def new_game():
     root = tk.Tk()
     game = Minesweeper(root)
@@ -209,4 +629,4 @@ def new_game():
 
 if __name__ == "__main__":
     root = new_game()
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
@@ -0,0 +1,338 @@
+import random
+from math import comb
+
+# Minesweeper solver working only from what a player can see: the numbers
+# on open cells and the total mine count. Certain cells come from
+# constraint propagation (single constraints and the subset rule); the
+# rest of the frontier is split into independent components, each of
+# which is enumerated exactly, or sampled when it is too big, and the
+# components are combined through the global mine count.
+
+# Search nodes allowed per component before falling back to sampling
+ENUMERATION_BUDGET = 200000
+
+# Random solutions drawn for a component that is too big to enumerate
+SAMPLES = 200
+
+# Components above this many cells get the local estimate only
+MAX_SEARCH_CELLS = 400
+
+class BudgetExceeded(Exception):
+    pass
+
+class Analysis:
+    # What the solver knows about a position
+    def __init__(self):
+        self.safe = []
+        self.mines = []
+        self.probabilities = {}  # frontier cell -> mine probability
+        self.interior = []  # hidden cells next to no number
+        self.interior_probability = 0.0
+        self.exact = True
+
+def visible_constraints(board):
+    # (hidden neighbors, number) for every open number with hidden neighbors
+    revealed, counts = board.revealed, board.counts
+    constraints = []
+    index = revealed.find(1)
+    while index != -1:
+        count = counts[index]
+        if count:
+            hidden = [n for n in board.neighbors(index) if not revealed[n]]
+            if hidden:
+                constraints.append((hidden, count))
+        index = revealed.find(1, index + 1)
+    return constraints
+
+def propagate(constraints, known):
+    # Settle every cell a single constraint or a pair of nested ones
+    # decides, recording them in known (cell -> 0 or 1). Returns the
+    # remaining constraints over unknown cells
+    pending = [(frozenset(cells), count) for cells, count in constraints]
+    while True:
+        reduced = {}
+        changed = False
+        for cells, count in pending:
+            unknown = frozenset(c for c in cells if c not in known)
+            count -= sum(known[c] for c in cells if c in known)
+            if not unknown:
+                continue
+            if count == 0 or count == len(unknown):
+                value = 1 if count else 0
+                for cell in unknown:
+                    known[cell] = value
+                changed = True
+            else:
+                reduced[unknown] = count
+        pending = list(reduced.items())
+        if changed:
+            continue
+
+        # Subset rule: if A is inside B, B - A holds count(B) - count(A)
+        by_cell = {}
+        for cells, count in pending:
+            for cell in cells:
+                by_cell.setdefault(cell, []).append((cells, count))
+        derived = {}
+        for cells, count in pending:
+            seen = set()
+            for cell in cells:
+                for other, other_count in by_cell[cell]:
+                    if other in seen or other is cells or not cells < other:
+                        continue
+                    seen.add(other)
+                    rest = other - cells
+                    if rest not in reduced and rest not in derived:
+                        derived[rest] = other_count - count
+        if not derived:
+            return pending
+        pending += derived.items()
+
+def components(constraints):
+    # Split constraints into groups that share no cells
+    parent = {}
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for cells, count in constraints:
+        cells = list(cells)
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        root = find(cells[0])
+        for cell in cells[1:]:
+            parent[find(cell)] = root
+
+    groups = {}
+    for cells, count in constraints:
+        groups.setdefault(find(next(iter(cells))), []).append((cells, count))
+    return list(groups.values())
+
+class ComponentSearch:
+    # Backtracking over one component. Cells are numbered in the order
+    # they are met walking the constraints, so constraints close early
+    def __init__(self, constraints):
+        self.cells = []
+        position = {}
+        for cells, count in constraints:
+            for cell in sorted(cells):
+                if cell not in position:
+                    position[cell] = len(self.cells)
+                    self.cells.append(cell)
+
+        self.need = [count for cells, count in constraints]
+        self.free = [len(cells) for cells, count in constraints]
+        self.cell_constraints = [[] for _ in self.cells]
+        for i, (cells, count) in enumerate(constraints):
+            for cell in cells:
+                self.cell_constraints[position[cell]].append(i)
+
+        self.assignment = [0] * len(self.cells)
+        # mines in the component -> [solutions, per-cell mine counts]
+        self.totals = {}
+        self.nodes = 0
+        self.budget = ENUMERATION_BUDGET
+        self.rng = None
+
+    def assign(self, i, value):
+        ok = True
+        for c in self.cell_constraints[i]:
+            self.free[c] -= 1
+            self.need[c] -= value
+            if self.need[c] < 0 or self.need[c] > self.free[c]:
+                ok = False
+        self.assignment[i] = value
+        return ok
+
+    def unassign(self, i, value):
+        for c in self.cell_constraints[i]:
+            self.free[c] += 1
+            self.need[c] += value
+        self.assignment[i] = 0
+
+    def record(self, mines):
+        entry = self.totals.get(mines)
+        if entry is None:
+            entry = self.totals[mines] = [0, [0] * len(self.cells)]
+        entry[0] += 1
+        per_cell = entry[1]
+        for i, value in enumerate(self.assignment):
+            if value:
+                per_cell[i] += 1
+
+    def search(self, i, mines):
+        # Every solution when rng is None, else the first one in a random
+        # value order; True once a sample has been recorded
+        self.nodes += 1
+        if self.nodes > self.budget:
+            raise BudgetExceeded()
+        if i == len(self.cells):
+            if any(self.need):
+                # Every cell is placed, so each constraint must be met exactly
+                return False
+            self.record(mines)
+            return self.rng is not None
+        values = (0, 1)
+        if self.rng is not None and self.rng.random() < 0.5:
+            values = (1, 0)
+        for value in values:
+            feasible = self.assign(i, value)
+            try:
+                if feasible and self.search(i + 1, mines + value):
+                    return True
+            finally:
+                # Also on BudgetExceeded, so the next sample starts clean
+                self.unassign(i, value)
+        return False
+
+    def enumerate(self):
+        self.search(0, 0)
+
+    def sample(self, rng, count=SAMPLES):
+        self.totals = {}
+        self.rng = rng
+        for _ in range(count):
+            self.nodes = 0
+            try:
+                self.search(0, 0)
+            except BudgetExceeded:
+                pass
+
+def local_estimate(constraints):
+    # Fallback for huge components: each cell takes the highest density
+    # among the constraints it is in
+    probabilities = {}
+    for cells, count in constraints:
+        p = count / len(cells)
+        for cell in cells:
+            probabilities[cell] = max(probabilities.get(cell, 0.0), p)
+    return probabilities
+
+def convolve(a, b):
+    result = {}
+    for m, x in a.items():
+        for n, y in b.items():
+            result[m + n] = result.get(m + n, 0) + x * y
+    return result
+
+def analyze(board, rng=random):
+    analysis = Analysis()
+    known = {}
+    constraints = propagate(visible_constraints(board), known)
+    analysis.safe = sorted(cell for cell, value in known.items() if not value)
+    analysis.mines = sorted(cell for cell, value in known.items() if value)
+
+    frontier = set()
+    for cells, count in constraints:
+        frontier |= cells
+    revealed = board.revealed
+    analysis.interior = [i for i in range(board.size)
+                         if not revealed[i] and i not in known and i not in frontier]
+    interior = len(analysis.interior)
+    remaining = board.mine_count - len(analysis.mines)
+
+    # Solutions of each component, by number of mines
+    searches = []
+    for group in components(constraints):
+        search = ComponentSearch(group)
+        if len(search.cells) > MAX_SEARCH_CELLS:
+            analysis.exact = False
+            analysis.probabilities.update(local_estimate(group))
+            continue
+        try:
+            search.enumerate()
+        except BudgetExceeded:
+            analysis.exact = False
+            search.sample(rng)
+        searches.append(search)
+
+    # Weight of every frontier mine total, given how the interior cells
+    # can hold the mines that are left
+    distributions = [{m: entry[0] for m, entry in search.totals.items()} for search in searches]
+    prefix = [{0: 1}]
+    for dist in distributions:
+        prefix.append(convolve(prefix[-1], dist))
+    suffix = [{0: 1}]
+    for dist in reversed(distributions):
+        suffix.append(convolve(suffix[-1], dist))
+    suffix.reverse()
+
+    def interior_ways(mines):
+        left = remaining - mines
+        return comb(interior, left) if 0 <= left <= interior else 0
+
+    total = 0
+    interior_mines = 0
+    for mines, ways in prefix[-1].items():
+        weight = ways * interior_ways(mines)
+        total += weight
+        interior_mines += weight * (remaining - mines)
+
+    if not total:
+        # Inconsistent with the mine count (only possible after sampling)
+        for search in searches:
+            for i, cell in enumerate(search.cells):
+                solutions = sum(entry[0] for entry in search.totals.values())
+                mines = sum(entry[1][i] for entry in search.totals.values())
+                analysis.probabilities[cell] = mines / solutions if solutions else 0.5
+        analysis.interior_probability = remaining / interior if interior else 0.0
+        return analysis
+
+    for k, search in enumerate(searches):
+        others = convolve(prefix[k], suffix[k + 1])
+        mine_weights = [0] * len(search.cells)
+        for mines, (solutions, per_cell) in search.totals.items():
+            weight = sum(ways * interior_ways(mines + rest) for rest, ways in others.items())
+            if weight:
+                for i, count in enumerate(per_cell):
+                    mine_weights[i] += count * weight
+        for i, cell in enumerate(search.cells):
+            probability = mine_weights[i] / total
+            analysis.probabilities[cell] = probability
+            # The mine count can settle cells propagation could not
+            if search.totals and analysis.exact:
+                if mine_weights[i] == 0:
+                    analysis.safe.append(cell)
+                elif mine_weights[i] == total:
+                    analysis.mines.append(cell)
+    if interior:
+        analysis.interior_probability = interior_mines / (total * interior)
+    return analysis
+
+def best_move(board, analysis=None, start=None):
+    # (cell index, 'reveal' or 'flag', mine probability) of the move a
+    # careful player would make, or None when nothing is left to do.
+    # start is a cell known to be safe, opened first while nothing is open
+    if start is not None and board.revealed.find(1) == -1:
+        return start, 'reveal', 0.0
+    if analysis is None:
+        analysis = analyze(board)
+    if analysis.safe:
+        return analysis.safe[0], 'reveal', 0.0
+    if analysis.mines:
+        unflagged = [cell for cell in analysis.mines if not board.flags[cell]]
+        if unflagged:
+            return unflagged[0], 'flag', 1.0
+
+    best = None
+    for cell, probability in analysis.probabilities.items():
+        if board.flags[cell]:
+            continue
+        if best is None or probability < best[2]:
+            best = (cell, 'reveal', probability)
+    if analysis.interior and (best is None or analysis.interior_probability < best[2]):
+        best = (pick_interior(board, analysis.interior), 'reveal', analysis.interior_probability)
+    return best
+
+def pick_interior(board, interior):
+    # Corners open up the most often, then edges, then anything
+    last_row, last_col = board.rows - 1, board.cols - 1
+
+    def score(index):
+        row, col = divmod(index, board.cols)
+        return (row in (0, last_row)) + (col in (0, last_col))
+
+    return max(interior, key=score)
@@ -0,0 +1,5 @@
+# Launcher metadata, read by registry.py without importing the package
+GAME_TITLE = "Ping Pong"
+GAME_MODULE = "pingpong"
+GAME_CLASS = "PingPongGame"
+GAME_THUMBNAIL = "thumbnail.png"
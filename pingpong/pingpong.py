@@ -158,6 +158,10 @@ class PingPongGame:
         self.ball_speed_y *= 1.05
 
     def update(self):
+        # Stop the loop once the window hosting the game is closed
+        if not self.canvas.winfo_exists():
+            return
+
         if self.game_running:
             self.canvas.move(self.ball, self.ball_speed_x, self.ball_speed_y)
             self.check_collision()
@@ -0,0 +1,186 @@
+import importlib
+import json
+import os
+import sys
+
+# Directory the launcher and the bundled games live in
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Extra directory scanned for drop-in games
+GAMES_DIR = os.path.join(BASE_DIR, "games")
+
+# Installed distributions can register games under this entry point group,
+# e.g. "My Game = mypackage.game:MyGame"
+ENTRY_POINT_GROUP = "tkinter_games"
+
+MANIFEST_VERSION = 1
+
+def cache_dir():
+    # Per-user cache directory, created on demand. None when it cannot be
+    # created; every cache is optional
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(base, 'tkinter-games')
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
+def manifest_path():
+    directory = cache_dir()
+    return os.path.join(directory, 'manifest.json') if directory else None
+
+def read_metadata(init_path):
+    # Pull the GAME_* constants out of a package __init__ without importing
+    # it. ast is only needed when a package changed, so it is not imported
+    # on every start
+    import ast
+    with open(init_path, 'rb') as f:
+        tree = ast.parse(f.read(), init_path)
+
+    metadata = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Constant):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id.startswith('GAME_'):
+                metadata[target.id] = node.value.value
+    if 'GAME_TITLE' not in metadata or 'GAME_CLASS' not in metadata:
+        return None
+    return metadata
+
+def game_from_package(root, prefix, name, metadata):
+    module = metadata.get('GAME_MODULE', name)
+    return {
+        "title": metadata['GAME_TITLE'],
+        "module": f"{prefix}{name}.{module}",
+        "class": metadata['GAME_CLASS'],
+        "dir": os.path.join(root, name),
+        "thumbnail": metadata.get('GAME_THUMBNAIL')
+    }
+
+def scan_root(root, prefix, cached):
+    # Rescan one directory, re-reading only packages whose __init__ changed
+    packages = {}
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return packages
+
+    old_packages = cached.get("packages", {}) if cached else {}
+    for entry in entries:
+        if not entry.is_dir() or entry.name.startswith(('.', '_')):
+            continue
+        init_path = os.path.join(entry.path, '__init__.py')
+        try:
+            stat = os.stat(init_path)
+        except OSError:
+            continue
+
+        old = old_packages.get(entry.name)
+        if old and old["mtime"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+            packages[entry.name] = old
+            continue
+
+        try:
+            metadata = read_metadata(init_path)
+        except (OSError, SyntaxError, ValueError):
+            metadata = None
+        packages[entry.name] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "game": game_from_package(root, prefix, entry.name, metadata) if metadata else None
+        }
+    return packages
+
+def site_fingerprint():
+    # Installing or removing a distribution touches its site directory
+    fingerprint = []
+    for path in sys.path:
+        try:
+            fingerprint.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            pass
+    return fingerprint
+
+def scan_entry_points():
+    from importlib.metadata import entry_points
+    games = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        module, _, attr = entry_point.value.partition(':')
+        games.append({
+            "title": entry_point.name,
+            "module": module.strip(),
+            "class": attr.strip(),
+            "dir": None,
+            "thumbnail": None
+        })
+    return games
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+def save_manifest(path, manifest):
+    # Write to a temporary file first so a crash never leaves half a manifest
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+def discover(roots=None, use_entry_points=True, path=None):
+    # Map of title -> game info, refreshed from disk only where mtimes changed
+    if roots is None:
+        roots = [(BASE_DIR, ""), (GAMES_DIR, "games.")]
+    if path is None:
+        path = manifest_path()
+
+    # Without a cache directory every start rescans
+    manifest = load_manifest(path) if path else {}
+    cached_roots = manifest.get("roots", {})
+    new_manifest = {"version": MANIFEST_VERSION, "roots": {}}
+
+    games = []
+    for root, prefix in roots:
+        packages = scan_root(root, prefix, cached_roots.get(root))
+        new_manifest["roots"][root] = {"packages": packages}
+        games.extend(p["game"] for p in packages.values() if p["game"])
+
+    # A frozen bundle has no installed distributions to look through
+    if use_entry_points and not getattr(sys, 'frozen', False):
+        cached = manifest.get("entry_points")
+        fingerprint = site_fingerprint()
+        if cached and cached["fingerprint"] == fingerprint:
+            entry_games = cached["games"]
+        else:
+            entry_games = scan_entry_points()
+        new_manifest["entry_points"] = {"fingerprint": fingerprint, "games": entry_games}
+        games.extend(entry_games)
+
+    if path and new_manifest != manifest:
+        save_manifest(path, new_manifest)
+
+    # First source wins when two games share a title
+    catalog = {}
+    for game in sorted(games, key=lambda g: g["title"].lower()):
+        catalog.setdefault(game["title"], game)
+    return catalog
+
+def load_game_class(game_info):
+    # Import the game module on first use and return its main class
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    module = importlib.import_module(game_info["module"])
+    return getattr(module, game_info["class"])
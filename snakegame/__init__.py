@@ -0,0 +1,5 @@
+# Launcher metadata, read by registry.py without importing the package
+GAME_TITLE = "SnakeGame"
+GAME_MODULE = "snake"
+GAME_CLASS = "SnakeGame"
+GAME_THUMBNAIL = "thumbnail.png"
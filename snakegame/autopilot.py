@@ -0,0 +1,238 @@
+import heapq
+from collections import deque
+
+# Autopilot for SnakeEngine. While it is short the snake takes an A* path
+# to the food, but only if the tail can still be reached from the head
+# once the food is eaten, so it never walls itself in. When no such path
+# exists it falls back to a Hamiltonian cycle: it steps along the cycle
+# wherever that keeps the tail in reach until the body lies in cycle
+# order, from where moving along the cycle can never collide, and stays
+# on it. From then on it only cuts corners that keep that order, i.e.
+# jumps ahead on the cycle but never past the tail. If lining up takes
+# more than a lap of the board, A* gets another go.
+#
+# A board with an odd number of both rows and columns has no Hamiltonian
+# cycle; there the cycle skips the bottom left corner, and food in that
+# corner is fetched with a safe A* path when there is one.
+
+def hamiltonian_cycle(columns, rows):
+    # Cells in cycle order: along the top row, back and forth over the
+    # other columns, then up the first column to the start. Boards with an
+    # odd number of rows are transposed first when that makes them even
+    if rows % 2 and not columns % 2:
+        return [row * columns + col for col, row in
+                (divmod(cell, rows) for cell in hamiltonian_cycle(rows, columns))]
+    cells = [col for col in range(columns)]
+    zigzag_rows = rows - 1 if rows % 2 == 0 else rows - 3
+    for row in range(1, zigzag_rows + 1):
+        cols = range(columns - 1, 0, -1) if row % 2 else range(1, columns)
+        cells.extend(row * columns + col for col in cols)
+    if rows % 2:
+        # Both sides odd: the last two rows in vertical pairs from the
+        # right, leaving out the bottom left corner
+        for step, col in enumerate(range(columns - 1, 0, -1)):
+            pair = ((rows - 2) * columns + col, (rows - 1) * columns + col)
+            cells.extend(pair if step % 2 == 0 else reversed(pair))
+        cells.extend(row * columns for row in range(rows - 2, 0, -1))
+    else:
+        cells.extend(row * columns for row in range(rows - 1, 0, -1))
+    return cells
+
+class Autopilot:
+    def __init__(self, engine):
+        self.engine = engine
+        columns, rows = engine.columns, engine.rows
+        self.cycle = hamiltonian_cycle(columns, rows)
+        # cell -> index on the cycle and next cell on it, -1 for a cell left out
+        self.position = [-1] * (columns * rows)
+        self.successor = [-1] * (columns * rows)
+        for i, cell in enumerate(self.cycle):
+            self.position[cell] = i
+            self.successor[cell] = self.cycle[(i + 1) % len(self.cycle)]
+        self.neighbors = [self.cell_neighbors(cell) for cell in range(columns * rows)]
+        self.path = deque()
+        self.fallback = False
+        self.on_cycle = False
+        # Ticks spent trying to line up with the cycle
+        self.aligning = 0
+
+    def cell_neighbors(self, cell):
+        columns = self.engine.columns
+        row, col = divmod(cell, columns)
+        cells = []
+        if col > 0:
+            cells.append(cell - 1)
+        if col < columns - 1:
+            cells.append(cell + 1)
+        if row > 0:
+            cells.append(cell - columns)
+        if row < self.engine.rows - 1:
+            cells.append(cell + columns)
+        return cells
+
+    def direction_to(self, cell):
+        difference = cell - self.engine.body.head()
+        if difference == 1:
+            return 'right'
+        if difference == -1:
+            return 'left'
+        return 'down' if difference > 0 else 'up'
+
+    def choose(self):
+        # Direction for the next tick
+        engine = self.engine
+        body = engine.body
+        head = body.head()
+        food = engine.food
+
+        if self.on_cycle:
+            if self.position[food] != -1:
+                return self.direction_to(self.shortcut(head, food))
+            path = self.plan(food)
+            if path is None:
+                return self.direction_to(self.successor[head])
+            # A detour to the corner the cycle leaves out
+            self.on_cycle = False
+            self.path = deque(path)
+
+        # Keep following a planned path while it is still clear
+        if self.path and self.path[0] in self.neighbors[head] and not body.hits(self.path[0], self.path[0] == food):
+            return self.direction_to(self.path.popleft())
+        self.path.clear()
+
+        # A* again when lining up takes longer than a lap of the board
+        if self.aligning > len(self.cycle):
+            self.fallback = False
+        if not self.fallback:
+            path = self.plan(food)
+            if path is not None:
+                self.path = deque(path)
+                return self.direction_to(self.path.popleft())
+            self.fallback = True
+            self.aligning = 0
+        self.aligning += 1
+
+        # Along the cycle if that keeps the tail in reach, otherwise any
+        # move that does, until the body lies in cycle order
+        following = self.successor[head]
+        candidates = [cell for cell in self.neighbors[head] if not body.hits(cell, cell == food)]
+        candidates.sort(key=lambda cell: cell != following)
+        for cell in candidates:
+            if self.safe_after([cell], cell == food):
+                self.on_cycle = self.ordered_after(cell, cell == food)
+                return self.direction_to(cell)
+        if candidates:
+            return self.direction_to(candidates[0])
+        return engine.direction
+
+    def shortcut(self, head, food):
+        # The free neighbor that gets nearest the food along the cycle
+        # without passing the tail; the next cycle cell at worst
+        position = self.position
+        size = len(self.cycle)
+        body = self.engine.body
+        here = position[head]
+        room = (position[body.tail()] - here) % size
+        best = self.successor[head]
+        best_gap = (position[food] - position[best]) % size
+        for cell in self.neighbors[head]:
+            if body.occupied[cell] or position[cell] == -1:
+                continue
+            ahead = (position[cell] - here) % size
+            gap = (position[food] - position[cell]) % size
+            if 0 < ahead < room and gap < best_gap:
+                best, best_gap = cell, gap
+        return best
+
+    def plan(self, food):
+        # A* from the head to the food. A body cell counts as free from
+        # the tick its part of the tail has moved past. Returns the cells
+        # after the head, or None when there is no path or eating would
+        # cut the head off from the tail
+        body = self.engine.body
+        head = body.head()
+        length = len(body)
+        vacate = {cell: length - i for i, cell in enumerate(body.cells)}
+        columns = self.engine.columns
+        food_row, food_col = divmod(food, columns)
+
+        def estimate(cell):
+            row, col = divmod(cell, columns)
+            return abs(row - food_row) + abs(col - food_col)
+
+        came_from = {head: None}
+        steps = {head: 0}
+        frontier = [(estimate(head), 0, head)]
+        while frontier:
+            score, g, cell = heapq.heappop(frontier)
+            if cell == food:
+                break
+            if g > steps[cell]:
+                continue
+            for other in self.neighbors[cell]:
+                if vacate.get(other, 0) > g + 1:
+                    continue
+                if other not in steps or g + 1 < steps[other]:
+                    steps[other] = g + 1
+                    came_from[other] = cell
+                    heapq.heappush(frontier, (g + 1 + estimate(other), g + 1, other))
+        else:
+            return None
+
+        path = []
+        cell = food
+        while cell != head:
+            path.append(cell)
+            cell = came_from[cell]
+        path.reverse()
+        return path if self.safe_after(path, True) else None
+
+    def safe_after(self, path, grows):
+        # Whether the tail is still reachable from the head after following
+        # path, growing by one on its last cell when grows is set
+        body = self.engine.body
+        cells = deque(body.cells)
+        occupied = set(cells)
+        for i, cell in enumerate(path):
+            if not (grows and i == len(path) - 1):
+                occupied.discard(cells.pop())
+            cells.appendleft(cell)
+            occupied.add(cell)
+        if len(cells) >= self.engine.columns * self.engine.rows:
+            # The board is full, the game is won
+            return True
+
+        head, tail = cells[0], cells[-1]
+        seen = {head}
+        queue = deque([head])
+        while queue:
+            cell = queue.popleft()
+            for other in self.neighbors[cell]:
+                if other == tail:
+                    return True
+                if other not in seen and other not in occupied:
+                    seen.add(other)
+                    queue.append(other)
+        return False
+
+    def ordered_after(self, head, grows):
+        # Whether the body, with its head moved to head, lies on the cycle
+        # in order: every cell further behind the head along it than the
+        # one before
+        position = self.position
+        size = len(self.cycle)
+        cells = self.engine.body.cells
+        last = len(cells) if grows else len(cells) - 1
+        front = position[head]
+        if front == -1:
+            return False
+        behind = 0
+        for i in range(last):
+            here = position[cells[i]]
+            if here == -1:
+                return False
+            distance = (front - here) % size
+            if distance <= behind:
+                return False
+            behind = distance
+        return True
@@ -0,0 +1,206 @@
+import argparse
+import random
+import time
+import tkinter as tk
+from collections import deque
+
+try:
+    from .autopilot import Autopilot
+    from .body import SnakeBody
+    from .engine import SnakeEngine
+except ImportError:
+    from autopilot import Autopilot
+    from body import SnakeBody
+    from engine import SnakeEngine
+
+def cycle_cells(columns, rows):
+    # A closed path through every cell of a board with an even number of
+    # rows: along the top row, back and forth over the other columns, then
+    # up the first column to the start
+    cells = [col for col in range(columns)]
+    for row in range(1, rows):
+        cols = range(columns - 1, 0, -1) if row % 2 else range(1, columns)
+        cells.extend(row * columns + col for col in cols)
+    cells.extend(row * columns for row in range(rows - 1, 0, -1))
+    return cells
+
+def list_ticks(cycle, columns, length, ticks):
+    # The old list body: insert at the front, delete the tail and search
+    # a slice of the positions for the head
+    positions = [list(divmod(cell, columns)) for cell in reversed(cycle[:length])]
+    for tick in range(ticks):
+        head = cycle[(length + tick) % len(cycle)]
+        positions.insert(0, list(divmod(head, columns)))
+        del positions[-1]
+        if positions[0] in positions[1:]:
+            raise RuntimeError("the snake ran into itself")
+
+def body_ticks(cycle, columns, length, ticks):
+    body = SnakeBody(columns, len(cycle) // columns, reversed(cycle[:length]))
+    for tick in range(ticks):
+        head = cycle[(length + tick) % len(cycle)]
+        if body.hits(head):
+            raise RuntimeError("the snake ran into itself")
+        body.move(head)
+
+def bench_ticks(lengths=(3, 10, 100, 1000, 10000), ticks=20000, columns=128, rows=128):
+    # Per-tick cost of moving the body and checking it for the head, with
+    # the snake following a cycle over the whole board so it never dies
+    cycle = cycle_cells(columns, rows)
+    print(f"{columns}x{rows} board, head and collision updates only, no display")
+    print(f"  {'length':>7} {'list us/tick':>14} {'deque+grid us/tick':>20}")
+    for length in lengths:
+        # The list version gets fewer ticks once it turns slow
+        list_count = max(ticks * 10 // max(length, 10), 200)
+        start = time.perf_counter()
+        list_ticks(cycle, columns, length, list_count)
+        old = (time.perf_counter() - start) / list_count
+        start = time.perf_counter()
+        body_ticks(cycle, columns, length, ticks)
+        new = (time.perf_counter() - start) / ticks
+        print(f"  {length:7} {old * 1e6:14.2f} {new * 1e6:20.2f}")
+
+def bench_spawn(fills=(0.0, 0.5, 0.9, 0.99, 0.999), spawns=20000, columns=128, rows=128, seed=5):
+    # Cost of one food spawn with the board partly covered by the snake:
+    # random cells until a free one against the free-cell index
+    rng = random.Random(seed)
+    cycle = cycle_cells(columns, rows)
+    print(f"{columns}x{rows} board, {spawns} spawns per fill level")
+    print(f"  {'fill':>7} {'rejection us':>13} {'tries':>7} {'free index us':>14}")
+    for fill in fills:
+        body = SnakeBody(columns, rows, cycle[:max(int(fill * len(cycle)), 1)])
+        tries = 0
+        start = time.perf_counter()
+        for _ in range(spawns):
+            cell = rng.randrange(columns * rows)
+            tries += 1
+            while body.occupied[cell]:
+                cell = rng.randrange(columns * rows)
+                tries += 1
+        rejection = (time.perf_counter() - start) / spawns
+        start = time.perf_counter()
+        for _ in range(spawns):
+            body.random_free(rng)
+        indexed = (time.perf_counter() - start) / spawns
+        print(f"  {100 * fill:6.1f}% {rejection * 1e6:13.2f} {tries / spawns:7.1f} {indexed * 1e6:14.2f}")
+
+def histogram(label, samples, edges=(0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0)):
+    # Text histogram of per-tick times in milliseconds
+    counts = [0] * (len(edges) + 1)
+    for sample in samples:
+        bucket = 0
+        while bucket < len(edges) and sample >= edges[bucket]:
+            bucket += 1
+        counts[bucket] += 1
+    ordered = sorted(samples)
+    print(f"  {label}: median {ordered[len(ordered) // 2]:.3f} ms, "
+          f"p99 {ordered[len(ordered) * 99 // 100]:.3f} ms")
+    widest = max(counts)
+    bounds = (0.0,) + edges
+    for bucket, count in enumerate(counts):
+        name = f">= {bounds[bucket]:.2f} ms" if bucket == len(edges) else f"< {edges[bucket]:.2f} ms"
+        print(f"    {name:>11} {count:6} {'#' * (40 * count // widest)}")
+
+def render_ticks(canvas, cycle, columns, length, ticks, recycle, space=4):
+    # Per-tick render time in ms of a snake following the cycle, either
+    # moving the tail square to the head or creating and deleting squares
+    squares = deque()
+    for cell in reversed(cycle[:length]):
+        row, col = divmod(cell, columns)
+        squares.append(canvas.create_rectangle(col * space, row * space, (col + 1) * space, (row + 1) * space,
+                                               fill="#00FF00", tag="snake"))
+    food = canvas.create_oval(0, 0, space, space, fill="#FF0000", tag="food")
+    times = []
+    for tick in range(ticks):
+        head = cycle[(length + tick) % len(cycle)]
+        row, col = divmod(head, columns)
+        box = (col * space, row * space, (col + 1) * space, (row + 1) * space)
+        start = time.perf_counter()
+        if recycle:
+            square = squares.pop()
+            canvas.coords(square, *box)
+            squares.appendleft(square)
+            if tick % 50 == 0:
+                canvas.coords(food, *box)
+        else:
+            squares.appendleft(canvas.create_rectangle(*box, fill="#00FF00"))
+            canvas.delete(squares.pop())
+            if tick % 50 == 0:
+                canvas.delete(food)
+                food = canvas.create_oval(*box, fill="#FF0000", tag="food")
+        canvas.update_idletasks()
+        times.append(1000 * (time.perf_counter() - start))
+    items = len(canvas.find_all())
+    canvas.delete(tk.ALL)
+    return times, items
+
+def bench_render(length=500, ticks=5000, columns=128, rows=128):
+    # Canvas cost per tick with and without item recycling (needs a display)
+    root = tk.Tk()
+    canvas = tk.Canvas(root, width=columns * 4, height=rows * 4, bg="#000000")
+    canvas.pack()
+    root.update()
+    cycle = cycle_cells(columns, rows)
+    print(f"snake of {length} squares, {ticks} ticks, food moved every 50 ticks")
+    for recycle, label in ((False, "create/delete"), (True, "recycled items")):
+        times, items = render_ticks(canvas, cycle, columns, length, ticks, recycle)
+        histogram(label, times)
+        print(f"    canvas items: {items} (snake length + 1 = {length + 1})")
+    root.destroy()
+
+def play_autopilot(columns, rows, seed, max_ticks):
+    # One headless game steered by the autopilot; returns the engine and
+    # the seconds it took
+    engine = SnakeEngine(columns, rows, seed=seed)
+    autopilot = Autopilot(engine)
+    start = time.perf_counter()
+    while not engine.over and engine.ticks < max_ticks:
+        engine.change_direction(autopilot.choose())
+        engine.step()
+    return engine, time.perf_counter() - start
+
+def bench_simulate(games=10, columns=35, rows=25, first_seed=0, max_ticks=None):
+    # Autopilot games across seeds with no Tk at all. A game still going
+    # after max_ticks is counted as capped rather than left to run
+    if max_ticks is None:
+        max_ticks = 4 * (columns * rows) ** 2
+    print(f"{columns}x{rows} board, {games} autopilot games, cap {max_ticks} ticks")
+    print(f"  {'seed':>5} {'result':>7} {'score':>6} {'ticks':>9} {'ticks/s':>10}")
+    total_ticks = 0
+    total_time = 0.0
+    results = {'won': 0, 'lost': 0, 'capped': 0}
+    for seed in range(first_seed, first_seed + games):
+        engine, elapsed = play_autopilot(columns, rows, seed, max_ticks)
+        result = 'won' if engine.won else 'lost' if engine.over else 'capped'
+        results[result] += 1
+        total_ticks += engine.ticks
+        total_time += elapsed
+        print(f"  {seed:5} {result:>7} {engine.score:6} {engine.ticks:9} {engine.ticks / elapsed:10,.0f}")
+    print(f"  won {results['won']}, lost {results['lost']}, capped {results['capped']}; "
+          f"{total_ticks / total_time:,.0f} ticks/s overall")
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake benchmarks")
+    parser.add_argument('--ticks', type=int, default=20000)
+    parser.add_argument('--spawn', action='store_true',
+                        help="food spawn cost against board fill")
+    parser.add_argument('--render', action='store_true',
+                        help="frame-time histogram of canvas updates (needs a display)")
+    parser.add_argument('--simulate', action='store_true',
+                        help="headless autopilot games across seeds")
+    parser.add_argument('--games', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0, help="first seed for --simulate")
+    parser.add_argument('--columns', type=int, default=35)
+    parser.add_argument('--rows', type=int, default=25)
+    args = parser.parse_args()
+    if args.simulate:
+        bench_simulate(args.games, args.columns, args.rows, args.seed)
+    elif args.render:
+        bench_render()
+    elif args.spawn:
+        bench_spawn()
+    else:
+        bench_ticks(ticks=args.ticks)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import random
+from array import array
+from collections import deque
+
+# Snake body without any Tk: the cells head first in a deque, plus one byte
+# per board cell marking the ones the body covers. Moving the head,
+# dropping the tail and testing a cell for the body all take the same time
+# whatever the length. A cell is row * columns + col.
+#
+# The cells the body does not cover are kept in an array too, with each
+# cell's slot in it, so a free cell leaves by swapping with the last one
+# and a uniformly random free cell is one index away however full the
+# board is.
+
+DIRECTIONS = {'left': (-1, 0), 'right': (1, 0), 'up': (0, -1), 'down': (0, 1)}
+
+class SnakeBody:
+    def __init__(self, columns, rows, cells):
+        self.columns = columns
+        self.rows = rows
+        self.cells = deque()
+        self.occupied = bytearray(columns * rows)
+        self.free = array('i', range(columns * rows))
+        self.slots = array('i', range(columns * rows))
+        for cell in cells:
+            self.cells.append(cell)
+            self.occupied[cell] = 1
+            self.take(cell)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def head(self):
+        return self.cells[0]
+
+    def tail(self):
+        return self.cells[-1]
+
+    def coords(self, cell):
+        # (col, row) of a cell
+        row, col = divmod(cell, self.columns)
+        return col, row
+
+    def next_cell(self, direction):
+        # Cell in front of the head, or None past a wall
+        col, row = self.coords(self.cells[0])
+        dx, dy = DIRECTIONS[direction]
+        col += dx
+        row += dy
+        if 0 <= col < self.columns and 0 <= row < self.rows:
+            return row * self.columns + col
+        return None
+
+    def hits(self, cell, grow=False):
+        # True if a head moving onto cell runs into the body. The tail
+        # moves out of the way on the same tick unless the snake grows
+        return bool(self.occupied[cell]) and (grow or cell != self.cells[-1])
+
+    def move(self, cell, grow=False):
+        # Put the head on cell; returns the tail cell that was let go, or
+        # None when the snake grows
+        free = self.free
+        slots = self.slots
+        tail = None
+        if not grow:
+            tail = self.cells.pop()
+            self.occupied[tail] = 0
+            if tail == cell:
+                # Chasing its own tail: the cell stays covered
+                self.cells.appendleft(cell)
+                self.occupied[cell] = 1
+                return tail
+            # The head takes the slot the tail leaves, so neither end of
+            # the free array moves
+            slot = slots[cell]
+            free[slot] = tail
+            slots[tail] = slot
+        else:
+            self.take(cell)
+        slots[cell] = -1
+        self.cells.appendleft(cell)
+        self.occupied[cell] = 1
+        return tail
+
+    def take(self, cell):
+        # Swap the cell with the last free one and drop it off the end
+        slot = self.slots[cell]
+        last = self.free[-1]
+        self.free[slot] = last
+        self.slots[last] = slot
+        self.free.pop()
+        self.slots[cell] = -1
+
+    def free_count(self):
+        return len(self.free)
+
+    def random_free(self, rng=random):
+        # Uniformly random cell outside the body, or None on a full board
+        if not self.free:
+            return None
+        return self.free[rng.randrange(len(self.free))]
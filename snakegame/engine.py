@@ -0,0 +1,59 @@
+import random
+
+try:
+    from .body import DIRECTIONS, SnakeBody
+except ImportError:
+    from body import DIRECTIONS, SnakeBody
+
+# One game of snake without Tk or timers: step() plays a tick, so the GUI
+# calls it from after() and benchmarks call it in a loop. Everything
+# random comes from the engine's own generator, so a seed replays a game.
+
+OPPOSITE = {'left': 'right', 'right': 'left', 'up': 'down', 'down': 'up'}
+
+class SnakeEngine:
+    def __init__(self, columns=35, rows=25, length=3, seed=None):
+        self.columns = columns
+        self.rows = rows
+        self.rng = random.Random(seed)
+        # Head first along the second row, moving right
+        self.body = SnakeBody(columns, rows, [columns + length - i for i in range(length)])
+        self.direction = 'right'
+        self.score = 0
+        self.ticks = 0
+        self.over = False
+        self.won = False
+        self.food = None
+        self.spawn_food()
+
+    def change_direction(self, direction):
+        # A snake cannot turn back on itself
+        if direction in DIRECTIONS and direction != OPPOSITE[self.direction]:
+            self.direction = direction
+
+    def spawn_food(self):
+        # Uniformly random over the free cells; None once the board is full
+        self.food = self.body.random_free(self.rng)
+
+    def check_collisions(self, head, grow):
+        # None is past a wall
+        return head is None or self.body.hits(head, grow)
+
+    def step(self):
+        # Play one tick. True when the snake ate; afterwards over and won
+        # tell whether the game ended
+        if self.over:
+            return False
+        head = self.body.next_cell(self.direction)
+        ate = head is not None and head == self.food
+        if self.check_collisions(head, ate):
+            self.over = True
+            return False
+        self.body.move(head, grow=ate)
+        self.ticks += 1
+        if ate:
+            self.score += 1
+            self.spawn_food()
+            if self.food is None:
+                self.over = self.won = True
+        return ate
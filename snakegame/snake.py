@@ -1,5 +1,12 @@
 import tkinter as tk
-import random
+from collections import deque
+
+try:
+    from .autopilot import Autopilot
+    from .engine import SnakeEngine
+except ImportError:
+    from autopilot import Autopilot
+    from engine import SnakeEngine
 
 class SnakeGame:
     def __init__(self, master):
@@ -18,7 +25,6 @@ class SnakeGame:
         self.BACKGROUND_COLOR = "#000000"
 
         # Game variables
-        self.direction = 'right'
         self.score = 0
         
         # Create score label
@@ -34,16 +40,23 @@ class SnakeGame:
         )
         self.canvas.pack()
 
-        # Initialize snake and food
-        self.snake_positions = []
-        self.food_position = []
-        self.snake_body = []
+        # Initialize snake and food; the engine plays the game on board
+        # cells, the deque holds the canvas square of each body cell in the
+        # same order
+        self.columns = self.GAME_WIDTH // self.SPACE_SIZE
+        self.rows = self.GAME_HEIGHT // self.SPACE_SIZE
+        self.engine = None
+        self.body = None
+        self.autopilot = None
+        self.snake_body = deque()
+        self.food_item = None
         
         # Bind arrow keys
         self.master.bind('<Left>', lambda event: self.change_direction('left'))
         self.master.bind('<Right>', lambda event: self.change_direction('right'))
         self.master.bind('<Up>', lambda event: self.change_direction('up'))
         self.master.bind('<Down>', lambda event: self.change_direction('down'))
+        self.master.bind('a', lambda event: self.toggle_autopilot())
 
         # Center the window
         self.center_window()
@@ -60,10 +73,10 @@ class SnakeGame:
 
     def start_game(self):
         # Create snake
-        for i in range(self.BODY_PARTS):
-            x = self.SPACE_SIZE * (self.BODY_PARTS - i)
-            y = self.SPACE_SIZE
-            self.snake_positions.append([x, y])
+        self.engine = SnakeEngine(self.columns, self.rows, self.BODY_PARTS)
+        self.body = self.engine.body
+        for cell in self.body.cells:
+            x, y = self.cell_position(cell)
             square = self.canvas.create_rectangle(
                 x, y,
                 x + self.SPACE_SIZE, y + self.SPACE_SIZE,
@@ -72,99 +85,96 @@ class SnakeGame:
             self.snake_body.append(square)
 
         # Create food
-        self.spawn_food()
+        self.show_food()
         
         # Start game loop
         self.next_turn()
 
-    def spawn_food(self):
-        if self.food_position:
-            self.canvas.delete("food")
+    def cell_position(self, cell):
+        # Canvas coordinates of a board cell's top left corner
+        col, row = self.body.coords(cell)
+        return col * self.SPACE_SIZE, row * self.SPACE_SIZE
 
-        x = random.randint(0, (self.GAME_WIDTH // self.SPACE_SIZE) - 1) * self.SPACE_SIZE
-        y = random.randint(0, (self.GAME_HEIGHT // self.SPACE_SIZE) - 1) * self.SPACE_SIZE
-        self.food_position = [x, y]
-        
-        self.canvas.create_oval(
+    def show_food(self):
+        # The engine picks the food cell from the body's free-cell index
+        x, y = self.cell_position(self.engine.food)
+
+        # One oval for the whole game, moved rather than recreated
+        if self.food_item is not None:
+            self.canvas.coords(self.food_item, x, y, x + self.SPACE_SIZE, y + self.SPACE_SIZE)
+            return
+        self.food_item = self.canvas.create_oval(
             x, y,
             x + self.SPACE_SIZE, y + self.SPACE_SIZE,
             fill=self.FOOD_COLOR, tag="food"
         )
 
     def next_turn(self):
-        # Get current head position
-        head_x, head_y = self.snake_positions[0]
-
-        # Update position based on direction
-        if self.direction == "left":
-            head_x -= self.SPACE_SIZE
-        elif self.direction == "right":
-            head_x += self.SPACE_SIZE
-        elif self.direction == "up":
-            head_y -= self.SPACE_SIZE
-        elif self.direction == "down":
-            head_y += self.SPACE_SIZE
-
-        # Insert new head position
-        self.snake_positions.insert(0, [head_x, head_y])
-        
-        # Create new square for head
-        square = self.canvas.create_rectangle(
-            head_x, head_y,
-            head_x + self.SPACE_SIZE, head_y + self.SPACE_SIZE,
-            fill=self.SNAKE_COLOR
-        )
-        self.snake_body.insert(0, square)
+        # Stop the loop once the window hosting the game is closed
+        if not self.canvas.winfo_exists():
+            return
 
-        # Check if food is eaten
-        if head_x == self.food_position[0] and head_y == self.food_position[1]:
-            self.score += 1
-            self.label.config(text=f"Score: {self.score}")
-            self.spawn_food()
-        else:
-            # Remove tail
-            del self.snake_positions[-1]
-            self.canvas.delete(self.snake_body[-1])
-            del self.snake_body[-1]
+        # The autopilot steers like a key press before the tick
+        if self.autopilot is not None:
+            self.engine.change_direction(self.autopilot.choose())
 
-        # Check for collision
-        if self.check_collisions():
+        # Play the tick; the engine checks collisions and spawns the food
+        ate = self.engine.step()
+        if self.engine.over and not self.engine.won:
             self.game_over()
-        else:
-            self.master.after(self.SPEED, self.next_turn)
-
-    def check_collisions(self):
-        head_x, head_y = self.snake_positions[0]
+            return
+        head_x, head_y = self.cell_position(self.body.head())
 
-        # Check wall collision
-        if head_x < 0 or head_x >= self.GAME_WIDTH:
-            return True
-        if head_y < 0 or head_y >= self.GAME_HEIGHT:
-            return True
-
-        # Check self collision
-        if [head_x, head_y] in self.snake_positions[1:]:
-            return True
-
-        return False
+        # The tail square moves to the head, only growing creates one
+        if ate:
+            square = self.canvas.create_rectangle(
+                head_x, head_y,
+                head_x + self.SPACE_SIZE, head_y + self.SPACE_SIZE,
+                fill=self.SNAKE_COLOR, tag="snake"
+            )
+        else:
+            square = self.snake_body.pop()
+            self.canvas.coords(square, head_x, head_y, head_x + self.SPACE_SIZE, head_y + self.SPACE_SIZE)
+        self.snake_body.appendleft(square)
+
+        # Check if food is eaten, a snake covering the whole board wins
+        if ate:
+            self.score = self.engine.score
+            self.update_label()
+            if self.engine.won:
+                self.game_over(won=True)
+                return
+            self.show_food()
+
+        self.master.after(self.SPEED, self.next_turn)
+
+    def update_label(self):
+        mode = " [autopilot]" if self.autopilot is not None else ""
+        self.label.config(text=f"Score: {self.score}{mode}")
+
+    def toggle_autopilot(self):
+        # 'a' hands the snake to the autopilot and back
+        if self.autopilot is None:
+            self.autopilot = Autopilot(self.engine)
+        else:
+            self.autopilot = None
+        self.update_label()
 
-    def game_over(self):
+    def game_over(self, won=False):
         self.canvas.delete(tk.ALL)
+        self.snake_body.clear()
+        self.food_item = None
         self.canvas.create_text(
             self.canvas.winfo_width()/2,
             self.canvas.winfo_height()/2,
             font=('consolas', 70),
-            text=f"GAME OVER\nScore: {self.score}",
-            fill="red",
+            text=f"{'YOU WIN' if won else 'GAME OVER'}\nScore: {self.score}",
+            fill="#00FF00" if won else "red",
             justify=tk.CENTER
         )
 
     def change_direction(self, new_direction):
-        if (new_direction == 'left' and self.direction != 'right' or
-            new_direction == 'right' and self.direction != 'left' or
-            new_direction == 'up' and self.direction != 'down' or
-            new_direction == 'down' and self.direction != 'up'):
-            self.direction = new_direction
+        self.engine.change_direction(new_direction)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,5 @@
+# Launcher metadata, read by registry.py without importing the package
+GAME_TITLE = "Sudoku"
+GAME_MODULE = "sudoku"
+GAME_CLASS = "SudokuGame"
+GAME_THUMBNAIL = "thumbnail.png"
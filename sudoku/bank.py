@@ -0,0 +1,192 @@
+import argparse
+import mmap
+import os
+import random
+import shutil
+import struct
+import tempfile
+import zlib
+
+try:
+    from .solver import format_grid, parse, solve
+except ImportError:
+    from solver import format_grid, parse, solve
+
+# Binary puzzle bank: a fixed header followed by fixed-size records.
+#
+# Header: magic, version, record size, record count, then one
+# (first record, record count) pair per difficulty. Records are sorted
+# by difficulty, so that pair is the whole index.
+#
+# Record: the 81 givens packed two cells per byte (high nibble first),
+# a difficulty byte and the CRC-32 of the solution.
+
+MAGIC = b'SDKB'
+VERSION = 1
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+
+HEADER = struct.Struct('<4sHHI' + 'II' * len(DIFFICULTIES))
+RECORD = struct.Struct('<41sBI')
+
+def pack_grid(grid):
+    packed = bytearray(41)
+    for i, digit in enumerate(grid):
+        packed[i >> 1] |= digit << 4 if i & 1 == 0 else digit
+    return bytes(packed)
+
+def unpack_grid(packed):
+    grid = []
+    for byte in packed:
+        grid.append(byte >> 4)
+        grid.append(byte & 0x0F)
+    return grid[:81]
+
+def solution_hash(solution):
+    return zlib.crc32(bytes(solution))
+
+def write_bank(path, entries):
+    # entries yields (grid, difficulty, solution or None). Records are
+    # bucketed into temporary files by difficulty, so memory stays flat
+    # however many puzzles are written
+    buckets = [tempfile.TemporaryFile() for _ in DIFFICULTIES]
+    counts = [0] * len(DIFFICULTIES)
+    try:
+        for grid, difficulty, solution in entries:
+            if solution is None:
+                solution = solve(grid)
+                if solution is None:
+                    continue
+            difficulty = min(max(difficulty, 0), len(DIFFICULTIES) - 1)
+            buckets[difficulty].write(RECORD.pack(pack_grid(grid), difficulty, solution_hash(solution)))
+            counts[difficulty] += 1
+
+        index = []
+        first = 0
+        for count in counts:
+            index += [first, count]
+            first += count
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, VERSION, RECORD.size, first, *index))
+            for bucket in buckets:
+                bucket.seek(0)
+                shutil.copyfileobj(bucket, out)
+        os.replace(temp_path, path)
+        return first
+    finally:
+        for bucket in buckets:
+            bucket.close()
+
+class PuzzleBank:
+    # Read-only view of a bank file through mmap: drawing a puzzle touches
+    # one record, never the whole file
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            fields = HEADER.unpack_from(self.map, 0)
+        except struct.error:
+            self.map.close()
+            raise ValueError(f"{path} is not a puzzle bank")
+        magic, version, record_size, self.count = fields[:4]
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.map.close()
+            raise ValueError(f"{path} is not a version {VERSION} puzzle bank")
+        if len(self.map) < HEADER.size + self.count * RECORD.size:
+            self.map.close()
+            raise ValueError(f"{path} is truncated")
+        self.ranges = [(fields[4 + 2 * d], fields[5 + 2 * d]) for d in range(len(DIFFICULTIES))]
+
+    def __len__(self):
+        return self.count
+
+    def record(self, n):
+        # (grid, difficulty, solution hash) of the n-th record
+        packed, difficulty, checksum = RECORD.unpack_from(self.map, HEADER.size + n * RECORD.size)
+        return unpack_grid(packed), difficulty, checksum
+
+    def draw(self, difficulty=None, rng=random):
+        # Random record, optionally restricted to one difficulty
+        if difficulty is not None:
+            first, count = self.ranges[difficulty]
+            if count:
+                return self.record(first + rng.randrange(count))
+        if not self.count:
+            raise IndexError("the puzzle bank is empty")
+        return self.record(rng.randrange(self.count))
+
+    def __iter__(self):
+        for n in range(self.count):
+            yield self.record(n)
+
+    def close(self):
+        self.map.close()
+
+def read_text(path):
+    # Yield (grid, difficulty) from the one-line-per-puzzle text format,
+    # with an optional difficulty after the 81 cells
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith('#'):
+                continue
+            grid = parse(fields[0])
+            if len(fields) > 1 and fields[1].isdigit():
+                difficulty = int(fields[1])
+            else:
+                difficulty = rate_grid(grid)
+            yield grid, difficulty
+
+def rate_grid(grid):
+    # The rating lives with the generator, only needed for unrated input
+    try:
+        from .generator import rate
+    except ImportError:
+        from generator import rate
+    return rate(grid)
+
+def import_text(text_path, bank_path):
+    return write_bank(bank_path, ((grid, d, None) for grid, d in read_text(text_path)))
+
+def export_text(bank_path, text_path, with_difficulty=False):
+    bank = PuzzleBank(bank_path)
+    try:
+        with open(text_path, 'w') as out:
+            for grid, difficulty, checksum in bank:
+                suffix = f" {difficulty}" if with_difficulty else ""
+                out.write(f"{format_grid(grid)}{suffix}\n")
+        return len(bank)
+    finally:
+        bank.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert and inspect Sudoku puzzle banks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    to_bank = commands.add_parser('import', help="text file -> binary bank")
+    to_bank.add_argument('text')
+    to_bank.add_argument('bank')
+
+    to_text = commands.add_parser('export', help="binary bank -> text file")
+    to_text.add_argument('bank')
+    to_text.add_argument('text')
+    to_text.add_argument('--with-difficulty', action='store_true')
+
+    info = commands.add_parser('info', help="record counts per difficulty")
+    info.add_argument('bank')
+
+    args = parser.parse_args()
+    if args.command == 'import':
+        print(f"{import_text(args.text, args.bank):,} puzzles written to {args.bank}")
+    elif args.command == 'export':
+        print(f"{export_text(args.bank, args.text, args.with_difficulty):,} puzzles written to {args.text}")
+    else:
+        bank = PuzzleBank(args.bank)
+        print(f"{len(bank):,} puzzles, {os.path.getsize(args.bank):,} bytes")
+        for name, (first, count) in zip(DIFFICULTIES, bank.ranges):
+            print(f"  {name:<8}{count:>12,}")
+        bank.close()
+
+if __name__ == "__main__":
+    main()
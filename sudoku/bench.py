@@ -0,0 +1,33 @@
+import time
+
+try:
+    from .solver import Solver, parse
+except ImportError:
+    from solver import Solver, parse
+
+# 17-clue and other well-known hard puzzles
+PUZZLES = [
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+    "000000012000035000000600070700000300000400800100000000000120000080000040050000600",
+    "000000012003600000000007000410020000000500300700000600280000040000300500000000000",
+    "000000012000000003002300400001800005060070800000009000008500000900040500470006000",
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+]
+
+def bench_solver(repeat=5):
+    print(f"{'puzzle':<8}{'clues':>6}{'best':>12}{'guesses':>10}")
+    for n, text in enumerate(PUZZLES, 1):
+        grid = parse(text)
+        best = None
+        for _ in range(repeat):
+            solver = Solver(grid)
+            start = time.perf_counter()
+            solved = solver.solve()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        assert solved
+        clues = sum(1 for digit in grid if digit)
+        print(f"{n:<8}{clues:>6}{best * 1000:>9.2f} ms{solver.guesses:>10}")
+
+if __name__ == "__main__":
+    bench_solver()
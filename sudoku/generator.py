@@ -0,0 +1,159 @@
+import argparse
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .bank import PuzzleBank, write_bank
+    from .solver import Solver, count_solutions, format_grid
+except ImportError:
+    from bank import PuzzleBank, write_bank
+    from solver import Solver, count_solutions, format_grid
+
+# Puzzle bank shipped next to the game
+BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'puzzles.bank')
+
+def random_solution(rng):
+    # Fill the three diagonal boxes at random (they never constrain each
+    # other), let the solver complete the grid, then shuffle its symmetries
+    grid = [0] * 81
+    for box in range(3):
+        digits = rng.sample(range(1, 10), 9)
+        for k, digit in enumerate(digits):
+            grid[(box * 3 + k // 3) * 9 + box * 3 + k % 3] = digit
+    solver = Solver(grid)
+    solver.solve()
+    grid = solver.grid
+
+    # Relabel digits, permute bands, stacks and the rows/columns inside them
+    labels = [0] + rng.sample(range(1, 10), 9)
+    rows = [band * 3 + r for band in rng.sample(range(3), 3) for r in rng.sample(range(3), 3)]
+    cols = [stack * 3 + c for stack in rng.sample(range(3), 3) for c in rng.sample(range(3), 3)]
+    shuffled = [labels[grid[r * 9 + c]] for r in rows for c in cols]
+    if rng.random() < 0.5:
+        shuffled = [shuffled[c * 9 + r] for r in range(9) for c in range(9)]
+    return shuffled
+
+def rate(grid):
+    # Difficulty from how much guessing the solver needs: 0 easy .. 3 expert
+    solver = Solver(grid)
+    solver.solve()
+    if solver.guesses == 0:
+        return 0
+    if solver.guesses <= 5:
+        return 1
+    if solver.guesses <= 30:
+        return 2
+    return 3
+
+def make_puzzle(rng, min_clues=17):
+    # Remove clues in symmetric pairs as long as the solution stays unique
+    solution = random_solution(rng)
+    grid = list(solution)
+    clues = 81
+    for i in rng.sample(range(41), 41):
+        if clues <= min_clues:
+            break
+        pair = {i, 80 - i}
+        saved = [(j, grid[j]) for j in pair]
+        for j in pair:
+            grid[j] = 0
+        if count_solutions(grid, 2) == 1:
+            clues -= len(pair)
+        else:
+            for j, digit in saved:
+                grid[j] = digit
+    return grid, solution
+
+def make_batch(seed, count, min_clues_range):
+    # Process pool task: a batch of (puzzle, difficulty, solution) from one seed
+    rng = random.Random(seed)
+    batch = []
+    for _ in range(count):
+        puzzle, solution = make_puzzle(rng, rng.randint(*min_clues_range))
+        batch.append((puzzle, rate(puzzle), solution))
+    return batch
+
+def generate_entries(count, workers=None, seed=None, batch_size=50, min_clues_range=(17, 36)):
+    # Yield count (puzzle, difficulty, solution) generated across a process
+    # pool, keeping only a couple of batches per worker in flight
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    workers = workers or os.cpu_count() or 1
+    batches = (count + batch_size - 1) // batch_size
+    produced = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = deque()
+        for n in range(batches):
+            futures.append(pool.submit(make_batch, seed * 1000003 + n, batch_size, min_clues_range))
+            if len(futures) < 2 * workers and n < batches - 1:
+                continue
+            while futures and (len(futures) >= 2 * workers or n == batches - 1):
+                for entry in futures.popleft().result():
+                    if produced == count:
+                        break
+                    yield entry
+                    produced += 1
+                print(f"\r{produced:,} / {count:,} puzzles", end='', flush=True)
+    elapsed = time.perf_counter() - start
+    print(f"\n{produced:,} puzzles in {elapsed:.1f} s ({produced / elapsed:.0f}/s)")
+
+def build_bank(path, count, workers=None, seed=None, text=False):
+    # Generate a bank, as a binary bank file or in the one-line text format
+    entries = generate_entries(count, workers=workers, seed=seed)
+    if not text:
+        return write_bank(path, entries)
+    written = 0
+    with open(path, 'w') as out:
+        for puzzle, difficulty, solution in entries:
+            out.write(f"{format_grid(puzzle)} {difficulty}\n")
+            written += 1
+    return written
+
+class PuzzleSource:
+    # Puzzles for the GUI: drawn from the bank file when there is one,
+    # otherwise generated on a background thread that keeps a few ready
+    def __init__(self, path=BANK_PATH, reserve=3):
+        try:
+            self.bank = PuzzleBank(path)
+        except (OSError, ValueError):
+            self.bank = None
+        self.ready = queue.Queue(maxsize=reserve)
+        if self.bank is None or not len(self.bank):
+            self.bank = None
+            threading.Thread(target=self.fill, daemon=True).start()
+
+    def fill(self):
+        rng = random.Random()
+        while True:
+            puzzle, solution = make_puzzle(rng, rng.randint(22, 32))
+            self.ready.put(puzzle)
+
+    def draw(self, difficulty=None):
+        # A puzzle grid, or None while the generator has none ready yet
+        if self.bank is not None:
+            grid, difficulty, checksum = self.bank.draw(difficulty)
+            return grid
+        try:
+            return self.ready.get_nowait()
+        except queue.Empty:
+            return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a bank of unique-solution Sudoku puzzles")
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--out', default=BANK_PATH)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--text', action='store_true',
+                        help="write the one-line-per-puzzle text format instead of a binary bank")
+    args = parser.parse_args()
+    build_bank(args.out, args.count, workers=args.workers, seed=args.seed, text=args.text)
+
+if __name__ == "__main__":
+    main()
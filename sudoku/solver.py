@@ -0,0 +1,196 @@
+# Constraint solver for 9x9 Sudoku working on a flat list of 81 ints
+# (0 for an empty cell). Digits used in each row, column and box are kept
+# as bitmasks, so candidates for a cell are a single OR and mask.
+
+ALL_DIGITS = 0x3FE  # bits 1..9
+
+ROW_OF = [i // 9 for i in range(81)]
+COL_OF = [i % 9 for i in range(81)]
+BOX_OF = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+
+# Candidate mask -> number of candidates, and single-bit mask -> digit
+POPCOUNT = [bin(mask).count('1') for mask in range(1024)]
+DIGIT_OF = {1 << d: d for d in range(1, 10)}
+
+class Solver:
+    def __init__(self, grid):
+        self.grid = list(grid)
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.valid = True
+
+        # Search statistics
+        self.guesses = 0
+        self.backtracks = 0
+
+        for i, digit in enumerate(self.grid):
+            if not digit:
+                continue
+            bit = 1 << digit
+            r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+            if (self.rows[r] | self.cols[c] | self.boxes[b]) & bit:
+                self.valid = False
+            self.rows[r] |= bit
+            self.cols[c] |= bit
+            self.boxes[b] |= bit
+
+        self.empties = [i for i in range(81) if not self.grid[i]]
+
+    def place(self, i, digit):
+        bit = 1 << digit
+        self.grid[i] = digit
+        self.rows[ROW_OF[i]] |= bit
+        self.cols[COL_OF[i]] |= bit
+        self.boxes[BOX_OF[i]] |= bit
+
+    def clear(self, i):
+        bit = ~(1 << self.grid[i])
+        self.grid[i] = 0
+        self.rows[ROW_OF[i]] &= bit
+        self.cols[COL_OF[i]] &= bit
+        self.boxes[BOX_OF[i]] &= bit
+
+    def candidates(self, i):
+        return ALL_DIGITS & ~(self.rows[ROW_OF[i]] | self.cols[COL_OF[i]] | self.boxes[BOX_OF[i]])
+
+    def propagate(self, trail):
+        # Fill naked singles until none are left, then return the empty cell
+        # with the fewest candidates: (-1, 0) when solved, None on contradiction
+        grid = self.grid
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        while True:
+            best = -1
+            best_count = 10
+            best_mask = 0
+            progress = False
+            for i in self.empties:
+                if grid[i]:
+                    continue
+                mask = ALL_DIGITS & ~(rows[ROW_OF[i]] | cols[COL_OF[i]] | boxes[BOX_OF[i]])
+                count = POPCOUNT[mask]
+                if count == 0:
+                    return None
+                if count == 1:
+                    self.place(i, DIGIT_OF[mask])
+                    trail.append(i)
+                    progress = True
+                elif count < best_count:
+                    best, best_count, best_mask = i, count, mask
+            if not progress:
+                return best, best_mask
+
+    def undo(self, trail):
+        for i in reversed(trail):
+            self.clear(i)
+
+    def search(self):
+        trail = []
+        found = self.propagate(trail)
+        if found is None:
+            self.undo(trail)
+            self.backtracks += 1
+            return False
+
+        cell, mask = found
+        if cell == -1:
+            return True
+
+        # Minimum remaining values: branch on the most constrained cell
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            self.guesses += 1
+            self.place(cell, DIGIT_OF[bit])
+            if self.search():
+                return True
+            self.clear(cell)
+
+        self.undo(trail)
+        self.backtracks += 1
+        return False
+
+    def solve(self):
+        # Solve in place, True if self.grid now holds a solution
+        return self.valid and self.search()
+
+    def count(self, limit):
+        # Number of solutions, stopping once limit have been found;
+        # leaves the grid as it was
+        trail = []
+        found = self.propagate(trail)
+        if found is None:
+            self.undo(trail)
+            return 0
+
+        cell, mask = found
+        total = 0
+        if cell == -1:
+            total = 1
+        while mask and total < limit:
+            bit = mask & -mask
+            mask ^= bit
+            self.place(cell, DIGIT_OF[bit])
+            total += self.count(limit - total)
+            self.clear(cell)
+
+        self.undo(trail)
+        return total
+
+class SolveCancelled(Exception):
+    pass
+
+class RecordingSolver(Solver):
+    # Solver that appends every placement to a compact step log, one
+    # cell * 10 + digit entry per step (digit 0 clears the cell), and
+    # stops early once cancel is set
+    def __init__(self, grid, log, cancel=None):
+        super().__init__(grid)
+        self.log = log
+        self.cancel = cancel
+        self.cancelled = False
+
+    def place(self, i, digit):
+        super().place(i, digit)
+        self.log.append(i * 10 + digit)
+
+    def clear(self, i):
+        super().clear(i)
+        self.log.append(i * 10)
+
+    def search(self):
+        if self.cancel is not None and self.cancel.is_set():
+            raise SolveCancelled()
+        return super().search()
+
+    def solve(self):
+        try:
+            return super().solve()
+        except SolveCancelled:
+            self.cancelled = True
+            return False
+
+def solve(grid):
+    # Return the solved grid as a new list of 81 ints, or None
+    solver = Solver(grid)
+    if solver.solve():
+        return solver.grid
+    return None
+
+def count_solutions(grid, limit=2):
+    # 0, 1 or (at most) limit: enough to tell whether a puzzle is unique
+    solver = Solver(grid)
+    if not solver.valid:
+        return 0
+    return solver.count(limit)
+
+def parse(text):
+    # Read a puzzle from the one-line format, '0' or '.' for empty cells
+    digits = [0 if ch in '.0' else int(ch) for ch in text.strip() if ch in '.0123456789']
+    if len(digits) != 81:
+        raise ValueError("a puzzle needs exactly 81 cells")
+    return digits
+
+def format_grid(grid):
+    # Write a puzzle in the one-line format
+    return ''.join(str(digit) for digit in grid)
@@ -1,6 +1,25 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
+from array import array
+import threading
+
+try:
+    from .bank import DIFFICULTIES
+    from .generator import PuzzleSource
+    from .solver import RecordingSolver
+except ImportError:
+    from bank import DIFFICULTIES
+    from generator import PuzzleSource
+    from solver import RecordingSolver
+
+# Delay between replay frames in milliseconds
+REPLAY_FRAME_MS = 16
+
+# Choices for how many solver steps are replayed per frame
+REPLAY_SPEEDS = (1, 5, 25, 100, 500, 2500, 10000)
+
+# How often to check for a generated puzzle when there is no bank
+PUZZLE_POLL_MS = 50
 
 class SudokuGame:
     def __init__(self, master):
@@ -10,6 +29,21 @@ class SudokuGame:
         self.selected = None
         self.original_numbers = set()  # Track initial numbers that shouldn't be modified
         self.solving_in_progress = False
+
+        # Background solve: worker thread, its step log and the replay position
+        self.solve_thread = None
+        self.solve_log = None
+        self.solve_cancel = None
+        self.solve_result = None
+        self.replay_pos = 0
+        self.replay_id = None
+        self.skip_replay = False
+        self.replay_speed = tk.StringVar(value="25")
+
+        # Unique-solution puzzles, prepared ahead of time
+        self.puzzles = PuzzleSource()
+        self.difficulty = tk.StringVar(value="Any")
+        self.puzzle_poll_id = None
         
         # Create the game board
         self.create_board()
@@ -71,6 +105,13 @@ class SudokuGame:
     def create_controls(self):
         control_frame = tk.Frame(self.master)
         control_frame.pack(pady=10)
+
+        tk.OptionMenu(
+            control_frame,
+            self.difficulty,
+            "Any",
+            *[name.capitalize() for name in DIFFICULTIES]
+        ).pack(side=tk.LEFT, padx=5)
         
         tk.Button(
             control_frame,
@@ -90,6 +131,37 @@ class SudokuGame:
             command=self.check_solution
         ).pack(side=tk.LEFT, padx=5)
 
+        # Replay controls for a running solve
+        replay_frame = tk.Frame(self.master)
+        replay_frame.pack(pady=(0, 10))
+
+        tk.Label(replay_frame, text="Steps/frame:").pack(side=tk.LEFT)
+        tk.Spinbox(
+            replay_frame,
+            values=REPLAY_SPEEDS,
+            textvariable=self.replay_speed,
+            width=6
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.skip_button = tk.Button(
+            replay_frame,
+            text="Skip to End",
+            command=self.skip_to_end,
+            state=tk.DISABLED
+        )
+        self.skip_button.pack(side=tk.LEFT, padx=5)
+
+        self.cancel_button = tk.Button(
+            replay_frame,
+            text="Cancel",
+            command=self.cancel_solve,
+            state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
+        self.solve_status = tk.Label(self.master, text="", font=('Arial', 10))
+        self.solve_status.pack(pady=(0, 5))
+
     def cell_clicked(self, i, j):
         if self.solving_in_progress:
             return
@@ -122,7 +194,10 @@ class SudokuGame:
                 self.cells[(i, j)]['label'].configure(text='')
 
     def new_game(self):
-        self.solving_in_progress = False
+        self.cancel_solve()
+        if self.puzzle_poll_id is not None:
+            self.master.after_cancel(self.puzzle_poll_id)
+            self.puzzle_poll_id = None
         # Clear the board
         self.original_numbers.clear()
         for i in range(9):
@@ -135,38 +210,26 @@ class SudokuGame:
         self.generate_puzzle()
 
     def generate_puzzle(self):
-        # Start with a solved board
-        base = 3
-        side = base * base
-
-        # Pattern for a baseline valid solution
-        def pattern(r, c):
-            return (base * (r % base) + r // base + c) % side
-
-        # Randomize rows, columns and numbers (of valid base pattern)
-        def shuffle(s): 
-            return random.sample(s, len(s))
-
-        rBase = range(base)
-        rows  = [g * base + r for g in shuffle(rBase) for r in shuffle(rBase)]
-        cols  = [g * base + c for g in shuffle(rBase) for c in shuffle(rBase)]
-        nums  = shuffle(range(1, base * base + 1))
-
-        # Produce board using randomized baseline pattern
-        board = [[nums[pattern(r, c)] for c in cols] for r in rows]
-
-        # Remove some numbers to create the puzzle
-        squares = side * side
-        empties = squares * 3//4
-        for p in random.sample(range(squares), empties):
-            board[p // side][p % side] = 0
+        # Draw a prepared unique-solution puzzle instead of building one
+        # here, polling until the generator has one ready
+        self.puzzle_poll_id = None
+        if not self.game_frame.winfo_exists():
+            return
+        difficulty = self.difficulty.get().lower()
+        grid = self.puzzles.draw(DIFFICULTIES.index(difficulty) if difficulty in DIFFICULTIES else None)
+        if grid is None:
+            self.solve_status.configure(text="Generating a puzzle...")
+            self.puzzle_poll_id = self.master.after(PUZZLE_POLL_MS, self.generate_puzzle)
+            return
+        self.solve_status.configure(text="")
 
         # Fill the board
         for i in range(9):
             for j in range(9):
-                if board[i][j] != 0:
-                    self.cells[(i, j)]['value'] = board[i][j]
-                    self.cells[(i, j)]['label'].configure(text=str(board[i][j]))
+                value = grid[i * 9 + j]
+                if value != 0:
+                    self.cells[(i, j)]['value'] = value
+                    self.cells[(i, j)]['label'].configure(text=str(value))
                     self.original_numbers.add((i, j))
 
     def is_valid(self, num, pos):
@@ -191,37 +254,124 @@ class SudokuGame:
         return True
 
     def start_solve(self):
+        if self.solving_in_progress or self.puzzle_poll_id is not None:
+            return
         self.solving_in_progress = True
-        # Clear user-filled cells before starting the recursive solve
+
+        # Clear user-filled cells before solving from the given numbers
         for i in range(9):
             for j in range(9):
                 if (i, j) not in self.original_numbers:
                     self.cells[(i, j)]['value'] = 0
                     self.cells[(i, j)]['label'].configure(text='')
-        # Start the recursive solving process
-        self.solve_game()
-        self.solving_in_progress = False
+        grid = [self.cells[(i, j)]['value'] for i in range(9) for j in range(9)]
 
-    def solve_game(self):
-        find = self.find_empty()
-        if not find:
-            return True
-        
-        row, col = find
-        for num in range(1, 10):
-            if self.is_valid(num, (row, col)):
-                self.cells[(row, col)]['value'] = num
-                self.cells[(row, col)]['label'].configure(text=str(num))
-                self.master.update()
-                
-                if self.solve_game():
-                    return True
-                
-                self.cells[(row, col)]['value'] = 0
-                self.cells[(row, col)]['label'].configure(text='')
-                self.master.update()
-        
-        return False
+        # The worker only appends to the log, the Tk thread replays it
+        self.solve_log = array('H')
+        self.solve_cancel = threading.Event()
+        self.solve_result = None
+        self.replay_pos = 0
+        self.skip_replay = False
+        self.solve_thread = threading.Thread(
+            target=self.solve_game,
+            args=(grid, self.solve_log, self.solve_cancel),
+            daemon=True
+        )
+        self.solve_thread.start()
+
+        self.skip_button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.NORMAL)
+        self.replay_id = self.master.after(REPLAY_FRAME_MS, self.replay_solve)
+
+    def solve_game(self, grid, log, cancel):
+        # Runs on the worker thread, must not touch any widget
+        solver = RecordingSolver(grid, log, cancel)
+        solved = solver.solve()
+        # A cancelled solve may finish after the next one has started
+        if log is self.solve_log:
+            self.solve_result = (solved, solver.grid, solver.guesses)
+
+    def replay_solve(self):
+        # Apply the next batch of logged steps, one label update per cell
+        self.replay_id = None
+        if not self.game_frame.winfo_exists():
+            self.solve_cancel.set()
+            return
+        result = self.solve_result
+        end = len(self.solve_log)
+        if self.skip_replay:
+            if result is None:
+                self.solve_status.configure(text=f"Solving... {end:,} steps")
+                self.replay_id = self.master.after(REPLAY_FRAME_MS, self.replay_solve)
+                return
+            # finish_solve redraws the board, the rest of the log is not needed
+            self.replay_pos = end
+            self.finish_solve(result)
+            return
+        else:
+            try:
+                speed = max(1, int(self.replay_speed.get()))
+            except ValueError:
+                speed = 1
+            end = min(end, self.replay_pos + speed)
+
+        changed = {}
+        for step in self.solve_log[self.replay_pos:end]:
+            changed[step // 10] = step % 10
+        self.replay_pos = end
+        for cell, digit in changed.items():
+            self.cells[divmod(cell, 9)]['label'].configure(text=str(digit) if digit else '')
+
+        if result is not None and self.replay_pos == len(self.solve_log):
+            self.finish_solve(result)
+            return
+        self.solve_status.configure(text=f"Step {self.replay_pos:,} of {len(self.solve_log):,}")
+        self.replay_id = self.master.after(REPLAY_FRAME_MS, self.replay_solve)
+
+    def finish_solve(self, result):
+        solved, grid, guesses = result
+        self.stop_replay()
+        if not solved:
+            # Clear whatever the replay had reached
+            for i in range(9):
+                for j in range(9):
+                    if (i, j) not in self.original_numbers:
+                        self.cells[(i, j)]['label'].configure(text='')
+            self.solve_status.configure(text="")
+            messagebox.showinfo("No Solution", "This puzzle has no solution!")
+            return
+
+        for i in range(9):
+            for j in range(9):
+                if (i, j) not in self.original_numbers:
+                    self.cells[(i, j)]['value'] = grid[i * 9 + j]
+                    self.cells[(i, j)]['label'].configure(text=str(grid[i * 9 + j]))
+        self.solve_status.configure(text=f"Solved in {len(self.solve_log):,} steps, {guesses:,} guesses")
+
+    def skip_to_end(self):
+        self.skip_replay = True
+
+    def cancel_solve(self):
+        if not self.solving_in_progress:
+            return
+        self.solve_cancel.set()
+        self.stop_replay()
+
+        # Put the board back to the given numbers
+        for i in range(9):
+            for j in range(9):
+                if (i, j) not in self.original_numbers:
+                    self.cells[(i, j)]['value'] = 0
+                    self.cells[(i, j)]['label'].configure(text='')
+        self.solve_status.configure(text="")
+
+    def stop_replay(self):
+        if self.replay_id is not None:
+            self.master.after_cancel(self.replay_id)
+            self.replay_id = None
+        self.solving_in_progress = False
+        self.skip_button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.DISABLED)
 
     def find_empty(self):
         for i in range(9):
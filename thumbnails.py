@@ -0,0 +1,141 @@
+import hashlib
+import io
+import os
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from registry import cache_dir
+
+# Size every preview is scaled down to fit
+THUMBNAIL_SIZE = (200, 125)
+
+class ThumbnailLoader:
+    def __init__(self, root, size=THUMBNAIL_SIZE, workers=4, memory_items=128,
+                 poll_ms=30, per_poll=8):
+        self.root = root
+        self.size = size
+        self.memory_items = memory_items
+        self.poll_ms = poll_ms
+        self.per_poll = per_poll
+
+        # Decoding and resizing happen on these threads, never on Tk's
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='thumbnail')
+        self.results = queue.SimpleQueue()
+
+        # Ready PhotoImages, least recently used first
+        self.memory = OrderedDict()
+
+        # Callbacks waiting for a thumbnail that is still being decoded
+        self.pending = {}
+        self.poll_id = None
+
+        # Resized images on disk; None keeps only the in-memory LRU
+        self.disk_dir = None
+        directory = cache_dir()
+        if directory is not None:
+            disk_dir = os.path.join(directory, 'thumbnails')
+            try:
+                os.makedirs(disk_dir, exist_ok=True)
+                self.disk_dir = disk_dir
+            except OSError:
+                pass
+
+    def request(self, path, callback):
+        # callback(photo) runs on the Tk thread once the thumbnail is ready
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            return
+
+        photo = self.memory.get(key)
+        if photo is not None:
+            self.memory.move_to_end(key)
+            callback(photo)
+            return
+
+        if key in self.pending:
+            self.pending[key].append(callback)
+            return
+        self.pending[key] = [callback]
+        self.executor.submit(self.load, key, path)
+        if self.poll_id is None:
+            self.poll_id = self.root.after(self.poll_ms, self.poll)
+
+    def load(self, key, path):
+        # Worker thread: never touches Tk
+        try:
+            image = self.decode(path)
+        except Exception:
+            image = None
+        self.results.put((key, image))
+
+    def decode(self, path):
+        from PIL import Image
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        # Cache files are named after the source bytes and the target size
+        cached_path = None
+        if self.disk_dir is not None:
+            digest = hashlib.sha1(data)
+            digest.update(f"{self.size[0]}x{self.size[1]}".encode())
+            cached_path = os.path.join(self.disk_dir, digest.hexdigest() + '.png')
+            try:
+                with Image.open(cached_path) as cached:
+                    cached.load()
+                    return cached.copy()
+            except (OSError, ValueError):
+                pass
+
+        with Image.open(io.BytesIO(data)) as source:
+            # Let JPEG decode at reduced scale before the real resize
+            source.draft('RGB', self.size)
+            image = source.convert('RGBA')
+        image.thumbnail(self.size, Image.LANCZOS)
+
+        if cached_path is None:
+            return image
+
+        # Write under a temporary name so readers never see half a file
+        temp_path = f"{cached_path}.{os.getpid()}.tmp"
+        try:
+            image.save(temp_path, 'PNG')
+            os.replace(temp_path, cached_path)
+        except OSError:
+            pass
+        return image
+
+    def poll(self):
+        # Tk thread: turn a few decoded images into PhotoImages per tick
+        self.poll_id = None
+        for _ in range(self.per_poll):
+            try:
+                key, image = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            callbacks = self.pending.pop(key, [])
+            if image is None:
+                continue
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(image, master=self.root)
+            self.remember(key, photo)
+            for callback in callbacks:
+                callback(photo)
+
+        if self.pending:
+            self.poll_id = self.root.after(self.poll_ms, self.poll)
+
+    def remember(self, key, photo):
+        # Widgets showing an evicted image keep their own reference to it
+        self.memory[key] = photo
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def shutdown(self):
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+        self.executor.shutdown(wait=False, cancel_futures=True)